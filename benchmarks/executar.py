@@ -0,0 +1,278 @@
+"""
+Benchmarks de leitura e das operações de Sequencia, com saída em JSON.
+
+Para cada conjunto de dados (o arquivo de Flaviviridae do projeto e arquivos
+sintéticos gerados por benchmarks/gerar_dados.py), mede:
+
+- ler_fasta e iter_fasta (leitura do arquivo);
+- construção de OrganismoFasta a partir de strings já lidas;
+- complementar, complementar_reversa, transcrever (com a sequência resultante
+  montada por str()), traduzir e calcular_percentual em todos os registros.
+
+A coleção nunca é carregada inteira: as operações por registro são medidas numa
+passada de iter_fasta, com o tempo de cada operação em cada registro somado ao
+total da operação, então a memória depende do maior registro e não do arquivo.
+ler_fasta, que por definição guarda o arquivo todo, só é medido em arquivos de
+até --limite-ler-fasta.
+
+Cada passada é repetida `repeticoes` vezes para o tempo (mínimo e mediana) e
+feita mais uma vez sob tracemalloc para o pico de memória alocada. Os arquivos
+sintéticos ficam em benchmarks/dados/ e são reaproveitados entre execuções.
+
+Uso:
+    python benchmarks/executar.py --tamanhos 1MB 100MB --saida resultados.json
+    python benchmarks/executar.py --tamanhos 1MB 4GB --repeticoes 1 --saida nova.json \\
+        --comparar resultados.json --limite-ler-fasta 1GB
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from benchmarks.gerar_dados import converter_tamanho, gerar_fasta
+from bio.ler_fasta import iter_fasta, ler_fasta
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+
+ARQUIVO_FLAVIVIRIDAE = "arquivos/Flaviviridae-genomes.fasta"
+PASTA_DADOS = os.path.join(os.path.dirname(__file__), "dados")
+TOLERANCIA_REGRESSAO = 1.10
+LIMITE_LER_FASTA = "1GB"
+
+
+def medir(funcao, preparar=None, repeticoes: int = 3) -> dict:
+    """
+    Mede o tempo e o pico de memória de `funcao(preparar())`.
+
+    A preparação (por exemplo, criar objetos novos para não aproveitar caches)
+    não entra na medição.
+
+    Returns:
+        dict: segundos_min, segundos_mediana e pico_memoria_bytes.
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        argumento = preparar() if preparar else None
+        inicio = time.perf_counter()
+        funcao(argumento)
+        tempos.append(time.perf_counter() - inicio)
+
+    argumento = preparar() if preparar else None
+    tracemalloc.start()
+    funcao(argumento)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "segundos_min": min(tempos),
+        "segundos_mediana": statistics.median(tempos),
+        "pico_memoria_bytes": pico,
+    }
+
+
+def medir_conjunto(nome: str, caminho, repeticoes: int,
+                   limite_ler_fasta: int = converter_tamanho(LIMITE_LER_FASTA)) -> dict:
+    """
+    Executa todas as medições sobre um arquivo FASTA, lendo-o em streaming.
+
+    Args:
+        nome (str): Nome do conjunto no resultado.
+        caminho (str): Arquivo FASTA.
+        repeticoes (int): Quantas passadas cronometradas fazer.
+        limite_ler_fasta (int): Tamanho máximo, em bytes, para medir ler_fasta.
+    """
+    tamanho = os.path.getsize(caminho)
+    operacoes = {}
+    if tamanho <= limite_ler_fasta:
+        operacoes["ler_fasta"] = medir(lambda _: ler_fasta(caminho), repeticoes=repeticoes)
+    operacoes["iter_fasta"] = medir(lambda _: sum(1 for _ in iter_fasta(caminho)),
+                                    repeticoes=repeticoes)
+
+    registros, bases, por_registro = medir_por_registro(caminho, repeticoes)
+    operacoes.update(por_registro)
+    for medida in operacoes.values():
+        medida["bases_por_segundo"] = bases / medida["segundos_min"] if medida["segundos_min"] else None
+
+    return {
+        "nome": nome,
+        "arquivo": str(caminho),
+        "bytes": tamanho,
+        "registros": registros,
+        "bases": bases,
+        "operacoes": operacoes,
+    }
+
+
+def operacoes_por_registro() -> list[tuple]:
+    """
+    (nome, preparar, executar) de cada operação medida registro a registro.
+
+    preparar(organismo) monta o argumento de executar fora da medição (por exemplo,
+    uma Sequencia nova, para não aproveitar a composição já calculada); sem
+    preparar, executar recebe o próprio organismo.
+    """
+    return [
+        ("OrganismoFasta", lambda o: (o.id, o.nome, str(o.sequencia)),
+         lambda registro: OrganismoFasta(*registro)),
+        ("complementar", None, lambda o: str(o.sequencia.complementar())),
+        ("complementar_reversa", None, lambda o: str(o.sequencia.complementar_reversa())),
+        ("transcrever", None, lambda o: str(o.sequencia.transcrever())),
+        ("traduzir", None, lambda o: o.sequencia.traduzir()),
+        ("calcular_percentual", lambda o: Sequencia(str(o.sequencia)),
+         lambda sequencia: sequencia.calcular_percentual(["G", "C"])),
+    ]
+
+
+def medir_por_registro(caminho, repeticoes: int = 3) -> tuple[int, int, dict]:
+    """
+    Mede as operações de operacoes_por_registro em cada registro de iter_fasta.
+
+    Em cada passada, o tempo de cada operação em cada registro é somado ao total
+    da operação. Na passada sob tracemalloc, pico_memoria_bytes é o maior pico
+    de uma única chamada (acima da memória já alocada antes dela).
+
+    Returns:
+        tuple[int, int, dict]: Registros, bases e as medidas de cada operação.
+    """
+    operacoes = operacoes_por_registro()
+    tempos = {nome: [] for nome, _, _ in operacoes}
+    registros = bases = 0
+
+    for repeticao in range(repeticoes):
+        totais = dict.fromkeys(tempos, 0.0)
+        for organismo in iter_fasta(caminho):
+            if repeticao == 0:
+                registros += 1
+                bases += len(organismo.sequencia)
+            for nome, preparar, executar in operacoes:
+                argumento = preparar(organismo) if preparar else organismo
+                inicio = time.perf_counter()
+                executar(argumento)
+                totais[nome] += time.perf_counter() - inicio
+        for nome, total in totais.items():
+            tempos[nome].append(total)
+
+    picos = dict.fromkeys(tempos, 0)
+    tracemalloc.start()
+    for organismo in iter_fasta(caminho):
+        for nome, preparar, executar in operacoes:
+            argumento = preparar(organismo) if preparar else organismo
+            antes, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            executar(argumento)
+            _, pico = tracemalloc.get_traced_memory()
+            picos[nome] = max(picos[nome], pico - antes)
+    tracemalloc.stop()
+
+    medidas = {
+        nome: {
+            "segundos_min": min(tempos[nome], default=0.0),
+            "segundos_mediana": statistics.median(tempos[nome]) if tempos[nome] else 0.0,
+            "pico_memoria_bytes": picos[nome],
+        }
+        for nome in tempos
+    }
+    return registros, bases, medidas
+
+
+def preparar_sintetico(tamanho: str, semente: int) -> str:
+    """Gera (ou reaproveita) o arquivo sintético de um tamanho, como "10MB"."""
+    caminho = os.path.join(PASTA_DADOS, f"sintetico_{tamanho.upper()}_s{semente}.fasta")
+    if not os.path.exists(caminho):
+        os.makedirs(PASTA_DADOS, exist_ok=True)
+        gerar_fasta(caminho, converter_tamanho(tamanho), semente)
+    return caminho
+
+
+def comparar(atual: dict, anterior: dict, tolerancia: float = TOLERANCIA_REGRESSAO) -> list[str]:
+    """
+    Lista as operações que ficaram mais lentas que `tolerancia` vezes o resultado anterior.
+    """
+    anteriores = {conjunto["nome"]: conjunto["operacoes"] for conjunto in anterior["conjuntos"]}
+    regressoes = []
+    for conjunto in atual["conjuntos"]:
+        for operacao, medida in conjunto["operacoes"].items():
+            antes = anteriores.get(conjunto["nome"], {}).get(operacao)
+            if antes and medida["segundos_min"] > tolerancia * antes["segundos_min"]:
+                razao = medida["segundos_min"] / antes["segundos_min"]
+                regressoes.append(f"{conjunto['nome']} / {operacao}: {razao:.2f}x mais lento")
+    return regressoes
+
+
+def ambiente() -> dict:
+    """Versões e máquina em que os benchmarks rodaram."""
+    try:
+        import numpy
+        versao_numpy = numpy.__version__
+    except ImportError:
+        versao_numpy = None
+
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=os.path.dirname(__file__), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": versao_numpy,
+        "plataforma": platform.platform(),
+        "processadores": os.cpu_count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanhos", nargs="*", default=["1MB", "10MB"],
+                        help="Tamanhos dos arquivos sintéticos (ex.: 1MB 100MB 2GB)")
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--sem-flaviviridae", action="store_true",
+                        help="Não mede o arquivo de Flaviviridae do projeto")
+    parser.add_argument("--saida", help="Arquivo JSON de saída (padrão: stdout)")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior para detectar regressões")
+    parser.add_argument("--limite-ler-fasta", default=LIMITE_LER_FASTA,
+                        help="Maior arquivo em que ler_fasta (que carrega tudo) é medido")
+    argumentos = parser.parse_args()
+
+    conjuntos = []
+    if not argumentos.sem_flaviviridae:
+        conjuntos.append(("flaviviridae", ARQUIVO_FLAVIVIRIDAE))
+    for tamanho in argumentos.tamanhos:
+        conjuntos.append((f"sintetico_{tamanho.upper()}",
+                          preparar_sintetico(tamanho, argumentos.semente)))
+
+    resultado = {"ambiente": ambiente(), "conjuntos": []}
+    for nome, caminho in conjuntos:
+        print(f"Medindo {nome} ({caminho})...", file=sys.stderr)
+        resultado["conjuntos"].append(medir_conjunto(
+            nome, caminho, argumentos.repeticoes, converter_tamanho(argumentos.limite_ler_fasta)))
+
+    texto = json.dumps(resultado, indent=2)
+    if argumentos.saida:
+        with open(argumentos.saida, "w") as arquivo:
+            arquivo.write(texto + "\n")
+    else:
+        print(texto)
+
+    if argumentos.comparar:
+        with open(argumentos.comparar) as arquivo:
+            regressoes = comparar(resultado, json.load(arquivo))
+        for regressao in regressoes:
+            print(f"Regressão: {regressao}", file=sys.stderr)
+        if regressoes:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Geração determinística de arquivos multiFASTA sintéticos para os benchmarks.
+
+Os registros imitam o arquivo de Flaviviridae: genomas de 9 a 12 kb, linhas de
+60 bases, uma linha em branco depois de cada registro e cabeçalhos "ID |nome".
+Uma pequena fração das bases é trocada por códigos IUPAC (R, Y, K, M, S, W, B, D,
+H, V) e alguns registros têm trechos de N, como em montagens reais com baixa
+cobertura. A mesma semente gera sempre o mesmo arquivo.
+
+Uso:
+    python benchmarks/gerar_dados.py benchmarks/dados/sintetico_10MB.fasta 10MB
+"""
+import os
+import random
+import sys
+
+TAXA_AMBIGUIDADE = 0.001
+CHANCE_TRECHO_N = 0.05
+BASES_POR_LINHA = 60
+
+_CODIGOS_IUPAC = "RYKMSWBDHV"
+_UNIDADES = {"KB": 1 << 10, "MB": 1 << 20, "GB": 1 << 30}
+
+# Cada byte aleatório vira uma base: 64 valores para cada uma de A, C, G e T.
+_BYTE_PARA_BASE = bytes.maketrans(bytes(range(256)), b"ACGT" * 64)
+
+
+def gerar_fasta(caminho_do_arquivo, tamanho_em_bytes: int, semente: int = 0,
+                taxa_ambiguidade: float = TAXA_AMBIGUIDADE) -> int:
+    """
+    Grava um multiFASTA sintético com aproximadamente `tamanho_em_bytes` bytes.
+
+    Args:
+        caminho_do_arquivo (str): Arquivo a criar.
+        tamanho_em_bytes (int): Tamanho desejado; o último registro pode passar um pouco.
+        semente (int): Semente do gerador (mesma semente, mesmo arquivo).
+        taxa_ambiguidade (float): Fração das bases trocadas por códigos IUPAC.
+
+    Returns:
+        int: Número de registros gravados.
+    """
+    gerador = random.Random(semente)
+    escritos = 0
+    registros = 0
+
+    with open(caminho_do_arquivo, "wb") as arquivo:
+        while escritos < tamanho_em_bytes:
+            registros += 1
+            bloco = _gerar_registro(gerador, registros, taxa_ambiguidade)
+            arquivo.write(bloco)
+            escritos += len(bloco)
+
+    return registros
+
+
+def converter_tamanho(texto: str) -> int:
+    """
+    Exemplo:
+        converter_tamanho("10MB") -> 10485760
+    """
+    texto = texto.strip().upper()
+    for unidade, multiplicador in _UNIDADES.items():
+        if texto.endswith(unidade):
+            return int(float(texto[:-len(unidade)]) * multiplicador)
+    return int(texto)
+
+
+def _gerar_registro(gerador: random.Random, numero: int, taxa_ambiguidade: float) -> bytes:
+    comprimento = gerador.randint(9_000, 12_000)
+    bases = bytearray(gerador.randbytes(comprimento).translate(_BYTE_PARA_BASE))
+
+    for _ in range(round(comprimento * taxa_ambiguidade)):
+        bases[gerador.randrange(comprimento)] = ord(gerador.choice(_CODIGOS_IUPAC))
+
+    if gerador.random() < CHANCE_TRECHO_N:
+        tamanho_trecho = gerador.randint(50, 500)
+        inicio = gerador.randrange(comprimento - tamanho_trecho)
+        bases[inicio:inicio + tamanho_trecho] = b"N" * tamanho_trecho
+
+    linhas = [bases[i:i + BASES_POR_LINHA] for i in range(0, comprimento, BASES_POR_LINHA)]
+    cabecalho = f">SYN_{numero:07d}.1 |Synthetic flavivirus {numero}, complete genome\n"
+    return cabecalho.encode() + b"\n".join(linhas) + b"\n\n"
+
+
+def main():
+    if len(sys.argv) < 3:
+        print(__doc__)
+        sys.exit(1)
+
+    caminho, tamanho = sys.argv[1], converter_tamanho(sys.argv[2])
+    semente = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    registros = gerar_fasta(caminho, tamanho, semente)
+    print(f"{caminho}: {registros} registros, {os.path.getsize(caminho)} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Custo por registro de OrganismoFasta: memória e tempo de criação, comparados com a
+versão anterior da classe (com __dict__ e cabeçalho separado na leitura).
+
+Simula a leitura de um conjunto de leituras curtas (como um arquivo de amplicons ou
+de reads): para cada registro, uma linha de cabeçalho e uma sequência de `comprimento`
+bases. Cada classe recebe o cabeçalho como a sua leitura o recebia: a anterior, em
+texto (decodificado e separado em id e nome na hora); a atual, nos bytes lidos do
+arquivo. Mede, para cada classe, o tempo para criar todos os registros, os bytes
+alocados por registro (incluindo a Sequencia e o cabeçalho) e o tempo do primeiro
+acesso a id/nome.
+
+Uso:
+    python benchmarks/registros.py --registros 1000000 --comprimento 150
+"""
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+
+
+class OrganismoFastaAnterior:
+    """A classe como era antes dos __slots__ e do cabeçalho preguiçoso (referência)."""
+
+    def __init__(self, id, nome, sequencia):
+        self.id = id
+        self.nome = nome
+        self.sequencia = sequencia if isinstance(sequencia, Sequencia) else Sequencia(sequencia)
+
+
+def criar_anterior(cabecalho: bytes, sequencia: str) -> OrganismoFastaAnterior:
+    id_organismo, nome = cabecalho.decode()[1:].rstrip().split("|")
+    return OrganismoFastaAnterior(id=id_organismo.strip(), nome=nome.strip(), sequencia=sequencia)
+
+
+def criar_atual(cabecalho: bytes, sequencia: str) -> OrganismoFasta:
+    return OrganismoFasta.de_cabecalho(cabecalho, sequencia)
+
+
+def gerar_registros(quantidade: int, comprimento: int, semente: int) -> list[tuple[bytearray, str]]:
+    """
+    Linhas de cabeçalho e sequências sintéticas. As linhas ficam em bytearray para
+    que a medição crie, com bytes(), um objeto novo por registro, como a leitura
+    do arquivo.
+    """
+    gerador = random.Random(semente)
+    return [(bytearray(f">READ_{i:09d}.1 |Synthetic amplicon {i}, sample {i % 96}\n".encode()),
+             "".join(gerador.choices("ACGT", k=comprimento)))
+            for i in range(quantidade)]
+
+
+def medir_classe(criar, registros) -> dict:
+    """Tempo de criação, bytes por registro e tempo do primeiro acesso a id e nome."""
+    gc.collect()
+    inicio = time.perf_counter()
+    organismos = [criar(bytes(cabecalho), sequencia) for cabecalho, sequencia in registros]
+    segundos_criacao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    for organismo in organismos:
+        organismo.id, organismo.nome
+    segundos_acesso = time.perf_counter() - inicio
+    del organismos
+
+    gc.collect()
+    tracemalloc.start()
+    organismos = [criar(bytes(cabecalho), sequencia) for cabecalho, sequencia in registros]
+    alocados, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del organismos
+
+    return {
+        "segundos_criacao": segundos_criacao,
+        "segundos_primeiro_acesso": segundos_acesso,
+        "bytes_por_registro": alocados / len(registros),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--registros", type=int, default=200_000)
+    parser.add_argument("--comprimento", type=int, default=150)
+    parser.add_argument("--semente", type=int, default=0)
+    argumentos = parser.parse_args()
+
+    registros = gerar_registros(argumentos.registros, argumentos.comprimento, argumentos.semente)
+    resultado = {
+        "registros": argumentos.registros,
+        "comprimento": argumentos.comprimento,
+        "anterior": medir_classe(criar_anterior, registros),
+        "atual": medir_classe(criar_atual, registros),
+    }
+    anterior, atual = resultado["anterior"], resultado["atual"]
+    resultado["economia_bytes_por_registro"] = (anterior["bytes_por_registro"]
+                                                - atual["bytes_por_registro"])
+    resultado["aceleracao_criacao"] = anterior["segundos_criacao"] / atual["segundos_criacao"]
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+Alinhamento par a par de sequências (global ou local), com gaps afins e banda opcional.
+
+A programação dinâmica segue Gotoh (três matrizes: H para o melhor alinhamento até a
+célula, E para gaps na primeira sequência e F para gaps na segunda) e é calculada
+por antidiagonais: todas as células de uma antidiagonal dependem só das duas
+anteriores, então cada antidiagonal é uma única operação vetorizada do NumPy.
+
+Com `banda`, só as células a até `banda` diagonais da diagonal principal (estendida
+para cobrir a diferença de comprimento) são calculadas. A pontuação usa memória
+linear; o traceback guarda um byte por célula da banda, o que para genomas virais
+de ~10 kb com banda de algumas centenas fica em poucos MB. Requer NumPy.
+"""
+import os
+from functools import partial
+
+import numpy as np
+
+from bio.paralelo import iterar_em_lote
+
+MODOS = ("global", "local")
+
+_DIAGONAL = 0
+_GAP_NA_PRIMEIRA = 1  # E: consome uma base da segunda sequência
+_GAP_NA_SEGUNDA = 2   # F: consome uma base da primeira sequência
+_INICIO = 3
+_E_ESTENDIDO = 4
+_F_ESTENDIDO = 8
+
+
+class Alinhamento:
+    """
+    Resultado de um alinhamento par a par.
+
+    Atributos:
+        pontuacao (float): Pontuação do alinhamento.
+        alinhada_a (str): Primeira sequência com '-' nos gaps.
+        alinhada_b (str): Segunda sequência com '-' nos gaps.
+        inicio_a, fim_a (int): Trecho [inicio_a, fim_a) da primeira sequência alinhado.
+        inicio_b, fim_b (int): Trecho [inicio_b, fim_b) da segunda sequência alinhado.
+
+    Exemplo:
+        print(alinhar("GATTACA", "GCATGCA"))
+            GATTACA
+            |  | ||
+            GCATGCA
+    """
+
+    def __init__(self, pontuacao: float, alinhada_a: str, alinhada_b: str,
+                 inicio_a: int, fim_a: int, inicio_b: int, fim_b: int):
+        self.pontuacao = pontuacao
+        self.alinhada_a = alinhada_a
+        self.alinhada_b = alinhada_b
+        self.inicio_a = inicio_a
+        self.fim_a = fim_a
+        self.inicio_b = inicio_b
+        self.fim_b = fim_b
+
+    def __repr__(self):
+        return (f"Alinhamento(pontuacao={self.pontuacao}, colunas={len(self)}, "
+                f"identidade={self.identidade():.3f})")
+
+    def __str__(self):
+        marcas = "".join("|" if x == y and x != "-" else " "
+                         for x, y in zip(self.alinhada_a, self.alinhada_b))
+        return f"{self.alinhada_a}\n{marcas}\n{self.alinhada_b}"
+
+    def __len__(self):
+        return len(self.alinhada_a)
+
+    def identidade(self) -> float:
+        """Fração das colunas do alinhamento com a mesma base nas duas sequências."""
+        if not len(self):
+            return 0.0
+        iguais = sum(x == y and x != "-" for x, y in zip(self.alinhada_a, self.alinhada_b))
+        return iguais / len(self)
+
+
+def alinhar(a, b, modo: str = "global", banda: int | None = None,
+            correspondencia: float = 2, divergencia: float = -1,
+            abertura: float = -5, extensao: float = -1) -> Alinhamento:
+    """
+    Alinha duas sequências e reconstrói o alinhamento (traceback).
+
+    Um gap de tamanho L custa abertura + (L - 1) * extensao.
+
+    Args:
+        a, b (Sequencia | str): Sequências a alinhar.
+        modo (str): "global" (Needleman-Wunsch/Gotoh) ou "local" (Smith-Waterman/Gotoh).
+        banda (int): Quantas diagonais além da principal calcular. None = matriz inteira.
+        correspondencia (float): Pontuação de bases iguais.
+        divergencia (float): Pontuação de bases diferentes.
+        abertura (float): Pontuação da primeira posição de um gap.
+        extensao (float): Pontuação de cada posição seguinte do gap.
+
+    Returns:
+        Alinhamento: Pontuação, sequências alinhadas e coordenadas.
+
+    Exemplo:
+        alinhar("GATTACA", "GCATGCA").pontuacao -> 5.0
+    """
+    resultado = _programacao_dinamica(a, b, modo, banda, correspondencia, divergencia,
+                                      abertura, extensao, traceback=True)
+    return _reconstruir(str(a).upper(), str(b).upper(), *resultado)
+
+
+def pontuar(a, b, modo: str = "global", banda: int | None = None,
+            correspondencia: float = 2, divergencia: float = -1,
+            abertura: float = -5, extensao: float = -1) -> float:
+    """
+    Calcula só a pontuação do alinhamento, com memória linear (sem traceback).
+
+    Mesmos parâmetros de alinhar().
+
+    Exemplo:
+        pontuar("GATTACA", "GCATGCA") -> 5.0
+    """
+    pontuacao, *_ = _programacao_dinamica(a, b, modo, banda, correspondencia, divergencia,
+                                          abertura, extensao, traceback=False)
+    return pontuacao
+
+
+def alinhar_contra_colecao(consulta, organismos, somente_pontuacao: bool = True,
+                           trabalhadores: int | None = None, **parametros) -> list[tuple]:
+    """
+    Alinha uma sequência de consulta contra cada registro de uma coleção, num pool de processos.
+
+    Args:
+        consulta (Sequencia | str): Sequência a comparar com cada registro.
+        organismos (iterable[OrganismoFasta]): Registros (lista de ler_fasta, iter_fasta...).
+        somente_pontuacao (bool): Se True, usa pontuar(); senão, alinhar().
+        trabalhadores (int): Número de processos. Padrão: os.cpu_count().
+        **parametros: Parâmetros de alinhar()/pontuar() (modo, banda, abertura...).
+
+    Returns:
+        list[tuple[str, float | Alinhamento]]: (id, resultado) de cada registro, na ordem da coleção.
+
+    Exemplo:
+        organismos = ler_fasta("arquivos/Flaviviridae-genomes.fasta", cache=True)
+        alinhar_contra_colecao(organismos[0].sequencia, organismos, banda=500)
+    """
+    funcao = partial(_alinhar_organismo, str(consulta), somente_pontuacao, parametros)
+    return list(iterar_em_lote(funcao, organismos, trabalhadores or os.cpu_count()))
+
+
+def _alinhar_organismo(consulta: str, somente_pontuacao: bool, parametros: dict, organismo):
+    alinhador = pontuar if somente_pontuacao else alinhar
+    return organismo.id, alinhador(consulta, organismo.sequencia, **parametros)
+
+
+def _codificar(sequencia) -> np.ndarray:
+    return np.frombuffer(str(sequencia).upper().encode("ascii", "replace"), dtype=np.uint8)
+
+
+def _programacao_dinamica(a, b, modo, banda, correspondencia, divergencia,
+                          abertura, extensao, traceback):
+    """
+    Preenche H, E e F por antidiagonais (t = i + j).
+
+    Cada matriz é guardada só nas três últimas antidiagonais, como vetores indexados
+    pela linha i (deslocada de 1: a posição 0 é sempre -inf, a "linha -1"). Antes de
+    reutilizar um vetor, só o trecho escrito três antidiagonais atrás é limpo.
+
+    Returns:
+        (pontuacao, fim_i, fim_j, caminho, menor_diagonal): `caminho` guarda, para cada
+        célula (i, j) da banda, na coluna j - max(0, i + menor_diagonal), a origem de H
+        e se E/F foram estendidos.
+    """
+    if modo not in MODOS:
+        raise ValueError(f"modo deve ser um de {MODOS}, não {modo!r}")
+    local = modo == "local"
+
+    # Uma base fictícia no início: seq_a[i] é a base da linha i (a[i - 1]), e as
+    # células da linha 0 / coluna 0 comparam as fictícias (o resultado é descartado).
+    seq_a = np.concatenate(([0], _codificar(a))).astype(np.uint8)
+    seq_b = np.concatenate(([1], _codificar(b))).astype(np.uint8)
+    n, m = len(seq_a) - 1, len(seq_b) - 1
+
+    if banda is None:
+        menor, maior = -n, m
+    else:
+        menor, maior = min(0, m - n) - banda, max(0, m - n) + banda
+    largura = min(m + 1, maior - menor + 1)
+
+    caminho = np.zeros((n + 1, largura), dtype=np.uint8) if traceback else None
+
+    infinito = -np.inf
+    H = [np.full(n + 2, infinito) for _ in range(3)]
+    E = [np.full(n + 2, infinito) for _ in range(3)]
+    F = [np.full(n + 2, infinito) for _ in range(3)]
+    escritos = [(0, 0)] * 3
+
+    melhor, fim_i, fim_j = (0.0, 0, 0) if local else (infinito, n, m)
+
+    for t in range(n + m + 1):
+        atual, anterior, antes = t % 3, (t - 1) % 3, (t - 2) % 3
+
+        lo, hi = escritos[atual]
+        for matriz in (H, E, F):
+            matriz[atual][lo:hi] = infinito
+
+        i_min = max(0, t - m, -((maior - t) // 2))
+        i_max = min(n, t, (t - menor) // 2)
+        if i_min > i_max:
+            escritos[atual] = (0, 0)
+            continue
+        escritos[atual] = (i_min + 1, i_max + 2)
+
+        h_diagonal = H[antes][i_min:i_max + 1]
+        h_acima, f_acima = H[anterior][i_min:i_max + 1], F[anterior][i_min:i_max + 1]
+        h_esquerda, e_esquerda = H[anterior][i_min + 1:i_max + 2], E[anterior][i_min + 1:i_max + 2]
+
+        bases_b = seq_b[t - i_max:t - i_min + 1][::-1]
+        substituicao = np.where(seq_a[i_min:i_max + 1] == bases_b, correspondencia, divergencia)
+        diagonal = h_diagonal + substituicao
+        e_abre, e_estende = h_esquerda + abertura, e_esquerda + extensao
+        f_abre, f_estende = h_acima + abertura, f_acima + extensao
+        e = np.maximum(e_abre, e_estende)
+        f = np.maximum(f_abre, f_estende)
+        h = np.maximum(diagonal, np.maximum(e, f))
+        if local:
+            h = np.maximum(h, 0.0)
+        if t == 0:
+            h[0] = 0.0
+
+        H[atual][i_min + 1:i_max + 2] = h
+        E[atual][i_min + 1:i_max + 2] = e
+        F[atual][i_min + 1:i_max + 2] = f
+
+        if traceback:
+            origem = np.where(h == diagonal, _DIAGONAL,
+                              np.where(h == e, _GAP_NA_PRIMEIRA, _GAP_NA_SEGUNDA))
+            if local:
+                origem[h == 0.0] = _INICIO
+            if t == 0:
+                origem[0] = _INICIO
+            origem |= np.where(e_estende > e_abre, _E_ESTENDIDO, 0)
+            origem |= np.where(f_estende > f_abre, _F_ESTENDIDO, 0)
+            i = np.arange(i_min, i_max + 1)
+            caminho[i, t - i - np.maximum(0, i + menor)] = origem
+
+        if local:
+            posicao = int(np.argmax(h))
+            if h[posicao] > melhor:
+                melhor, fim_i, fim_j = float(h[posicao]), i_min + posicao, t - i_min - posicao
+        elif t == n + m:
+            melhor = float(h[-1])
+
+    return melhor, fim_i, fim_j, caminho, menor
+
+
+def _reconstruir(a: str, b: str, pontuacao, i, j, caminho, menor) -> Alinhamento:
+    fim_a, fim_b = i, j
+    coluna_a, coluna_b = [], []
+    estado = _DIAGONAL  # em qual matriz estamos: H (_DIAGONAL), E ou F
+
+    while i > 0 or j > 0:
+        celula = int(caminho[i, j - max(0, i + menor)])
+        if estado == _DIAGONAL:
+            origem = celula & 3
+            if origem == _INICIO:
+                break
+            if origem == _DIAGONAL:
+                i, j = i - 1, j - 1
+                coluna_a.append(a[i])
+                coluna_b.append(b[j])
+            else:
+                estado = origem
+        elif estado == _GAP_NA_PRIMEIRA:
+            j -= 1
+            coluna_a.append("-")
+            coluna_b.append(b[j])
+            if not celula & _E_ESTENDIDO:
+                estado = _DIAGONAL
+        else:
+            i -= 1
+            coluna_a.append(a[i])
+            coluna_b.append("-")
+            if not celula & _F_ESTENDIDO:
+                estado = _DIAGONAL
+
+    return Alinhamento(pontuacao, "".join(reversed(coluna_a)), "".join(reversed(coluna_b)),
+                       i, fim_a, j, fim_b)
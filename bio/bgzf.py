@@ -0,0 +1,420 @@
+"""
+Leitura de arquivos comprimidos com gzip e BGZF (o gzip em blocos do bgzip/samtools).
+
+Um arquivo BGZF é uma sequência de membros gzip independentes de até 64 KB
+descomprimidos. Por isso os blocos podem ser descomprimidos em paralelo (o zlib
+libera o GIL) e é possível saltar direto para qualquer bloco:
+
+- LeitorBGZF descomprime os blocos seguintes em threads enquanto o texto é
+  consumido, e permite seek tanto por posição descomprimida quanto por offset
+  virtual (offset_do_bloco << 16 | posição_no_bloco), como no htslib.
+- EscritorBGZF faz o caminho inverso: comprime os blocos em threads enquanto o
+  texto é gravado.
+- A tabela de blocos pode ser gravada num índice .gzi (mesmo formato do bgzip),
+  que o FastaIndex usa para buscar regiões num FASTA comprimido.
+"""
+import gzip
+import io
+import os
+import struct
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+EXTENSAO_GZI = ".gzi"
+TAMANHO_MAXIMO_BLOCO = 0xFF00
+
+_MAGICA_GZIP = b"\x1f\x8b"
+_CABECALHO = struct.Struct("<4BI2BH")
+_FIM_DE_ARQUIVO = bytes.fromhex("1f8b08040000000000ff0600424302001b0003000000000000000000")
+
+
+def tipo_de_compressao(caminho_do_arquivo) -> str | None:
+    """
+    Identifica a compressão pelos primeiros bytes do arquivo.
+
+    Returns:
+        str | None: "bgzf", "gzip" ou None para arquivos sem compressão.
+    """
+    with open(caminho_do_arquivo, "rb") as arquivo:
+        inicio = arquivo.read(18)
+
+    if not inicio.startswith(_MAGICA_GZIP):
+        return None
+    if len(inicio) >= 18 and inicio[3] & 4 and inicio[12:14] == b"BC":
+        return "bgzf"
+    return "gzip"
+
+
+def abrir_sequencial(caminho_do_arquivo, tamanho_buffer: int = io.DEFAULT_BUFFER_SIZE):
+    """
+    Abre um arquivo, comprimido ou não, para leitura sequencial em modo binário.
+
+    Arquivos BGZF são descomprimidos em paralelo; gzip comum usa o módulo gzip.
+    Em todos os casos a leitura passa por um buffer de `tamanho_buffer` bytes.
+    """
+    compressao = tipo_de_compressao(caminho_do_arquivo)
+    if compressao == "bgzf":
+        return io.BufferedReader(LeitorBGZF(caminho_do_arquivo), tamanho_buffer)
+    if compressao == "gzip":
+        return io.BufferedReader(gzip.GzipFile(caminho_do_arquivo, "rb"), tamanho_buffer)
+    return io.BufferedReader(io.FileIO(caminho_do_arquivo), tamanho_buffer)
+
+
+def abrir_binario(caminho_do_arquivo):
+    """
+    Abre um arquivo em modo binário com suporte a seek, descomprimindo BGZF se preciso.
+
+    Raises:
+        ValueError: Para gzip comum, que não permite acesso aleatório.
+    """
+    compressao = tipo_de_compressao(caminho_do_arquivo)
+    if compressao == "bgzf":
+        return io.BufferedReader(LeitorBGZF(caminho_do_arquivo))
+    if compressao == "gzip":
+        raise ValueError(f"{caminho_do_arquivo!r} usa gzip comum, que não permite acesso "
+                         "aleatório; comprima com bgzip (ou bio.bgzf.comprimir_bgzf)")
+    return open(caminho_do_arquivo, "rb")
+
+
+class LeitorBGZF(io.RawIOBase):
+    """
+    Leitor binário de arquivos BGZF, com descompressão paralela e acesso aleatório.
+
+    Na leitura sequencial, até 2 blocos por thread são descomprimidos adiantados.
+    seek() usa posições do conteúdo descomprimido; seek_virtual() usa offsets virtuais.
+    Normalmente é usado dentro de um io.BufferedReader (ver abrir_binario).
+
+    Exemplo:
+        with LeitorBGZF("genomas.fasta.gz") as leitor:
+            leitor.seek(1000)
+            leitor.read(60)
+    """
+
+    def __init__(self, caminho_do_arquivo, trabalhadores: int | None = None):
+        super().__init__()
+        self.caminho = caminho_do_arquivo
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self._arquivo = open(caminho_do_arquivo, "rb")
+        self._executor = None
+        self._fila = None
+        self._blocos = None
+
+        self._dados = b""
+        self._pos = 0
+        self._offset_bloco = 0
+        self._inicio_bloco = 0
+        self._proximo_bloco = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, destino):
+        while self._pos >= len(self._dados):
+            if not self._avancar():
+                return 0
+
+        n = min(len(destino), len(self._dados) - self._pos)
+        destino[:n] = self._dados[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def tell(self):
+        return self._inicio_bloco + self._pos
+
+    def seek(self, posicao, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            posicao += self.tell()
+        elif whence == io.SEEK_END:
+            posicao += self._tabela()[1][-1]
+
+        if not self._inicio_bloco <= posicao < self._inicio_bloco + len(self._dados):
+            offsets, inicios = self._tabela()
+            i = max(bisect_right(inicios, posicao) - 1, 0)
+            if i < len(offsets):
+                self._carregar_bloco(offsets[i], inicios[i])
+            else:
+                self._carregar_bloco(os.path.getsize(self.caminho), inicios[-1])
+
+        self._pos = posicao - self._inicio_bloco
+        return posicao
+
+    def tell_virtual(self) -> int:
+        """Offset virtual da posição atual: (offset comprimido do bloco << 16) | posição no bloco."""
+        return (self._offset_bloco << 16) | self._pos
+
+    def seek_virtual(self, offset_virtual: int) -> int:
+        """
+        Posiciona a leitura num offset virtual BGZF, como os gravados por índices do htslib.
+        """
+        offset, posicao = offset_virtual >> 16, offset_virtual & 0xFFFF
+        offsets, inicios = self._tabela()
+        i = bisect_left(offsets, offset)
+        if i == len(offsets) or offsets[i] != offset:
+            raise ValueError(f"Offset virtual {offset_virtual} não aponta para o início de um bloco")
+        self._carregar_bloco(offset, inicios[i])
+        self._pos = posicao
+        return offset_virtual
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        self._fila = None
+        self._arquivo.close()
+        super().close()
+
+    def _avancar(self) -> bool:
+        if self._fila is None:
+            self._fila = self._descomprimir_a_partir_de(self._proximo_bloco)
+
+        proximo = next(self._fila, None)
+        if proximo is None:
+            return False
+
+        offset, tamanho, dados = proximo
+        self._inicio_bloco += len(self._dados)
+        self._offset_bloco = offset
+        self._proximo_bloco = offset + tamanho
+        self._dados = dados
+        self._pos = 0
+        return True
+
+    def _descomprimir_a_partir_de(self, offset: int):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.trabalhadores)
+
+        blocos = _ler_blocos(self._arquivo, offset)
+        pendentes = deque()
+        while True:
+            while len(pendentes) < 2 * self.trabalhadores:
+                bloco = next(blocos, None)
+                if bloco is None:
+                    break
+                offset_bloco, tamanho, comprimido = bloco
+                pendentes.append((offset_bloco, tamanho,
+                                  self._executor.submit(zlib.decompress, comprimido, -15)))
+
+            if not pendentes:
+                return
+            offset_bloco, tamanho, futuro = pendentes.popleft()
+            yield offset_bloco, tamanho, futuro.result()
+
+    def _carregar_bloco(self, offset: int, inicio: int):
+        bloco = next(_ler_blocos(self._arquivo, offset), None)
+        self._fila = None
+        self._offset_bloco = offset
+        self._inicio_bloco = inicio
+        if bloco is None:
+            self._dados = b""
+            self._proximo_bloco = offset
+        else:
+            _, tamanho, comprimido = bloco
+            self._dados = zlib.decompress(comprimido, -15)
+            self._proximo_bloco = offset + tamanho
+
+    def _tabela(self):
+        if self._blocos is None:
+            caminho_gzi = str(self.caminho) + EXTENSAO_GZI
+            if _mais_novo(caminho_gzi, self.caminho):
+                self._blocos = ler_gzi(caminho_gzi)
+            else:
+                self._blocos = _tabela_de_blocos(self.caminho)
+        return self._blocos
+
+
+class EscritorBGZF(io.RawIOBase):
+    """
+    Escritor binário no formato BGZF, com compressão dos blocos em paralelo.
+
+    Os bytes recebidos são cortados em blocos de TAMANHO_MAXIMO_BLOCO; até 2 blocos
+    por thread ficam em compressão ao mesmo tempo, e são gravados na ordem. close()
+    grava o último bloco e o marcador de fim de arquivo. O resultado pode ser lido
+    por LeitorBGZF, bgzip, samtools ou pelo módulo gzip.
+
+    Exemplo:
+        with io.BufferedWriter(EscritorBGZF("genomas.fasta.gz"), 1 << 20) as saida:
+            saida.write(b">NC_001477.1 |Dengue virus 1\nAGTTGTTAGT\n")
+    """
+
+    def __init__(self, destino, nivel: int = 6, trabalhadores: int | None = None):
+        super().__init__()
+        self.nivel = nivel
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self._proprio = isinstance(destino, (str, os.PathLike))
+        self._arquivo = open(destino, "wb") if self._proprio else destino
+        self._executor = ThreadPoolExecutor(max_workers=self.trabalhadores)
+        self._pendentes = deque()
+        self._dados = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, dados):
+        self._dados += dados
+        inicio = 0
+        while len(self._dados) - inicio >= TAMANHO_MAXIMO_BLOCO:
+            self._comprimir(bytes(self._dados[inicio:inicio + TAMANHO_MAXIMO_BLOCO]))
+            inicio += TAMANHO_MAXIMO_BLOCO
+        del self._dados[:inicio]
+        return len(dados)
+
+    def close(self):
+        if self.closed:
+            return
+        try:
+            if self._dados:
+                self._comprimir(bytes(self._dados))
+                self._dados = bytearray()
+            while self._pendentes:
+                self._arquivo.write(self._pendentes.popleft().result())
+            self._arquivo.write(_FIM_DE_ARQUIVO)
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+            if self._proprio:
+                self._arquivo.close()
+            super().close()
+
+    def _comprimir(self, dados: bytes):
+        self._pendentes.append(self._executor.submit(bloco_bgzf, dados, self.nivel))
+        while len(self._pendentes) > 2 * self.trabalhadores:
+            self._arquivo.write(self._pendentes.popleft().result())
+
+
+def construir_gzi(caminho_do_arquivo, caminho_gzi=None):
+    """
+    Grava o índice .gzi de um arquivo BGZF: o offset comprimido e o descomprimido de cada bloco.
+
+    Só os cabeçalhos e os tamanhos dos blocos são lidos; nada é descomprimido.
+    """
+    if caminho_gzi is None:
+        caminho_gzi = str(caminho_do_arquivo) + EXTENSAO_GZI
+
+    offsets, inicios = _tabela_de_blocos(caminho_do_arquivo)
+    pares = list(zip(offsets[1:], inicios[1:len(offsets)]))
+    with open(caminho_gzi, "wb") as saida:
+        saida.write(struct.pack("<Q", len(pares)))
+        for par in pares:
+            saida.write(struct.pack("<QQ", *par))
+    return offsets, inicios
+
+
+def ler_gzi(caminho_gzi):
+    """
+    Lê um índice .gzi e retorna (offsets comprimidos, inícios descomprimidos + tamanho total).
+    """
+    with open(caminho_gzi, "rb") as arquivo:
+        (n,) = struct.unpack("<Q", arquivo.read(8))
+        valores = struct.unpack(f"<{2 * n}Q", arquivo.read(16 * n))
+
+    offsets = [0] + list(valores[0::2])
+    inicios = [0] + list(valores[1::2])
+    caminho_bgzf = str(caminho_gzi)[:-len(EXTENSAO_GZI)]
+    inicios.append(inicios[-1] + _tamanho_do_ultimo_bloco(caminho_bgzf, offsets[-1]))
+    return offsets, inicios
+
+
+def comprimir_bgzf(origem, destino, nivel: int = 6):
+    """
+    Comprime um arquivo no formato BGZF (compatível com bgzip e com o módulo gzip).
+
+    Exemplo:
+        comprimir_bgzf("genomas.fasta", "genomas.fasta.gz")
+    """
+    with open(origem, "rb") as entrada, open(destino, "wb") as saida:
+        while True:
+            dados = entrada.read(TAMANHO_MAXIMO_BLOCO)
+            if not dados:
+                break
+            saida.write(bloco_bgzf(dados, nivel))
+        saida.write(_FIM_DE_ARQUIVO)
+
+
+def bloco_bgzf(dados: bytes, nivel: int = 6) -> bytes:
+    """
+    Comprime até TAMANHO_MAXIMO_BLOCO bytes em um bloco BGZF completo.
+    """
+    compressor = zlib.compressobj(nivel, zlib.DEFLATED, -15)
+    comprimido = compressor.compress(dados) + compressor.flush()
+    tamanho_bloco = _CABECALHO.size + 6 + len(comprimido) + 8
+    cabecalho = _CABECALHO.pack(0x1F, 0x8B, 8, 4, 0, 0, 0xFF, 6)
+    extra = struct.pack("<2sHH", b"BC", 2, tamanho_bloco - 1)
+    rodape = struct.pack("<II", zlib.crc32(dados), len(dados))
+    return cabecalho + extra + comprimido + rodape
+
+
+def fim_de_arquivo_bgzf() -> bytes:
+    """Bloco vazio que marca o fim de um arquivo BGZF."""
+    return _FIM_DE_ARQUIVO
+
+
+def _ler_blocos(arquivo, offset: int):
+    """Gera (offset, tamanho do bloco, dados deflate) de cada bloco a partir de `offset`."""
+    while True:
+        arquivo.seek(offset)
+        cabecalho = arquivo.read(_CABECALHO.size)
+        if len(cabecalho) < _CABECALHO.size:
+            return
+
+        tamanho = _tamanho_do_bloco(cabecalho, arquivo)
+        restante = arquivo.read(tamanho - _CABECALHO.size - _tamanho_extra(cabecalho))
+        yield offset, tamanho, restante[:-8]
+        offset += tamanho
+
+
+def _tamanho_extra(cabecalho: bytes) -> int:
+    return struct.unpack_from("<H", cabecalho, 10)[0]
+
+
+def _tamanho_do_bloco(cabecalho: bytes, arquivo) -> int:
+    if cabecalho[:2] != _MAGICA_GZIP or not cabecalho[3] & 4:
+        raise ValueError("Bloco BGZF inválido")
+
+    extra = arquivo.read(_tamanho_extra(cabecalho))
+    posicao = 0
+    while posicao + 4 <= len(extra):
+        identificador, tamanho_campo = struct.unpack_from("<2sH", extra, posicao)
+        if identificador == b"BC":
+            return struct.unpack_from("<H", extra, posicao + 4)[0] + 1
+        posicao += 4 + tamanho_campo
+    raise ValueError("Bloco gzip sem o campo BC do BGZF")
+
+
+def _tabela_de_blocos(caminho_do_arquivo):
+    offsets, inicios = [], [0]
+    with open(caminho_do_arquivo, "rb") as arquivo:
+        offset = 0
+        while True:
+            arquivo.seek(offset)
+            cabecalho = arquivo.read(_CABECALHO.size)
+            if len(cabecalho) < _CABECALHO.size:
+                break
+            tamanho = _tamanho_do_bloco(cabecalho, arquivo)
+            arquivo.seek(offset + tamanho - 4)
+            (tamanho_descomprimido,) = struct.unpack("<I", arquivo.read(4))
+            offsets.append(offset)
+            inicios.append(inicios[-1] + tamanho_descomprimido)
+            offset += tamanho
+    return offsets or [0], inicios
+
+
+def _tamanho_do_ultimo_bloco(caminho_do_arquivo, offset: int) -> int:
+    with open(caminho_do_arquivo, "rb") as arquivo:
+        arquivo.seek(offset)
+        cabecalho = arquivo.read(_CABECALHO.size)
+        if len(cabecalho) < _CABECALHO.size:
+            return 0
+        tamanho = _tamanho_do_bloco(cabecalho, arquivo)
+        arquivo.seek(offset + tamanho - 4)
+        return struct.unpack("<I", arquivo.read(4))[0]
+
+
+def _mais_novo(caminho, referencia) -> bool:
+    try:
+        return os.path.getmtime(caminho) >= os.path.getmtime(referencia)
+    except OSError:
+        return False
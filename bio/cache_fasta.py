@@ -0,0 +1,160 @@
+"""
+Cache binário de um FASTA já processado, para carregar a coleção sem reler o texto.
+
+O cache fica, por padrão, ao lado do FASTA (arquivo.fasta.bioc) e guarda, num único arquivo:
+
+    [cabeçalho: assinatura, versão, tamanho e mtime do FASTA, hash do conteúdo,
+     número de registros, bytes dos metadados, bytes das sequências]
+    [offsets: n + 1 inteiros de 64 bits]
+    [metadados: JSON com [id, nome] de cada registro]
+    [sequências: bases em maiúsculas, contíguas, sem quebras de linha]
+
+O cache é válido enquanto o tamanho e o mtime do FASTA não mudarem (ou, se pedido,
+enquanto o hash do conteúdo for o mesmo). A carga usa mmap: as sequências são
+SequenciaMapeada sobre o arquivo, sem cópia, e nada é processado além dos metadados.
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia_mapeada import SequenciaMapeada
+
+EXTENSAO_CACHE = ".bioc"
+VERSAO = 1
+
+_ASSINATURA = b"BIOCACHE"
+_CABECALHO = struct.Struct("<8sIQQ32sQQQ")
+
+
+def caminho_do_cache(caminho_do_arquivo) -> str:
+    """Caminho do cache de um FASTA: o próprio caminho com o sufixo .bioc."""
+    return str(caminho_do_arquivo) + EXTENSAO_CACHE
+
+
+def gravar_cache(caminho_do_arquivo, organismos, caminho_cache=None) -> str:
+    """
+    Grava o cache binário de uma coleção lida de `caminho_do_arquivo`.
+
+    O arquivo é escrito com um nome temporário único, no mesmo diretório, e
+    renomeado no final, então um cache incompleto nunca é lido (nem quando dois
+    processos gravam o mesmo cache ao mesmo tempo).
+
+    Args:
+        caminho_do_arquivo (str): FASTA de onde os organismos foram lidos.
+        organismos (list[OrganismoFasta]): Registros do FASTA.
+        caminho_cache (str): Onde gravar. Padrão: caminho_do_cache(caminho_do_arquivo).
+
+    Returns:
+        str: Caminho do cache gravado.
+
+    Raises:
+        OSError: Se o cache não puder ser gravado (por exemplo, num diretório
+            sem permissão de escrita).
+    """
+    caminho_cache = caminho_cache or caminho_do_cache(caminho_do_arquivo)
+    organismos = list(organismos)
+
+    offsets = [0]
+    for organismo in organismos:
+        offsets.append(offsets[-1] + len(organismo.sequencia))
+    meta = json.dumps([[o.id, o.nome] for o in organismos]).encode()
+
+    estado = os.stat(caminho_do_arquivo)
+    cabecalho = _CABECALHO.pack(
+        _ASSINATURA, VERSAO, estado.st_size, estado.st_mtime_ns,
+        _hash_do_arquivo(caminho_do_arquivo), len(organismos), len(meta), offsets[-1],
+    )
+
+    descritor, temporario = tempfile.mkstemp(dir=os.path.dirname(caminho_cache) or ".",
+                                             suffix=".tmp")
+    try:
+        with os.fdopen(descritor, "wb") as saida:
+            saida.write(cabecalho)
+            saida.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+            saida.write(meta)
+            for organismo in organismos:
+                saida.write(str(organismo.sequencia).encode())
+        os.replace(temporario, caminho_cache)
+    except BaseException:
+        os.unlink(temporario)
+        raise
+
+    return caminho_cache
+
+
+def carregar_cache(caminho_do_arquivo, caminho_cache=None,
+                   verificar_conteudo: bool = False) -> list[OrganismoFasta] | None:
+    """
+    Carrega a coleção do cache via mmap, se ele existir e ainda for válido.
+
+    Args:
+        caminho_do_arquivo (str): FASTA original.
+        caminho_cache (str): Cache a ler. Padrão: caminho_do_cache(caminho_do_arquivo).
+        verificar_conteudo (bool): Se True, também compara o hash do conteúdo do FASTA
+            (mais lento, mas detecta mudanças que preservam tamanho e mtime).
+
+    Returns:
+        list[OrganismoFasta] | None: Os registros, ou None se o cache não puder ser usado.
+    """
+    caminho_cache = caminho_cache or caminho_do_cache(caminho_do_arquivo)
+    try:
+        with open(caminho_cache, "rb") as arquivo:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    organismos = _ler_colecao(mapa, caminho_do_arquivo, verificar_conteudo)
+    if organismos is None:
+        mapa.close()
+    return organismos
+
+
+def _ler_colecao(mapa, caminho_do_arquivo, verificar_conteudo: bool):
+    """Registros do cache mapeado, ou None se ele estiver desatualizado, truncado ou corrompido."""
+    try:
+        (assinatura, versao, tamanho, mtime, hash_conteudo,
+         n, tamanho_meta, tamanho_sequencias) = _CABECALHO.unpack_from(mapa, 0)
+    except struct.error:
+        return None
+    if assinatura != _ASSINATURA or versao != VERSAO:
+        return None
+
+    estado = os.stat(caminho_do_arquivo)
+    if (estado.st_size, estado.st_mtime_ns) != (tamanho, mtime):
+        return None
+    if verificar_conteudo and _hash_do_arquivo(caminho_do_arquivo) != hash_conteudo:
+        return None
+
+    inicio_offsets = _CABECALHO.size
+    inicio_meta = inicio_offsets + 8 * (n + 1)
+    inicio_sequencias = inicio_meta + tamanho_meta
+    if inicio_sequencias + tamanho_sequencias > len(mapa):
+        return None
+
+    try:
+        offsets = struct.unpack_from(f"<{n + 1}Q", mapa, inicio_offsets)
+        registros = json.loads(mapa[inicio_meta:inicio_sequencias])
+    except (struct.error, ValueError):
+        return None
+    if (len(registros) != n or offsets[-1] != tamanho_sequencias
+            or any(a > b for a, b in zip(offsets, offsets[1:]))):
+        return None
+
+    return [
+        OrganismoFasta(
+            id=id,
+            nome=nome,
+            sequencia=SequenciaMapeada(mapa, offset=inicio_sequencias + offsets[i],
+                                       comprimento=offsets[i + 1] - offsets[i]),
+        )
+        for i, (id, nome) in enumerate(registros)
+    ]
+
+
+def _hash_do_arquivo(caminho_do_arquivo) -> bytes:
+    with open(caminho_do_arquivo, "rb") as arquivo:
+        return hashlib.file_digest(arquivo, "blake2s").digest()
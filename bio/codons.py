@@ -0,0 +1,167 @@
+"""
+Uso de códons de uma coleção inteira: contagens por registro e por fase, RSCU e ENC.
+
+As 64 trincas de todas as posições de todos os registros são calculadas de uma vez
+a partir dos códigos de bio.traducao (16*b1 + 4*b2 + b3), e um único np.bincount
+sobre (registro, fase, códon) produz a matriz de contagens. Códons com bases
+ambíguas e trincas que atravessam o fim de um registro são descartados. Os registros
+são processados em blocos de até BASES_POR_BLOCO bases, como em bio.colecao.
+Requer NumPy.
+
+Exemplo:
+    uso = contar_codons(ler_fasta("arquivos/Flaviviridae-genomes.fasta"))
+    uso.matriz()          -> matriz (registros x 64) da fase 0
+    uso.rscu()[:, 0]      -> RSCU de AAA em cada genoma
+    uso.enc()             -> número efetivo de códons de cada genoma
+"""
+import numpy as np
+
+from bio.colecao import BASES_POR_BLOCO, ColecaoSequencias, blocos
+from bio.traducao import (AMINOACIDO_DO_CODON, CODIGO_DA_BASE, CODIGO_INDEFINIDO,
+                           indices_em_todas_as_posicoes)
+
+QUADROS = 3
+ENC_MAXIMO = 61
+
+_AMINOACIDOS = sorted(set(AMINOACIDO_DO_CODON[:64]))
+# Matriz (64 x aminoácidos) que soma os códons de cada família de sinônimos.
+_FAMILIAS = np.array([[aminoacido == familia for familia in _AMINOACIDOS]
+                      for aminoacido in AMINOACIDO_DO_CODON[:64]], dtype=np.int64)
+_CODONS_POR_FAMILIA = _FAMILIAS.sum(axis=0)
+# Aminoácidos com códons sinônimos (os que entram no ENC) e os de códon único (Met, Trp).
+_COM_SINONIMOS = np.array([familia != "*" for familia in _AMINOACIDOS]) & (_CODONS_POR_FAMILIA > 1)
+_SEM_SINONIMOS = sum(familia != "*" and n == 1 for familia, n in zip(_AMINOACIDOS, _CODONS_POR_FAMILIA))
+
+
+class UsoDeCodons:
+    """
+    Contagens dos 64 códons de cada registro, nas três fases de leitura.
+
+    Os códons seguem a ordem de bio.traducao.CODONS (AAA, AAC, AAG, AAT, ACA, ...).
+
+    Atributos:
+        ids (np.ndarray): Identificador de cada registro.
+        contagens (np.ndarray): Array (registros x 3 x 64) de contagens (int64);
+            contagens[i, f] conta os códons do registro i lidos a partir da posição f.
+
+    Exemplo:
+        uso = contar_codons([OrganismoFasta("a", "", "ATGATGAAA")])
+        uso.matriz()[0, CODONS.index("ATG")]     -> 2
+        uso.matriz(1)[0, CODONS.index("TGA")]    -> 2
+    """
+
+    def __init__(self, ids, contagens: np.ndarray):
+        self.ids = ids
+        self.contagens = contagens
+
+    def __repr__(self):
+        return f"UsoDeCodons(registros={len(self)}, codons={int(self.contagens[:, 0].sum())})"
+
+    def __len__(self):
+        return len(self.contagens)
+
+    def matriz(self, quadro: int = 0) -> np.ndarray:
+        """
+        Matriz (registros x 64) com as contagens de uma fase (0, 1 ou 2).
+        """
+        return self.contagens[:, quadro]
+
+    def rscu(self, quadro: int = 0) -> np.ndarray:
+        """
+        Uso relativo de códons sinônimos (RSCU) de cada códon em cada registro.
+
+        RSCU = uso do códon / uso médio dos códons do mesmo aminoácido (os códons
+        de parada formam uma família própria). 1 indica uso sem preferência; acima
+        de 1, um códon preferido. Famílias sem nenhum uso no registro ficam com 0.
+
+        Returns:
+            np.ndarray: Matriz (registros x 64) de floats.
+        """
+        contagens = self.matriz(quadro)
+        por_familia = contagens @ _FAMILIAS
+        esperado = (por_familia / _CODONS_POR_FAMILIA) @ _FAMILIAS.T
+        return np.divide(contagens, esperado, out=np.zeros(contagens.shape), where=esperado > 0)
+
+    def enc(self, quadro: int = 0) -> np.ndarray:
+        """
+        Número efetivo de códons (ENC, Wright 1990) de cada registro.
+
+        Para cada aminoácido com códons sinônimos, a homozigose F = (N * Σp² - 1) / (N - 1)
+        é calculada a partir das frequências p dos seus códons (N é o número de
+        ocorrências do aminoácido; é preciso N > 1). As médias de F por grau de
+        degenerescência (2, 3, 4 e 6 códons) dão ENC = 2 + 9/F2 + 1/F3 + 5/F4 + 3/F6.
+        Sem isoleucina (a única família de 3 códons), F3 é a média de F2 e F4.
+        O resultado vai de 20 (um só códon por aminoácido) a 61 (uso uniforme);
+        registros sem dados para alguma classe ficam com NaN.
+
+        Returns:
+            np.ndarray: ENC de cada registro (float).
+        """
+        contagens = self.matriz(quadro)
+        ocorrencias = contagens @ _FAMILIAS
+        quadrados = (contagens.astype(np.float64) ** 2) @ _FAMILIAS
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            homozigose = (quadrados / ocorrencias - 1) / (ocorrencias - 1)
+            homozigose[ocorrencias < 2] = np.nan
+
+            medias = {}
+            for grau in np.unique(_CODONS_POR_FAMILIA[_COM_SINONIMOS]):
+                familias = _COM_SINONIMOS & (_CODONS_POR_FAMILIA == grau)
+                definidas = ~np.isnan(homozigose[:, familias])
+                medias[grau] = (np.nansum(homozigose[:, familias], axis=1)
+                                / np.where(definidas.any(axis=1), definidas.sum(axis=1), np.nan))
+            if 3 in medias:
+                medias[3] = np.where(np.isnan(medias[3]), (medias[2] + medias[4]) / 2, medias[3])
+
+            enc = np.full(len(self), float(_SEM_SINONIMOS))
+            for grau, media in medias.items():
+                enc += np.sum(_COM_SINONIMOS & (_CODONS_POR_FAMILIA == grau)) / media
+
+        return np.minimum(enc, ENC_MAXIMO)
+
+
+def contar_codons(organismos) -> UsoDeCodons:
+    """
+    Conta os 64 códons de cada registro nas três fases, numa passada vetorizada.
+
+    Args:
+        organismos (ColecaoSequencias | iterable[OrganismoFasta]): A coleção
+            (por exemplo, o resultado de ler_fasta ou iter_fasta).
+
+    Returns:
+        UsoDeCodons: Contagens (registros x 3 x 64), com RSCU e ENC.
+    """
+    colecao = organismos if isinstance(organismos, ColecaoSequencias) \
+        else ColecaoSequencias.de_organismos(organismos)
+    bases, offsets = colecao.bases, colecao.offsets
+    comprimentos = colecao.comprimentos()
+    contagens = np.zeros((len(colecao), QUADROS, 64), dtype=np.int64)
+
+    for primeiro, ultimo in blocos(comprimentos):
+        if ultimo == primeiro + 1:
+            _contar_registro(bases[offsets[primeiro]:offsets[ultimo]], contagens[primeiro])
+            continue
+
+        inicio = offsets[primeiro]
+        indices = indices_em_todas_as_posicoes(CODIGO_DA_BASE[bases[inicio:offsets[ultimo]]])
+        tamanhos = comprimentos[primeiro:ultimo]
+        registros = np.repeat(np.arange(ultimo - primeiro), tamanhos)[:len(indices)]
+        locais = np.arange(len(indices)) - (offsets[primeiro:ultimo] - inicio)[registros]
+        validos = (indices < CODIGO_INDEFINIDO) & (locais + 3 <= tamanhos[registros])
+        chaves = (registros * QUADROS + locais % QUADROS) * 64 + indices
+        contagens[primeiro:ultimo] += np.bincount(
+            chaves[validos], minlength=(ultimo - primeiro) * QUADROS * 64).reshape(-1, QUADROS, 64)
+
+    return UsoDeCodons(colecao.ids, contagens)
+
+
+def _contar_registro(bases: np.ndarray, contagens: np.ndarray):
+    """Conta os códons de um registro longo, por trechos de BASES_POR_BLOCO posições."""
+    for inicio in range(0, len(bases), BASES_POR_BLOCO):
+        indices = indices_em_todas_as_posicoes(
+            CODIGO_DA_BASE[bases[inicio:inicio + BASES_POR_BLOCO + 2]])
+        quadros = (np.arange(len(indices)) + inicio) % QUADROS
+        validos = indices < CODIGO_INDEFINIDO
+        contagens += np.bincount(quadros[validos] * 64 + indices[validos],
+                                 minlength=QUADROS * 64).reshape(QUADROS, 64)
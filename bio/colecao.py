@@ -0,0 +1,331 @@
+"""
+Coleção de sequências em formato colunar, com operações em lote vetorizadas.
+
+Em vez de uma lista de OrganismoFasta, todas as bases ficam num único array de
+bytes contíguo, com um array de offsets (o registro i ocupa bases[offsets[i]:offsets[i + 1]])
+e arrays com os ids e nomes. Comprimentos, composição, conteúdo GC, complementar
+reversa, tradução e seleção de registros são calculados para a coleção inteira de
+uma vez com NumPy, sem laço em Python por registro. Operações que montam uma coleção
+nova percorrem os registros em blocos de até BASES_POR_BLOCO bases, para que os
+arrays auxiliares de índices não cresçam com o tamanho da coleção. Requer NumPy.
+
+Exemplo:
+    colecao = ColecaoSequencias.de_fasta("arquivos/Flaviviridae-genomes.fasta")
+    colecao.conteudo_gc()                              -> array([0.53..., 0.49..., ...])
+    longas = colecao.filtrar(lambda c: c.comprimentos() >= 10_000)
+    escrever_fasta("proteinas.fasta", longas.traduzir())
+"""
+import numpy as np
+
+from bio.ler_fasta import iter_fasta
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import _COMPLEMENTO, _TRANSCRICAO
+from bio.sequencia_mapeada import SequenciaMapeada
+from bio.traducao import CODIGO_DA_BASE, CODIGO_INDEFINIDO, TABELA_CODONS, indices_de_codons
+
+BASES_POR_BLOCO = 1 << 22
+
+_PARADA = ord("*")
+
+
+class ColecaoSequencias:
+    """
+    Sequências de uma coleção guardadas de forma contígua, com ids e nomes em colunas.
+
+    Atributos:
+        bases (np.ndarray): Bases de todos os registros (uint8, maiúsculas), em sequência.
+        offsets (np.ndarray): n + 1 posições (int64); o registro i vai de offsets[i] a offsets[i + 1].
+        ids (np.ndarray): Identificadores (array de objetos str).
+        nomes (np.ndarray): Nomes (array de objetos str).
+
+    Indexar com um inteiro devolve um OrganismoFasta cuja sequência é uma
+    SequenciaMapeada sobre `bases` (sem cópia). Indexar com uma fatia, uma máscara
+    booleana ou uma lista de índices devolve outra ColecaoSequencias.
+
+    Exemplo:
+        colecao = ColecaoSequencias.de_organismos(ler_fasta(caminho))
+        colecao[0].sequencia[:10]     -> SequenciaMapeada(comprimento=10)
+        colecao[10:20].comprimentos() -> array([10862, 10723, ...])
+    """
+
+    def __init__(self, bases: np.ndarray, offsets: np.ndarray, ids, nomes):
+        self.bases = bases
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.ids = _coluna(ids)
+        self.nomes = _coluna(nomes)
+        if not len(self.ids) == len(self.nomes) == len(self.offsets) - 1:
+            raise ValueError("ids, nomes e offsets devem descrever o mesmo número de registros")
+
+    @classmethod
+    def de_organismos(cls, organismos) -> "ColecaoSequencias":
+        """
+        Monta a coleção a partir de OrganismoFasta (uma lista ou um gerador, como iter_fasta).
+
+        As bases de cada registro são copiadas uma vez para o buffer contíguo.
+        """
+        bases = bytearray()
+        offsets = [0]
+        ids = []
+        nomes = []
+        for organismo in organismos:
+            bases += str(organismo.sequencia).encode("ascii", "replace")
+            offsets.append(len(bases))
+            ids.append(organismo.id)
+            nomes.append(organismo.nome)
+        return cls(np.frombuffer(bases, dtype=np.uint8), offsets, ids, nomes)
+
+    @classmethod
+    def de_fasta(cls, caminho_do_arquivo) -> "ColecaoSequencias":
+        """
+        Lê um arquivo FASTA (comprimido ou não) direto para uma coleção, sem manter a lista de registros.
+        """
+        return cls.de_organismos(iter_fasta(caminho_do_arquivo))
+
+    def __repr__(self):
+        return f"ColecaoSequencias(registros={len(self)}, bases={len(self.bases)})"
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, selecao):
+        if isinstance(selecao, (int, np.integer)):
+            i = int(selecao)
+            if i < 0:
+                i += len(self)
+            if not 0 <= i < len(self):
+                raise IndexError("índice fora da coleção")
+            return OrganismoFasta(self.ids[i], self.nomes[i], self.sequencia(i))
+
+        if isinstance(selecao, slice):
+            inicio, fim, passo = selecao.indices(len(self))
+            if passo == 1:
+                fim = max(fim, inicio)
+                return ColecaoSequencias(
+                    self.bases[self.offsets[inicio]:self.offsets[fim]],
+                    self.offsets[inicio:fim + 1] - self.offsets[inicio],
+                    self.ids[inicio:fim],
+                    self.nomes[inicio:fim],
+                )
+            return self.selecionar(np.arange(inicio, fim, passo))
+
+        selecao = np.asarray(selecao)
+        if selecao.dtype == bool:
+            if len(selecao) != len(self):
+                raise ValueError("A máscara deve ter um valor por registro")
+            selecao = np.flatnonzero(selecao)
+        return self.selecionar(selecao)
+
+    def sequencia(self, i: int) -> SequenciaMapeada:
+        """
+        Retorna a sequência do registro `i` como uma visão sobre o buffer (sem cópia).
+        """
+        if i < 0:
+            i += len(self)
+        return SequenciaMapeada(memoryview(self.bases), offset=int(self.offsets[i]),
+                                comprimento=int(self.offsets[i + 1] - self.offsets[i]))
+
+    def comprimentos(self) -> np.ndarray:
+        """Número de bases de cada registro."""
+        return np.diff(self.offsets)
+
+    def composicao(self, alfabeto: str = "ACGTN") -> np.ndarray:
+        """
+        Conta as bases do `alfabeto` em cada registro.
+
+        Returns:
+            np.ndarray: Matriz (registros x len(alfabeto)) de contagens (int64).
+
+        Exemplo:
+            ColecaoSequencias.de_organismos([OrganismoFasta("a", "", "ACGTN"),
+                                             OrganismoFasta("b", "", "GGC")]).composicao("GC")
+                -> array([[1, 1],
+                          [2, 1]])
+        """
+        contagens = np.zeros((len(self), len(alfabeto)), dtype=np.int64)
+        for coluna, base in enumerate(alfabeto.upper()):
+            contagens[:, coluna] = _somar_por_registro(self.bases == ord(base), self.offsets)
+        return contagens
+
+    def calcular_percentual(self, bases: list[str]) -> np.ndarray:
+        """
+        Percentual das `bases` em cada registro, arredondado como em Sequencia.calcular_percentual.
+        """
+        contagens = self.composicao("".join(bases)).sum(axis=1)
+        return np.round(_dividir(contagens, self.comprimentos()), 2)
+
+    def conteudo_gc(self) -> np.ndarray:
+        """Fração de G e C em cada registro (0 para registros vazios), como Sequencia.conteudo_gc."""
+        return _dividir(self.composicao("GC").sum(axis=1), self.comprimentos())
+
+    def complementar(self) -> "ColecaoSequencias":
+        """Coleção com a fita complementar de cada registro (A↔T, C↔G)."""
+        return self._com_bases(_TABELA_COMPLEMENTO[self.bases], self.offsets)
+
+    def complementar_reversa(self) -> "ColecaoSequencias":
+        """Coleção com a complementar reversa de cada registro."""
+        bases, offsets = _reunir(self.bases, self.offsets[:-1], self.comprimentos(),
+                                 tabela=_TABELA_COMPLEMENTO, reverso=True)
+        return self._com_bases(bases, offsets)
+
+    def transcrever(self) -> "ColecaoSequencias":
+        """Coleção com a transcrição (T → U) de cada registro."""
+        return self._com_bases(_TABELA_TRANSCRICAO[self.bases], self.offsets)
+
+    def traduzir(self, parar: bool = False) -> "ColecaoSequencias":
+        """
+        Traduz todos os registros de uma vez, com as mesmas regras de Sequencia.traduzir().
+
+        Args:
+            parar (bool): Se True, cada proteína termina antes do seu primeiro códon de parada.
+
+        Returns:
+            ColecaoSequencias: As proteínas, com os mesmos ids e nomes.
+        """
+        codons = self.comprimentos() // 3
+        offsets = np.concatenate(([0], np.cumsum(codons)))
+        proteinas = np.empty(offsets[-1], dtype=np.uint8)
+        for primeiro, ultimo in blocos(codons * 3):
+            if ultimo == primeiro + 1:
+                inicio = self.offsets[primeiro]
+                codigos = CODIGO_DA_BASE[self.bases[inicio:inicio + 3 * codons[primeiro]]]
+                proteinas[offsets[primeiro]:offsets[ultimo]] = TABELA_CODONS[indices_de_codons(codigos)]
+                continue
+            inicios = _posicoes(self.offsets[primeiro:ultimo], codons[primeiro:ultimo], passo=3)
+            codigos = [CODIGO_DA_BASE[self.bases[inicios + deslocamento]] for deslocamento in range(3)]
+            indices = np.minimum(codigos[0] * 16 + codigos[1] * 4 + codigos[2], CODIGO_INDEFINIDO)
+            proteinas[offsets[primeiro]:offsets[ultimo]] = TABELA_CODONS[indices]
+
+        if parar:
+            paradas = np.flatnonzero(proteinas == _PARADA)
+            registros = np.searchsorted(offsets, paradas, side="right") - 1
+            primeiras, posicoes = np.unique(registros, return_index=True)
+            truncados = codons.copy()
+            truncados[primeiras] = paradas[posicoes] - offsets[primeiras]
+            proteinas, offsets = _reunir(proteinas, offsets[:-1], truncados)
+
+        return self._com_bases(proteinas, offsets)
+
+    def filtrar(self, criterio) -> "ColecaoSequencias":
+        """
+        Mantém os registros que atendem ao critério.
+
+        Args:
+            criterio (np.ndarray | callable): Máscara booleana com um valor por registro,
+                ou função que recebe a coleção e devolve essa máscara (vetorizada).
+
+        Exemplo:
+            colecao.filtrar(lambda c: (c.conteudo_gc() > 0.5) & (c.comprimentos() > 9000))
+        """
+        mascara = criterio(self) if callable(criterio) else criterio
+        mascara = np.asarray(mascara, dtype=bool)
+        if len(mascara) != len(self):
+            raise ValueError("O critério deve produzir um valor por registro")
+        return self[mascara]
+
+    def selecionar(self, indices) -> "ColecaoSequencias":
+        """
+        Nova coleção com os registros nos `indices` (em qualquer ordem, com repetições).
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        indices = np.where(indices < 0, indices + len(self), indices)
+        if len(indices) and (indices.min() < 0 or indices.max() >= len(self)):
+            raise IndexError("índice fora da coleção")
+
+        bases, offsets = _reunir(self.bases, self.offsets[indices], self.comprimentos()[indices])
+        return ColecaoSequencias(bases, offsets, self.ids[indices], self.nomes[indices])
+
+    def _com_bases(self, bases: np.ndarray, offsets: np.ndarray) -> "ColecaoSequencias":
+        return ColecaoSequencias(bases, offsets, self.ids, self.nomes)
+
+
+def _tabela_de_bytes(tabela: dict) -> np.ndarray:
+    """Converte uma tabela de str.translate numa tabela de consulta de 256 bytes."""
+    return np.frombuffer(bytes(range(256)).decode("latin-1").translate(tabela).encode("latin-1"),
+                         dtype=np.uint8)
+
+
+_TABELA_COMPLEMENTO = _tabela_de_bytes(_COMPLEMENTO)
+_TABELA_TRANSCRICAO = _tabela_de_bytes(_TRANSCRICAO)
+
+
+def _coluna(valores) -> np.ndarray:
+    """Array de objetos com os valores; um array de objetos já pronto é reaproveitado."""
+    if isinstance(valores, np.ndarray) and valores.dtype == object and valores.ndim == 1:
+        return valores
+    coluna = np.empty(len(valores), dtype=object)
+    coluna[:] = list(valores)
+    return coluna
+
+
+def _dividir(numerador: np.ndarray, denominador: np.ndarray) -> np.ndarray:
+    return np.divide(numerador, denominador, out=np.zeros(len(denominador)), where=denominador > 0)
+
+
+def _somar_por_registro(valores: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """Soma `valores` dentro de cada registro (registros vazios somam 0)."""
+    comprimentos = np.diff(offsets)
+    somas = np.zeros(len(comprimentos), dtype=np.int64)
+    com_bases = np.flatnonzero(comprimentos)
+    if len(com_bases):
+        somas[com_bases] = np.add.reduceat(valores, offsets[com_bases], dtype=np.int64)
+    return somas
+
+
+def blocos(comprimentos: np.ndarray, limite: int | None = None):
+    """
+    Divide os registros em faixas [primeiro, ultimo) com até `limite` bases
+    (padrão: BASES_POR_BLOCO, lido a cada chamada) ou um único registro, se ele
+    sozinho passar do limite. Usada pelas operações em lote desta coleção e de
+    bio.codons para limitar o tamanho dos arrays auxiliares.
+
+    Exemplo:
+        list(blocos(np.array([3, 3, 20, 1]), limite=6)) -> [(0, 2), (2, 3), (3, 4)]
+    """
+    limite = limite or BASES_POR_BLOCO
+    acumulado = np.cumsum(comprimentos)
+    primeiro = 0
+    while primeiro < len(comprimentos):
+        antes = acumulado[primeiro - 1] if primeiro else 0
+        ultimo = max(int(np.searchsorted(acumulado, antes + limite, side="right")), primeiro + 1)
+        yield primeiro, ultimo
+        primeiro = ultimo
+
+
+def _posicoes(inicios: np.ndarray, quantidades: np.ndarray, passo: int = 1) -> np.ndarray:
+    """Concatena inicio, inicio + passo, ... (quantidade termos) de cada par, sem laço."""
+    total = int(quantidades.sum())
+    antes = np.cumsum(quantidades) - quantidades
+    locais = np.arange(total, dtype=np.int64) - np.repeat(antes, quantidades)
+    return np.repeat(inicios, quantidades) + passo * locais
+
+
+def _reunir(origem: np.ndarray, inicios: np.ndarray, comprimentos: np.ndarray,
+            tabela: np.ndarray | None = None, reverso: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Copia os trechos origem[inicios[i]:inicios[i] + comprimentos[i]] para um buffer novo,
+    um depois do outro (invertidos, se `reverso`, e convertidos pela `tabela`, se houver).
+
+    Returns:
+        tuple: (buffer, offsets) da nova coleção.
+    """
+    inicios = np.asarray(inicios, dtype=np.int64)
+    comprimentos = np.asarray(comprimentos, dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(comprimentos)))
+    destino = np.empty(offsets[-1], dtype=np.uint8)
+
+    for primeiro, ultimo in blocos(comprimentos):
+        if ultimo == primeiro + 1:
+            trecho = origem[inicios[primeiro]:inicios[primeiro] + comprimentos[primeiro]]
+            trecho = trecho[::-1] if reverso else trecho
+        elif reverso:
+            finais = inicios[primeiro:ultimo] + comprimentos[primeiro:ultimo] - 1
+            trecho = origem[_posicoes(finais, comprimentos[primeiro:ultimo], passo=-1)]
+        else:
+            trecho = origem[_posicoes(inicios[primeiro:ultimo], comprimentos[primeiro:ultimo])]
+        destino[offsets[primeiro]:offsets[ultimo]] = trecho if tabela is None else tabela[trecho]
+
+    return destino, offsets
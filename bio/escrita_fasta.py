@@ -0,0 +1,165 @@
+"""
+Gravação de arquivos FASTA (de DNA, RNA ou proteína) em fluxo.
+
+Os registros são gravados um a um, e a sequência de cada um é convertida em texto
+por trechos de tamanho limitado. Assim, nem a coleção nem uma sequência inteira
+precisam ficar em memória: complementares reversas e transcrições, que são visões
+(SequenciaVisao), só têm montado o trecho que está sendo gravado. A saída passa por
+um buffer grande e pode ser comprimida com gzip ou BGZF (bio.bgzf).
+
+Exemplo:
+    registros = ((o.id, o.nome, o.sequencia.complementar_reversa())
+                 for o in iter_fasta("arquivos/Flaviviridae-genomes.fasta"))
+    escrever_fasta("reversas.fasta.gz", registros, compressao="bgzf")
+"""
+import gzip
+import io
+import os
+
+from bio.bgzf import EscritorBGZF
+from bio.organismo_fasta import OrganismoFasta
+
+LARGURA_PADRAO = 60
+TAMANHO_BUFFER = 1 << 20
+BASES_POR_TRECHO = 1 << 16
+
+COMPRESSOES = (None, "gzip", "bgzf")
+
+
+class EscritorFasta:
+    """
+    Grava registros FASTA num arquivo, um por vez.
+
+    Aceita OrganismoFasta ou tuplas (id, nome, sequencia), em que a sequência pode
+    ser qualquer Sequencia (inclusive visões e sequências mapeadas) ou uma string,
+    como a proteína devolvida por Sequencia.traduzir(). O cabeçalho segue o formato
+    lido por ler_fasta: ">id |nome".
+
+    Args:
+        destino (str | arquivo binário): Caminho do arquivo ou arquivo já aberto em
+            modo binário (que não é fechado pelo escritor).
+        largura (int): Bases por linha; 0 ou None grava cada sequência numa linha só.
+        compressao (str | None): None, "gzip" ou "bgzf" (gzip em blocos, que pode ser
+            indexado e lido em paralelo).
+        tamanho_buffer (int): Tamanho, em bytes, do buffer de escrita.
+        nivel (int): Nível de compressão (1 a 9).
+
+    Exemplo:
+        with EscritorFasta("proteinas.fasta", largura=70) as escritor:
+            for organismo in iter_fasta(caminho):
+                escritor.escrever((organismo.id, organismo.nome, organismo.sequencia.traduzir()))
+    """
+
+    def __init__(self, destino, largura: int | None = LARGURA_PADRAO, compressao: str | None = None,
+                 tamanho_buffer: int = TAMANHO_BUFFER, nivel: int = 6):
+        if compressao not in COMPRESSOES:
+            raise ValueError(f"Compressão desconhecida: {compressao!r} (use None, 'gzip' ou 'bgzf')")
+        if largura is not None and largura < 0:
+            raise ValueError("largura não pode ser negativa")
+
+        self.largura = largura or 0
+        self.registros = 0
+        self._bases_por_trecho = (BASES_POR_TRECHO // self.largura * self.largura
+                                  if self.largura else BASES_POR_TRECHO)
+        self._saida = _abrir(destino, compressao, tamanho_buffer, nivel)
+
+    def escrever(self, registro):
+        """
+        Grava um registro: OrganismoFasta ou tupla (id, nome, sequencia).
+        """
+        if isinstance(registro, OrganismoFasta):
+            id_organismo, nome, sequencia = registro.id, registro.nome, registro.sequencia
+        else:
+            id_organismo, nome, sequencia = registro
+
+        escrever = self._saida.write
+        escrever(f">{id_organismo} |{nome}\n".encode())
+        comprimento = len(sequencia)
+        for inicio in range(0, comprimento, self._bases_por_trecho):
+            trecho = str(sequencia[inicio:min(inicio + self._bases_por_trecho, comprimento)])
+            escrever(self._quebrar_linhas(trecho).encode())
+        self.registros += 1
+
+    def escrever_todos(self, registros) -> int:
+        """
+        Grava todos os registros de um iterável (lista, gerador, iter_fasta...).
+
+        Returns:
+            int: Número de registros gravados nesta chamada.
+        """
+        antes = self.registros
+        for registro in registros:
+            self.escrever(registro)
+        return self.registros - antes
+
+    def close(self):
+        self._saida.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _quebrar_linhas(self, trecho: str) -> str:
+        largura = self.largura
+        if not largura or len(trecho) <= largura:
+            return trecho + "\n"
+        return "\n".join([trecho[i:i + largura] for i in range(0, len(trecho), largura)]) + "\n"
+
+
+def escrever_fasta(destino, registros, largura: int | None = LARGURA_PADRAO,
+                   compressao: str | None = None, tamanho_buffer: int = TAMANHO_BUFFER) -> int:
+    """
+    Grava uma coleção de registros num arquivo FASTA, sem montá-la em memória.
+
+    Args:
+        destino (str | arquivo binário): Arquivo de saída.
+        registros (iterable): OrganismoFasta ou tuplas (id, nome, sequencia).
+        largura (int): Bases por linha (0 ou None: sem quebra).
+        compressao (str | None): None, "gzip" ou "bgzf".
+        tamanho_buffer (int): Tamanho, em bytes, do buffer de escrita.
+
+    Returns:
+        int: Número de registros gravados.
+
+    Exemplo:
+        escrever_fasta("transcritos.fasta",
+                       ((o.id, o.nome, o.sequencia.transcrever()) for o in ler_fasta(caminho)))
+    """
+    with EscritorFasta(destino, largura, compressao, tamanho_buffer) as escritor:
+        return escritor.escrever_todos(registros)
+
+
+def _abrir(destino, compressao: str | None, tamanho_buffer: int, nivel: int):
+    """Abre a saída binária com buffer e, se pedido, compressão."""
+    if compressao == "bgzf":
+        return io.BufferedWriter(EscritorBGZF(destino, nivel), tamanho_buffer)
+
+    proprio = isinstance(destino, (str, os.PathLike))
+    if compressao == "gzip":
+        arquivo = gzip.GzipFile(destino if proprio else None, "wb", nivel,
+                                fileobj=None if proprio else destino)
+        return io.BufferedWriter(arquivo, tamanho_buffer)
+    if proprio:
+        return open(destino, "wb", buffering=tamanho_buffer)
+    return io.BufferedWriter(_SemFechar(destino), tamanho_buffer)
+
+
+class _SemFechar(io.RawIOBase):
+    """Repassa as escritas a um arquivo do chamador, sem fechá-lo no final."""
+
+    def __init__(self, arquivo):
+        super().__init__()
+        self._arquivo = arquivo
+
+    def writable(self):
+        return True
+
+    def write(self, dados):
+        return self._arquivo.write(dados)
+
+    def close(self):
+        if not self.closed:
+            self._arquivo.flush()
+        super().close()
@@ -0,0 +1,349 @@
+import mmap
+import os
+
+from bio.bgzf import abrir_binario, construir_gzi, tipo_de_compressao
+from bio.organismo_fasta import OrganismoFasta, separar_cabecalho
+from bio.sequencia import Sequencia
+from bio.sequencia_mapeada import SequenciaMapeada
+
+EXTENSAO_INDICE = ".fai"
+
+
+class EntradaIndice:
+    """
+    Posição de um registro dentro de um arquivo FASTA, no formato .fai do samtools.
+
+    Atributos:
+        id (str): Identificador do registro.
+        comprimento (int): Número de bases da sequência.
+        offset (int): Byte em que começa a primeira base da sequência.
+        bases_por_linha (int): Número de bases em cada linha completa.
+        bytes_por_linha (int): Número de bytes de cada linha completa, incluindo a quebra.
+    """
+
+    def __init__(self, id: str, comprimento: int, offset: int,
+                 bases_por_linha: int, bytes_por_linha: int):
+        self.id = id
+        self.comprimento = comprimento
+        self.offset = offset
+        self.bases_por_linha = bases_por_linha
+        self.bytes_por_linha = bytes_por_linha
+
+    def __repr__(self):
+        return (f"EntradaIndice(id={self.id!r}, comprimento={self.comprimento}, "
+                f"offset={self.offset})")
+
+    def posicao_em_bytes(self, posicao: int) -> int:
+        """
+        Converte a posição de uma base (0-based) no byte correspondente do arquivo.
+
+        Exemplo:
+            Com 60 bases por linha e 61 bytes por linha, a base 60 está em offset + 61.
+        """
+        linha, coluna = divmod(posicao, self.bases_por_linha)
+        return self.offset + linha * self.bytes_por_linha + coluna
+
+
+def construir_indice(caminho_do_arquivo, caminho_indice=None) -> list[EntradaIndice]:
+    """
+    Percorre um arquivo FASTA uma vez e grava um índice no formato .fai.
+
+    Cada linha do índice guarda id, comprimento, offset, bases por linha e
+    bytes por linha de um registro, o que basta para localizar qualquer base
+    com um único seek.
+
+    Args:
+        caminho_do_arquivo (str): Caminho do arquivo FASTA.
+        caminho_indice (str): Onde gravar o índice. Padrão: o FASTA com sufixo ".fai".
+
+    Returns:
+        list[EntradaIndice]: Entradas do índice, na ordem do arquivo.
+
+    Para arquivos BGZF os offsets são do conteúdo descomprimido (como no samtools),
+    e o índice de blocos .gzi também é gravado.
+
+    Raises:
+        ValueError: Se um registro tiver linhas de tamanhos diferentes (exceto a última),
+            ou se o arquivo usar gzip comum, que não permite acesso aleatório.
+        OSError: Se o índice não puder ser gravado.
+    """
+    entradas = _indexar(caminho_do_arquivo)
+    _gravar_indice(caminho_do_arquivo, entradas, caminho_indice)
+    return entradas
+
+
+def ler_indice(caminho_indice) -> list[EntradaIndice]:
+    """
+    Lê um índice .fai gravado por construir_indice (ou pelo samtools faidx).
+    """
+    entradas = []
+    with open(caminho_indice) as arquivo:
+        for linha in arquivo:
+            campos = linha.rstrip("\n").split("\t")
+            if len(campos) < 5:
+                continue
+            entradas.append(EntradaIndice(
+                id=campos[0],
+                comprimento=int(campos[1]),
+                offset=int(campos[2]),
+                bases_por_linha=int(campos[3]),
+                bytes_por_linha=int(campos[4]),
+            ))
+    return entradas
+
+
+def _indexar(caminho_do_arquivo) -> list[EntradaIndice]:
+    with abrir_binario(caminho_do_arquivo) as arquivo:
+        return list(_indexar_linhas(arquivo))
+
+
+def _gravar_indice(caminho_do_arquivo, entradas: list[EntradaIndice], caminho_indice=None):
+    if caminho_indice is None:
+        caminho_indice = str(caminho_do_arquivo) + EXTENSAO_INDICE
+
+    if tipo_de_compressao(caminho_do_arquivo) == "bgzf":
+        construir_gzi(caminho_do_arquivo)
+
+    with open(caminho_indice, "w") as saida:
+        for e in entradas:
+            saida.write(f"{e.id}\t{e.comprimento}\t{e.offset}\t"
+                        f"{e.bases_por_linha}\t{e.bytes_por_linha}\n")
+
+
+def _indexar_linhas(arquivo):
+    offset = 0
+    atual = None
+    fim_do_registro = False
+
+    for linha in arquivo:
+        tamanho_linha = len(linha)
+
+        if linha.startswith(b">"):
+            if atual is not None:
+                yield atual
+            atual = EntradaIndice(
+                id=_id_do_cabecalho(linha.decode()),
+                comprimento=0,
+                offset=offset + tamanho_linha,
+                bases_por_linha=0,
+                bytes_por_linha=0,
+            )
+            fim_do_registro = False
+        elif atual is not None:
+            bases = len(linha.rstrip(b"\r\n"))
+            if bases == 0:
+                fim_do_registro = True
+            elif fim_do_registro or (atual.bases_por_linha and bases > atual.bases_por_linha):
+                raise ValueError(f"Linhas de tamanhos diferentes no registro {atual.id!r}")
+            else:
+                if atual.bases_por_linha == 0:
+                    atual.bases_por_linha = bases
+                    atual.bytes_por_linha = tamanho_linha
+                if bases < atual.bases_por_linha:
+                    fim_do_registro = True
+                atual.comprimento += bases
+
+        offset += tamanho_linha
+
+    if atual is not None:
+        yield atual
+
+
+def _id_do_cabecalho(cabecalho: str) -> str:
+    return separar_cabecalho(cabecalho)[0]
+
+
+class FastaIndex:
+    """
+    Acesso aleatório a um arquivo FASTA por id e por região, usando um índice .fai.
+
+    Em vez de ler o arquivo inteiro, cada consulta faz um seek direto para os
+    bytes pedidos. Se o índice não existir, ele é construído na primeira abertura;
+    se não puder ser gravado (por exemplo, num diretório somente leitura), as
+    entradas ficam só em memória e o arquivo é indexado de novo a cada abertura.
+    Arquivos comprimidos com bgzip também são aceitos: a busca salta direto para
+    o bloco BGZF que contém a região.
+
+    Exemplo:
+        with FastaIndex("arquivos/Flaviviridae-genomes.fasta") as indice:
+            indice["NC_074786.1"][999]           -> 'A'
+            indice.buscar("NC_074786.1", 0, 10)  -> 'CACTCCATAC'
+    """
+
+    def __init__(self, caminho_do_arquivo, caminho_indice=None):
+        self.caminho = caminho_do_arquivo
+        if caminho_indice is None:
+            caminho_indice = str(caminho_do_arquivo) + EXTENSAO_INDICE
+
+        if _indice_atualizado(caminho_do_arquivo, caminho_indice):
+            entradas = ler_indice(caminho_indice)
+        else:
+            entradas = _indexar(caminho_do_arquivo)
+            try:
+                _gravar_indice(caminho_do_arquivo, entradas, caminho_indice)
+            except OSError:
+                pass
+
+        self.entradas = {entrada.id: entrada for entrada in entradas}
+        self.comprimido = tipo_de_compressao(caminho_do_arquivo) is not None
+        self._arquivo = abrir_binario(caminho_do_arquivo)
+        self._mapa = None
+
+    def __repr__(self):
+        return f"FastaIndex({self.caminho!r}, registros={len(self)})"
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def __iter__(self):
+        return iter(self.entradas)
+
+    def __contains__(self, id):
+        return id in self.entradas
+
+    def __getitem__(self, id):
+        return SequenciaIndexada(self, self.entradas[id])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self):
+        """Fecha o arquivo FASTA aberto pelo índice (e o mmap, se houver)."""
+        if self._mapa is not None:
+            self._mapa.close()
+            self._mapa = None
+        self._arquivo.close()
+
+    def mapear(self, id: str) -> SequenciaMapeada:
+        """
+        Retorna uma SequenciaMapeada do registro, lida direto de um mmap do arquivo.
+
+        Todas as sequências mapeadas do índice compartilham o mesmo mmap, e processos
+        diferentes que mapeiam o mesmo arquivo compartilham as páginas do sistema.
+        Não disponível para arquivos comprimidos.
+
+        Exemplo:
+            indice.mapear("NC_074786.1")[999:1002] -> SequenciaMapeada(comprimento=3), com "ATT"
+        """
+        entrada = self.entradas[id]
+        if self._mapa is None:
+            if self.comprimido:
+                raise ValueError("mapear() não está disponível para arquivos comprimidos")
+            self._mapa = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        return SequenciaMapeada(
+            self._mapa,
+            offset=entrada.offset,
+            comprimento=entrada.comprimento,
+            bases_por_linha=entrada.bases_por_linha,
+            bytes_por_linha=entrada.bytes_por_linha,
+        )
+
+    def buscar(self, id: str, inicio: int = 0, fim: int | None = None) -> str:
+        """
+        Retorna as bases de uma região de um registro, lendo só os bytes necessários.
+
+        Args:
+            id (str): Identificador do registro.
+            inicio (int): Posição inicial (0-based, inclusiva).
+            fim (int): Posição final (exclusiva). Padrão: fim da sequência.
+
+        Returns:
+            str: Bases da região, em maiúsculas.
+
+        Exemplo:
+            indice.buscar("NC_074786.1", 999, 1000) -> 'A'
+        """
+        entrada = self.entradas[id]
+        inicio, fim, _ = slice(inicio, fim).indices(entrada.comprimento)
+        if fim <= inicio:
+            return ""
+
+        byte_inicio = entrada.posicao_em_bytes(inicio)
+        byte_fim = entrada.posicao_em_bytes(fim - 1) + 1
+
+        self._arquivo.seek(byte_inicio)
+        dados = self._arquivo.read(byte_fim - byte_inicio)
+        return dados.translate(None, b"\r\n").decode().upper()
+
+    def cabecalho(self, id: str) -> str:
+        """
+        Retorna a linha de cabeçalho de um registro (sem o '>' e sem a quebra de linha).
+
+        O cabeçalho é lido voltando a partir do início da sequência, sem percorrer o arquivo.
+        """
+        fim = self.entradas[id].offset
+        inicio = fim
+        while inicio > 0:
+            inicio = max(0, inicio - 1024)
+            self._arquivo.seek(inicio)
+            trecho = self._arquivo.read(fim - inicio)
+            posicao = trecho.rfind(b"\n>")
+            if posicao != -1:
+                return trecho[posicao + 2:].rstrip(b"\r\n").decode()
+        self._arquivo.seek(0)
+        return self._arquivo.read(fim).rstrip(b"\r\n")[1:].decode()
+
+    def organismo(self, id: str, mapeado: bool = False) -> OrganismoFasta:
+        """
+        Monta um OrganismoFasta cuja sequência é lida do disco sob demanda.
+
+        Args:
+            id (str): Identificador do registro.
+            mapeado (bool): Se True, a sequência é uma SequenciaMapeada (mmap);
+                senão, uma SequenciaIndexada (seek + read).
+        """
+        _, nome = separar_cabecalho(self.cabecalho(id))
+        sequencia = self.mapear(id) if mapeado else self[id]
+        return OrganismoFasta(id=id, nome=nome, sequencia=sequencia)
+
+
+def _indice_atualizado(caminho_do_arquivo, caminho_indice) -> bool:
+    try:
+        return os.path.getmtime(caminho_indice) >= os.path.getmtime(caminho_do_arquivo)
+    except OSError:
+        return False
+
+
+class SequenciaIndexada(Sequencia):
+    """
+    Sequencia cujas bases ficam no arquivo FASTA e são lidas sob demanda pelo FastaIndex.
+
+    len() vem do índice, e o acesso por posição ou fatia lê só os bytes pedidos.
+    Os demais métodos de Sequencia funcionam normalmente, lendo a sequência inteira
+    quando precisam dela.
+    """
+
+    def __init__(self, indice: FastaIndex, entrada: EntradaIndice):
+        self.indice = indice
+        self.entrada = entrada
+
+    @property
+    def sequencia(self) -> str:
+        return self.indice.buscar(self.entrada.id)
+
+    def __repr__(self):
+        return f"SequenciaIndexada({self.entrada.id!r}, comprimento={len(self)})"
+
+    def __len__(self):
+        return self.entrada.comprimento
+
+    def __iter__(self):
+        passo = max(self.entrada.bases_por_linha, 1) * 1024
+        for inicio in range(0, len(self), passo):
+            yield from self.indice.buscar(self.entrada.id, inicio, inicio + passo)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            inicio, fim, passo = index.indices(len(self))
+            if passo == 1:
+                return self.indice.buscar(self.entrada.id, inicio, fim)
+            return self.sequencia[index]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("índice fora da sequência")
+        return self.indice.buscar(self.entrada.id, index, index + 1)
@@ -0,0 +1,201 @@
+"""
+Índice de busca de motivos (FM-index) sobre todas as sequências de uma coleção.
+
+As sequências são concatenadas, cada uma terminada por um separador, e codificadas
+num alfabeto de 6 símbolos (separador, A, C, G, T e "outra base"). O índice guarda:
+
+- o suffix array do texto, ordenado por prefix doubling com NumPy;
+- a BWT (transformada de Burrows-Wheeler) e contagens acumuladas de cada símbolo
+  a cada PASSO_CONTAGENS posições, para a busca retroativa (backward search).
+
+Uma busca percorre o motivo de trás para a frente, com duas consultas de contagem
+por base, até obter a faixa do suffix array com todas as ocorrências: o custo
+depende do tamanho do motivo, não da coleção. As posições vêm direto do suffix array.
+Requer NumPy.
+"""
+import json
+
+import numpy as np
+
+PASSO_CONTAGENS = 128
+
+_SEPARADOR = 0
+_OUTRA = 5
+_SIMBOLOS = 6
+_MAXIMO_CHAVE_UNICA = 2 ** 31  # n * (n + 2) + n ainda cabe em int64
+
+_CODIGO = np.full(256, _OUTRA, dtype=np.uint8)
+for _codigo, _base in enumerate("ACGT", start=1):
+    _CODIGO[ord(_base)] = _codigo
+    _CODIGO[ord(_base.lower())] = _codigo
+_CODIGO[0] = _SEPARADOR
+
+
+class IndiceMotivos:
+    """
+    FM-index de uma coleção de sequências, para buscas exatas de motivos (primers, sondas...).
+
+    É construído uma vez (construir), pode ser salvo em disco (salvar / carregar)
+    e responde a contar(motivo) e buscar(motivo). Os motivos devem conter só A, C,
+    G e T (maiúsculas ou minúsculas); ocorrências que atravessam bases ambíguas ou
+    o limite entre dois registros não são encontradas.
+
+    Exemplo:
+        indice = IndiceMotivos.construir(ler_fasta("arquivos/Flaviviridae-genomes.fasta"))
+        indice.salvar("arquivos/flaviviridae.motivos.npz")
+        indice.buscar("ATGAAAAACCC")  -> [('NC_035889.1', 107), ('NC_029055.1', 0), ...]
+    """
+
+    def __init__(self, ids: list[str], inicios: np.ndarray, sufixos: np.ndarray,
+                 bwt: np.ndarray, contagens: np.ndarray, primeiros: np.ndarray):
+        self.ids = ids
+        self.inicios = inicios
+        self.sufixos = sufixos
+        self.bwt = bwt
+        self.contagens = contagens
+        self.primeiros = primeiros
+
+    @classmethod
+    def construir(cls, organismos) -> "IndiceMotivos":
+        """
+        Constrói o índice a partir de uma coleção de OrganismoFasta (lista ou iter_fasta).
+        """
+        ids = []
+        partes = []
+        for organismo in organismos:
+            ids.append(organismo.id)
+            partes.append(str(organismo.sequencia).encode("ascii", "replace"))
+            partes.append(b"\0")
+
+        texto = _CODIGO[np.frombuffer(b"".join(partes), dtype=np.uint8)]
+
+        comprimentos = np.array([len(parte) + 1 for parte in partes[::2]], dtype=np.int64)
+        inicios = np.concatenate(([0], np.cumsum(comprimentos)[:-1]))
+
+        sufixos = _ordenar_sufixos(texto)
+        bwt = texto[sufixos - 1]  # em sufixos == 0, o índice -1 é o último separador
+
+        marcas = np.zeros((len(bwt) // PASSO_CONTAGENS + 1, _SIMBOLOS), dtype=sufixos.dtype)
+        for simbolo in range(_SIMBOLOS):
+            acumulado = np.cumsum(bwt == simbolo, dtype=sufixos.dtype)
+            marcas[1:, simbolo] = acumulado[PASSO_CONTAGENS - 1::PASSO_CONTAGENS]
+
+        primeiros = np.concatenate(([0], np.cumsum(np.bincount(texto, minlength=_SIMBOLOS))))
+        return cls(ids, inicios, sufixos, bwt, marcas, primeiros[:-1])
+
+    @classmethod
+    def carregar(cls, caminho) -> "IndiceMotivos":
+        """Lê um índice gravado por salvar()."""
+        with np.load(caminho) as dados:
+            return cls(
+                ids=json.loads(dados["ids"].tobytes()),
+                inicios=dados["inicios"],
+                sufixos=dados["sufixos"],
+                bwt=dados["bwt"],
+                contagens=dados["contagens"],
+                primeiros=dados["primeiros"],
+            )
+
+    def salvar(self, caminho):
+        """Grava o índice num arquivo .npz (sem compressão, para carregar rápido)."""
+        np.savez(
+            caminho,
+            ids=np.frombuffer(json.dumps(self.ids).encode(), dtype=np.uint8),
+            inicios=self.inicios,
+            sufixos=self.sufixos,
+            bwt=self.bwt,
+            contagens=self.contagens,
+            primeiros=self.primeiros,
+        )
+
+    def __repr__(self):
+        return f"IndiceMotivos(registros={len(self.ids)}, bases={len(self.bwt) - len(self.ids)})"
+
+    def contar(self, motivo: str) -> int:
+        """
+        Número de ocorrências do motivo na coleção (sem listar as posições).
+        """
+        inicio, fim = self._faixa(motivo)
+        return fim - inicio
+
+    def buscar(self, motivo: str) -> list[tuple[str, int]]:
+        """
+        Encontra todas as ocorrências exatas do motivo.
+
+        Args:
+            motivo (str): Sequência a procurar (A, C, G, T).
+
+        Returns:
+            list[tuple[str, int]]: Pares (id do registro, posição 0-based), na ordem
+            dos registros e das posições.
+        """
+        inicio, fim = self._faixa(motivo)
+        posicoes = np.sort(self.sufixos[inicio:fim])
+        registros = np.searchsorted(self.inicios, posicoes, side="right") - 1
+        return [
+            (self.ids[registro], posicao)
+            for registro, posicao in zip(registros.tolist(),
+                                         (posicoes - self.inicios[registros]).tolist())
+        ]
+
+    def _faixa(self, motivo: str) -> tuple[int, int]:
+        """Faixa [inicio, fim) do suffix array com os sufixos que começam pelo motivo."""
+        codigos = _CODIGO[np.frombuffer(motivo.encode("ascii", "replace"), dtype=np.uint8)]
+        if len(codigos) == 0 or (codigos == _OUTRA).any():
+            return 0, 0
+
+        inicio, fim = 0, len(self.bwt)
+        for simbolo in reversed(codigos.tolist()):
+            inicio = self.primeiros[simbolo] + self._ocorrencias(simbolo, inicio)
+            fim = self.primeiros[simbolo] + self._ocorrencias(simbolo, fim)
+            if inicio >= fim:
+                return 0, 0
+        return int(inicio), int(fim)
+
+    def _ocorrencias(self, simbolo: int, posicao: int) -> int:
+        """Quantas vezes `simbolo` aparece em bwt[:posicao]."""
+        marca, resto = divmod(posicao, PASSO_CONTAGENS)
+        inicio = marca * PASSO_CONTAGENS
+        return int(self.contagens[marca, simbolo]) + int(
+            np.count_nonzero(self.bwt[inicio:inicio + resto] == simbolo))
+
+
+def _ordenar_sufixos(texto: np.ndarray) -> np.ndarray:
+    """
+    Suffix array por prefix doubling: a cada rodada, os sufixos são ordenados pelos
+    primeiros 2k símbolos a partir da ordem pelos primeiros k.
+    """
+    n = len(texto)
+    tipo = np.int32 if n < 2 ** 31 else np.int64
+    if n == 0:
+        return np.empty(0, dtype=tipo)
+    ordem = texto.astype(np.int64) + 1  # 0 fica reservado para "depois do fim"
+    k = 1
+    while True:
+        seguinte = np.zeros(n, dtype=np.int64)
+        seguinte[:max(n - k, 0)] = ordem[k:]
+        sufixos, mudou = _ordenar_pares(ordem, seguinte)
+        ordem = np.empty(n, dtype=np.int64)
+        ordem[sufixos] = np.cumsum(np.concatenate(([1], mudou)))
+        if ordem.max() == n or k >= n:
+            return sufixos.astype(tipo)
+        k *= 2
+
+
+def _ordenar_pares(ordem: np.ndarray, seguinte: np.ndarray):
+    """
+    Ordena os pares (ordem, seguinte) e marca onde o par muda em relação ao anterior.
+
+    Enquanto ordem * (n + 2) + seguinte cabe em 64 bits, os pares viram uma única
+    chave (uma ordenação só, mais rápida); acima disso, usa np.lexsort.
+    """
+    n = len(ordem)
+    if n < _MAXIMO_CHAVE_UNICA:
+        chave = ordem * (n + 2) + seguinte
+        sufixos = np.argsort(chave, kind="stable")
+        chave = chave[sufixos]
+        return sufixos, chave[1:] != chave[:-1]
+
+    sufixos = np.lexsort((seguinte, ordem))
+    ordem, seguinte = ordem[sufixos], seguinte[sufixos]
+    return sufixos, (ordem[1:] != ordem[:-1]) | (seguinte[1:] != seguinte[:-1])
@@ -0,0 +1,278 @@
+"""
+Instrumentação opcional das operações principais: leitura, OrganismoFasta e Sequencia.
+
+Quando ativada, as funções e métodos medidos são trocados por versões que contam
+chamadas, tempo (inclusivo: uma operação que chama outra soma o tempo das duas),
+bases processadas e, opcionalmente, a memória líquida alocada (tracemalloc).
+Só contam bases as operações que de fato as percorrem: as visões preguiçosas
+(complementar, transcrever...) e a criação de OrganismoFasta ficam sem bases, e
+composicao, calcular_percentual e conteudo_gc só contam quando a composição
+ainda não estava guardada na sequência.
+Desativada, as funções originais são restauradas, então não há custo algum.
+
+São medidos:
+    - "ler_fasta": o agrupamento das linhas em registros (bio.ler_fasta.ler_registros,
+      usado por ler_fasta, iter_fasta e executar_em_fragmentos); cada registro
+      gerado conta como uma chamada;
+    - "carregar_cache": a leitura do cache binário por ler_fasta(cache=True);
+    - "OrganismoFasta": a criação de cada registro;
+    - os métodos de Sequencia (e das subclasses já importadas) listados em METODOS.
+
+Só o processo atual é medido: o trabalho feito em processos de bio.paralelo não
+entra no relatório.
+
+Exemplo:
+    with instrumentar() as medicao:
+        for organismo in ler_fasta(caminho):
+            organismo.sequencia.traduzir()
+    print(medicao.relatorio())
+
+    # ou, nos scripts: BIO_INSTRUMENTAR=1 python main.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+
+import bio.ler_fasta
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+
+VARIAVEL_AMBIENTE = "BIO_INSTRUMENTAR"
+
+METODOS = (
+    "complementar",
+    "complementar_reversa",
+    "transcrever",
+    "reverter",
+    "traduzir",
+    "calcular_percentual",
+    "composicao",
+    "conteudo_gc",
+    "encontrar_orfs",
+    "contar_kmers",
+    "perfil_janelas",
+)
+
+# Métodos que só criam uma visão preguiçosa: não percorrem bases.
+_VISOES = {"complementar", "complementar_reversa", "transcrever", "reverter"}
+# Métodos que percorrem bases só quando a composição ainda não foi calculada.
+_USAM_COMPOSICAO = {"calcular_percentual", "composicao", "conteudo_gc"}
+
+
+class EstatisticaOperacao:
+    """
+    Totais acumulados de uma operação.
+
+    Atributos:
+        chamadas (int): Número de chamadas.
+        segundos (float): Tempo total, em segundos.
+        bases (int | None): Bases processadas (comprimento das sequências percorridas);
+            None para operações que não percorrem bases.
+        memoria (int): Memória líquida alocada, em bytes (só com memoria=True).
+    """
+
+    def __init__(self, conta_bases: bool = True):
+        self.chamadas = 0
+        self.segundos = 0.0
+        self.bases = 0 if conta_bases else None
+        self.memoria = 0
+
+    def __repr__(self):
+        return (f"EstatisticaOperacao(chamadas={self.chamadas}, segundos={self.segundos:.6f}, "
+                f"bases={self.bases}, memoria={self.memoria})")
+
+    def como_dict(self) -> dict:
+        return {"chamadas": self.chamadas, "segundos": self.segundos,
+                "bases": self.bases, "memoria": self.memoria}
+
+
+class Instrumentacao:
+    """
+    Conjunto de medições ativo: troca as operações por versões medidas e guarda os totais.
+
+    Use ativar()/desativar() ou a função instrumentar() num bloco with.
+    """
+
+    def __init__(self, memoria: bool = False):
+        self.memoria = memoria
+        self.estatisticas: dict[str, EstatisticaOperacao] = {}
+        self._originais = []
+
+    @property
+    def ativa(self) -> bool:
+        return bool(self._originais)
+
+    def ativar(self):
+        """Substitui as operações medidas pelas versões instrumentadas."""
+        if self.ativa:
+            return
+        if self.memoria and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+        self._trocar(bio.ler_fasta, "ler_registros",
+                     self._medir_gerador("ler_fasta", bio.ler_fasta.ler_registros))
+        self._trocar(bio.ler_fasta, "carregar_cache",
+                     self._medir("carregar_cache", bio.ler_fasta.carregar_cache))
+        self._trocar(OrganismoFasta, "__init__",
+                     self._medir("OrganismoFasta", OrganismoFasta.__init__))
+        for classe in _com_subclasses(Sequencia):
+            for nome in METODOS:
+                if nome in vars(classe):
+                    self._trocar(classe, nome,
+                                 self._medir(nome, vars(classe)[nome], _contador_de_bases(nome)))
+
+    def desativar(self):
+        """Restaura as operações originais (as estatísticas são mantidas)."""
+        for alvo, nome, original in reversed(self._originais):
+            setattr(alvo, nome, original)
+        self._originais = []
+        if self.memoria and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def zerar(self):
+        """Descarta as estatísticas acumuladas."""
+        self.estatisticas = {}
+
+    def instantaneo(self) -> dict[str, dict]:
+        """
+        Retorna uma cópia dos totais de cada operação chamada, da mais para a menos demorada.
+
+        Exemplo:
+            medicao.instantaneo()["traduzir"]
+                -> {'chamadas': 159, 'segundos': 0.21, 'bases': 1655527, 'memoria': 0}
+        """
+        ordenadas = sorted(self.estatisticas.items(), key=lambda item: -item[1].segundos)
+        return {nome: estatistica.como_dict() for nome, estatistica in ordenadas
+                if estatistica.chamadas}
+
+    def relatorio(self) -> str:
+        """Tabela de texto com os totais de cada operação (a mais demorada primeiro)."""
+        linhas = [f"{'operação':<24}{'chamadas':>10}{'segundos':>12}{'bases/s':>14}{'memória':>14}"]
+        for nome, totais in self.instantaneo().items():
+            if totais["bases"] is None:
+                por_segundo = ""
+            else:
+                por_segundo = f"{totais['bases'] / totais['segundos'] if totais['segundos'] else 0:.3g}"
+            linhas.append(f"{nome:<24}{totais['chamadas']:>10}{totais['segundos']:>12.4f}"
+                          f"{por_segundo:>14}{totais['memoria']:>14}")
+        return "\n".join(linhas)
+
+    def __enter__(self):
+        self.ativar()
+        return self
+
+    def __exit__(self, *exc):
+        self.desativar()
+
+    def _estatistica(self, nome: str, conta_bases: bool = True) -> EstatisticaOperacao:
+        if nome not in self.estatisticas:
+            self.estatisticas[nome] = EstatisticaOperacao(conta_bases)
+        return self.estatisticas[nome]
+
+    def _trocar(self, alvo, nome: str, substituto):
+        self._originais.append((alvo, nome, vars(alvo)[nome]))
+        setattr(alvo, nome, substituto)
+
+    def _medir(self, nome: str, funcao, bases_processadas=None):
+        """
+        bases_processadas(args, kwargs) é avaliada antes da chamada (para ver o
+        estado da sequência antes de a operação guardar algo nela); sem ela, a
+        operação não conta bases.
+        """
+        estatistica = self._estatistica(nome, bases_processadas is not None)
+        memoria = self.memoria
+
+        @wraps(funcao)
+        def medida(*args, **kwargs):
+            bases = bases_processadas(args, kwargs) if bases_processadas else 0
+            antes = tracemalloc.get_traced_memory()[0] if memoria else 0
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                estatistica.segundos += time.perf_counter() - inicio
+                estatistica.chamadas += 1
+                if bases_processadas:
+                    estatistica.bases += bases
+                if memoria:
+                    estatistica.memoria += tracemalloc.get_traced_memory()[0] - antes
+
+        return medida
+
+    def _medir_gerador(self, nome: str, funcao):
+        estatistica = self._estatistica(nome)
+        memoria = self.memoria
+
+        @wraps(funcao)
+        def medida(*args, **kwargs):
+            gerador = funcao(*args, **kwargs)
+            while True:
+                antes = tracemalloc.get_traced_memory()[0] if memoria else 0
+                inicio = time.perf_counter()
+                try:
+                    organismo = next(gerador)
+                except StopIteration:
+                    return
+                finally:
+                    estatistica.segundos += time.perf_counter() - inicio
+                    if memoria:
+                        estatistica.memoria += tracemalloc.get_traced_memory()[0] - antes
+                estatistica.chamadas += 1
+                estatistica.bases += len(organismo.sequencia)
+                yield organismo
+
+        return medida
+
+
+def instrumentar(memoria: bool = False) -> Instrumentacao:
+    """
+    Cria uma Instrumentacao para usar num bloco with (ativa na entrada, desativa na saída).
+    """
+    return Instrumentacao(memoria)
+
+
+@contextmanager
+def relatorio_se_pedido(saida=sys.stderr):
+    """
+    Instrumenta o bloco e imprime o relatório no final, só se a variável de ambiente
+    BIO_INSTRUMENTAR estiver definida (com "memoria", mede também a memória).
+    Sem a variável, não faz nada.
+
+    Exemplo:
+        with relatorio_se_pedido():
+            main()
+    """
+    pedido = os.environ.get(VARIAVEL_AMBIENTE)
+    if not pedido:
+        yield None
+        return
+
+    with instrumentar(memoria=pedido == "memoria") as medicao:
+        yield medicao
+    print(medicao.relatorio(), file=saida)
+
+
+def _com_subclasses(classe) -> list[type]:
+    classes = [classe]
+    for subclasse in classe.__subclasses__():
+        classes.extend(_com_subclasses(subclasse))
+    return classes
+
+
+def _contador_de_bases(nome: str):
+    if nome in _VISOES:
+        return None
+    if nome in _USAM_COMPOSICAO:
+        return _bases_sem_composicao
+    return _bases
+
+
+def _bases(args, kwargs) -> int:
+    return len(args[0])
+
+
+def _bases_sem_composicao(args, kwargs) -> int:
+    return len(args[0]) if args[0]._composicao is None else 0
@@ -0,0 +1,103 @@
+"""
+Perfis de composição em janelas deslizantes: conteúdo GC, skew GC/AT e skew acumulado.
+
+As contagens de A, C, G e T de qualquer janela saem da diferença entre duas posições
+das somas acumuladas de cada base, calculadas uma única vez. O perfil inteiro custa
+O(n), qualquer que seja o tamanho da janela ou do passo. Requer NumPy.
+"""
+import numpy as np
+
+from bio.traducao import codificar
+
+JANELA_PADRAO = 1000
+
+
+class PerfilJanelas:
+    """
+    Composição de cada janela de uma sequência.
+
+    Atributos:
+        janela (int): Tamanho das janelas, em bases.
+        passo (int): Distância entre o início de duas janelas consecutivas.
+        inicios (np.ndarray): Posição (0-based) da primeira base de cada janela.
+        gc (np.ndarray): Fração de G + C em cada janela.
+        skew_gc (np.ndarray): (G - C) / (G + C) em cada janela (0 onde não há G nem C).
+        skew_at (np.ndarray): (A - T) / (A + T) em cada janela (0 onde não há A nem T).
+        skew_acumulado (np.ndarray): Soma acumulada de skew_gc ao longo das janelas;
+            o mínimo e o máximo costumam marcar a origem e o término da replicação.
+
+    Exemplo:
+        perfil = Sequencia("GGGGCCAT").perfil_janelas(4, passo=2)
+        perfil.inicios -> array([0, 2, 4])
+        perfil.gc      -> array([1. , 1. , 0.5])
+        perfil.skew_gc -> array([1. , 0. , -1.])
+    """
+
+    def __init__(self, janela: int, passo: int, inicios: np.ndarray, gc: np.ndarray,
+                 skew_gc: np.ndarray, skew_at: np.ndarray):
+        self.janela = janela
+        self.passo = passo
+        self.inicios = inicios
+        self.gc = gc
+        self.skew_gc = skew_gc
+        self.skew_at = skew_at
+        self.skew_acumulado = np.cumsum(skew_gc)
+
+    def __repr__(self):
+        return f"PerfilJanelas(janela={self.janela}, passo={self.passo}, janelas={len(self)})"
+
+    def __len__(self):
+        return len(self.inicios)
+
+
+def perfil_janelas(sequencia, janela: int = JANELA_PADRAO, passo: int | None = None) -> PerfilJanelas:
+    """
+    Calcula o perfil de composição das janelas completas de uma sequência.
+
+    Args:
+        sequencia (Sequencia | str): Sequência de DNA.
+        janela (int): Tamanho de cada janela, em bases.
+        passo (int): Distância entre janelas. Padrão: igual à janela (sem sobreposição).
+
+    Returns:
+        PerfilJanelas: Arrays com um valor por janela.
+    """
+    passo = passo or janela
+    if janela <= 0 or passo <= 0:
+        raise ValueError("janela e passo devem ser positivos")
+
+    codigos = codificar(str(sequencia))
+    inicios = np.arange(0, len(codigos) - janela + 1, passo)
+    fins = inicios + janela
+
+    contagens = {}
+    for codigo, base in enumerate("ACGT"):
+        acumulado = np.concatenate(([0], np.cumsum(codigos == codigo, dtype=np.int64)))
+        contagens[base] = acumulado[fins] - acumulado[inicios]
+
+    a, c, g, t = (contagens[base] for base in "ACGT")
+    return PerfilJanelas(
+        janela,
+        passo,
+        inicios,
+        gc=(g + c) / janela,
+        skew_gc=_skew(g, c),
+        skew_at=_skew(a, t),
+    )
+
+
+def perfis_colecao(organismos, janela: int = JANELA_PADRAO,
+                   passo: int | None = None) -> dict[str, PerfilJanelas]:
+    """
+    Calcula perfil_janelas para cada OrganismoFasta de uma coleção (lista ou iter_fasta).
+
+    Returns:
+        dict[str, PerfilJanelas]: Perfil de cada organismo, indexado pelo id.
+    """
+    return {organismo.id: perfil_janelas(organismo.sequencia, janela, passo)
+            for organismo in organismos}
+
+
+def _skew(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    total = x + y
+    return np.divide(x - y, total, out=np.zeros(len(total)), where=total > 0)
@@ -0,0 +1,239 @@
+"""
+Contagem de k-mers em sequências e coleções.
+
+Cada k-mer é codificado como um inteiro de 2 bits por base (A=0, C=1, G=2, T=3,
+a primeira base nos bits mais altos), calculado para todas as janelas de uma vez
+a partir dos códigos de bio.traducao. Janelas com bases ambíguas (N, R, Y...) são
+descartadas. Para k pequeno as contagens saem de um np.bincount sobre as 4**k
+possibilidades; para k grande, de uma ordenação dos códigos (np.unique), que só
+guarda os k-mers presentes. Requer NumPy.
+"""
+import numpy as np
+
+from bio.traducao import BASES, codificar
+
+K_MAXIMO = 32
+K_MAXIMO_BINCOUNT = 10
+
+_REGISTROS_POR_JUNCAO = 64
+
+
+class ContagemKmers:
+    """
+    Contagens de k-mers, guardadas como códigos inteiros ordenados e suas ocorrências.
+
+    Atributos:
+        k (int): Tamanho dos k-mers.
+        canonico (bool): Se cada k-mer foi somado ao seu complementar reverso.
+        codigos (np.ndarray): Códigos (uint64) dos k-mers presentes, em ordem crescente.
+        contagens (np.ndarray): Ocorrências (int64) de cada código.
+
+    Indexar com um k-mer devolve as suas ocorrências; k-mers com bases ambíguas
+    valem 0 (essas janelas não são contadas), e um k-mer de tamanho diferente de k
+    é um erro.
+
+    Exemplo:
+        contagem = Sequencia("ATGATGA").contar_kmers(3)
+        contagem["ATG"]                -> 2
+        contagem["ANG"]                -> 0
+        contagem.mais_frequentes(1)    -> [('ATG', 2)]
+    """
+
+    def __init__(self, k: int, codigos: np.ndarray, contagens: np.ndarray, canonico: bool = False):
+        self.k = k
+        self.canonico = canonico
+        self.codigos = codigos
+        self.contagens = contagens
+
+    def __repr__(self):
+        return f"ContagemKmers(k={self.k}, distintos={len(self)}, total={self.total})"
+
+    def __len__(self):
+        return len(self.codigos)
+
+    def __iter__(self):
+        for codigo, contagem in zip(self.codigos.tolist(), self.contagens.tolist()):
+            yield decodificar_kmer(codigo, self.k), contagem
+
+    def __getitem__(self, kmer: str) -> int:
+        if len(kmer) != self.k:
+            raise ValueError(f"O k-mer {kmer!r} tem {len(kmer)} bases, e a contagem é de k={self.k}")
+        if not set(kmer.upper()) <= set(BASES):
+            return 0
+        codigo = codificar_kmer(kmer)
+        if self.canonico:
+            codigo = min(codigo, codificar_kmer(_complementar_reverso(kmer)))
+        posicao = np.searchsorted(self.codigos, codigo)
+        if posicao < len(self.codigos) and self.codigos[posicao] == codigo:
+            return int(self.contagens[posicao])
+        return 0
+
+    @property
+    def total(self) -> int:
+        """Número de janelas contadas (sem as que têm bases ambíguas)."""
+        return int(self.contagens.sum())
+
+    def mais_frequentes(self, n: int = 10) -> list[tuple[str, int]]:
+        """
+        Retorna os `n` k-mers mais frequentes, do mais para o menos frequente.
+
+        Empates são desfeitos pela ordem alfabética do k-mer.
+        """
+        n = min(n, len(self))
+        if n <= 0:
+            return []
+        selecionados = np.argpartition(-self.contagens, n - 1)[:n]
+        selecionados = selecionados[np.lexsort((self.codigos[selecionados],
+                                                -self.contagens[selecionados]))]
+        return [(decodificar_kmer(int(self.codigos[i]), self.k), int(self.contagens[i]))
+                for i in selecionados]
+
+    def como_dict(self) -> dict[str, int]:
+        """Converte as contagens num dicionário k-mer -> ocorrências."""
+        return dict(self)
+
+
+def contar_kmers(sequencia, k: int, canonico: bool = False) -> ContagemKmers:
+    """
+    Conta os k-mers de uma sequência, ignorando janelas com bases ambíguas.
+
+    Args:
+        sequencia (Sequencia | str): Sequência de DNA.
+        k (int): Tamanho dos k-mers (1 a 32).
+        canonico (bool): Se True, cada k-mer é contado junto com o seu complementar
+            reverso, sob o menor dos dois (contagem independente da fita).
+
+    Returns:
+        ContagemKmers: Ocorrências de cada k-mer presente.
+
+    Exemplo:
+        contar_kmers("AAGCTT", 2).como_dict()
+            -> {'AA': 1, 'AG': 1, 'CT': 1, 'GC': 1, 'TT': 1}
+        contar_kmers("AAGCTT", 2, canonico=True).como_dict()
+            -> {'AA': 2, 'AG': 2, 'GC': 1}
+    """
+    _validar_k(k)
+    codigos = codigos_de_kmers(sequencia, k, canonico)
+    if k <= K_MAXIMO_BINCOUNT:
+        return _de_histograma(k, np.bincount(codigos.astype(np.intp), minlength=4 ** k), canonico)
+    codigos, contagens = np.unique(codigos, return_counts=True)
+    return ContagemKmers(k, codigos, contagens.astype(np.int64), canonico)
+
+
+def contar_kmers_colecao(organismos, k: int, canonico: bool = False) -> ContagemKmers:
+    """
+    Soma as contagens de k-mers de todos os OrganismoFasta de uma coleção (lista ou iter_fasta).
+
+    Para k pequeno, as contagens de cada registro são acumuladas num único histograma;
+    para k grande, as contagens parciais são juntadas a cada poucos registros, então
+    a memória depende do número de k-mers distintos e não do tamanho da coleção.
+
+    Exemplo:
+        contar_kmers_colecao(ler_fasta(caminho), 8, canonico=True).mais_frequentes(5)
+    """
+    _validar_k(k)
+    if k <= K_MAXIMO_BINCOUNT:
+        histograma = np.zeros(4 ** k, dtype=np.int64)
+        for organismo in organismos:
+            codigos = codigos_de_kmers(organismo.sequencia, k, canonico)
+            histograma += np.bincount(codigos.astype(np.intp), minlength=4 ** k)
+        return _de_histograma(k, histograma, canonico)
+
+    acumulado = (np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64))
+    parciais = []
+    for organismo in organismos:
+        codigos, contagens = np.unique(codigos_de_kmers(organismo.sequencia, k, canonico),
+                                       return_counts=True)
+        parciais.append((codigos, contagens))
+        if len(parciais) == _REGISTROS_POR_JUNCAO:
+            acumulado = _juntar([acumulado, *parciais])
+            parciais = []
+    codigos, contagens = _juntar([acumulado, *parciais])
+    return ContagemKmers(k, codigos, contagens, canonico)
+
+
+def codigos_de_kmers(sequencia, k: int, canonico: bool = False) -> np.ndarray:
+    """
+    Calcula o código (uint64) do k-mer de cada janela sem bases ambíguas, na ordem da sequência.
+
+    Exemplo:
+        codigos_de_kmers("ACGNAC", 2) -> array([1, 6, 1], dtype=uint64)
+    """
+    bases = codificar(str(sequencia))
+    n = len(bases) - k + 1
+    if n <= 0:
+        return np.empty(0, dtype=np.uint64)
+
+    ambiguas = np.concatenate(([0], np.cumsum(bases > 3)))
+    validas = ambiguas[k:] == ambiguas[:-k]
+
+    bases = np.minimum(bases, 3).astype(np.uint64)
+    codigos = np.zeros(n, dtype=np.uint64)
+    for deslocamento in range(k):
+        codigos <<= np.uint64(2)
+        codigos |= bases[deslocamento:deslocamento + n]
+
+    if canonico:
+        reversos = np.zeros(n, dtype=np.uint64)
+        complementos = np.uint64(3) - bases
+        for deslocamento in reversed(range(k)):
+            reversos <<= np.uint64(2)
+            reversos |= complementos[deslocamento:deslocamento + n]
+        codigos = np.minimum(codigos, reversos)
+
+    return codigos[validas]
+
+
+def codificar_kmer(kmer: str) -> int:
+    """
+    Raises:
+        ValueError: Se o k-mer tiver bases fora de ACGT.
+
+    Exemplo:
+        codificar_kmer("ACGT") -> 27
+    """
+    codigo = 0
+    for base in kmer.upper():
+        if base not in BASES:
+            raise ValueError(f"Base inválida no k-mer {kmer!r}: {base!r} (use A, C, G ou T)")
+        codigo = codigo * 4 + BASES.index(base)
+    return codigo
+
+
+def decodificar_kmer(codigo: int, k: int) -> str:
+    """
+    Exemplo:
+        decodificar_kmer(27, 4) -> "ACGT"
+    """
+    bases = []
+    for _ in range(k):
+        codigo, resto = divmod(codigo, 4)
+        bases.append(BASES[resto])
+    return "".join(reversed(bases))
+
+
+def _complementar_reverso(kmer: str) -> str:
+    return kmer.upper().translate(str.maketrans("ACGT", "TGCA"))[::-1]
+
+
+def _de_histograma(k: int, histograma: np.ndarray, canonico: bool) -> ContagemKmers:
+    presentes = np.flatnonzero(histograma)
+    return ContagemKmers(k, presentes.astype(np.uint64), histograma[presentes].astype(np.int64),
+                         canonico)
+
+
+def _juntar(partes) -> tuple[np.ndarray, np.ndarray]:
+    codigos = np.concatenate([codigos for codigos, _ in partes])
+    contagens = np.concatenate([contagens for _, contagens in partes]).astype(np.int64)
+    if len(codigos) == 0:
+        return codigos, contagens
+
+    ordem = np.argsort(codigos, kind="stable")
+    codigos, contagens = codigos[ordem], contagens[ordem]
+    inicios = np.flatnonzero(np.concatenate(([True], codigos[1:] != codigos[:-1])))
+    return codigos[inicios], np.add.reduceat(contagens, inicios)
+
+
+def _validar_k(k: int):
+    if not 1 <= k <= K_MAXIMO:
+        raise ValueError(f"k deve estar entre 1 e {K_MAXIMO}, não {k}")
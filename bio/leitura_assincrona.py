@@ -0,0 +1,127 @@
+"""
+Leitura assíncrona de vários arquivos FASTA ao mesmo tempo, com asyncio.
+
+Cada arquivo é lido por iter_fasta numa thread (asyncio.to_thread), em lotes de
+registros, de modo que a espera pelo disco ou pela descompressão não bloqueia o
+loop de eventos. Os registros de todos os arquivos vão para uma única asyncio.Queue
+limitada: quando ela enche, os leitores esperam os consumidores (contrapressão),
+e a memória fica limitada ao tamanho da fila mais um lote por arquivo.
+
+Exemplo:
+    async def gc(organismo):
+        return organismo.id, organismo.sequencia.conteudo_gc()
+
+    resultados = asyncio.run(processar(["a.fasta", "b.fasta.gz"], gc, consumidores=4))
+"""
+import asyncio
+from itertools import islice
+
+from bio.ler_fasta import iter_fasta
+
+TAMANHO_FILA = 256
+TAMANHO_LOTE = 64
+
+FIM = None
+
+
+async def produzir(caminho_do_arquivo, fila: asyncio.Queue, tamanho_lote: int = TAMANHO_LOTE) -> int:
+    """
+    Lê um arquivo FASTA numa thread e coloca cada OrganismoFasta na fila.
+
+    Returns:
+        int: Número de registros lidos.
+    """
+    registros = iter_fasta(caminho_do_arquivo)
+    total = 0
+    while True:
+        lote = await asyncio.to_thread(lambda: list(islice(registros, tamanho_lote)))
+        if not lote:
+            return total
+        for organismo in lote:
+            await fila.put(organismo)
+        total += len(lote)
+
+
+async def ingerir(caminhos, fila: asyncio.Queue, consumidores: int = 1,
+                  tamanho_lote: int = TAMANHO_LOTE) -> int:
+    """
+    Lê todos os arquivos ao mesmo tempo, colocando os registros na fila.
+
+    Ao terminar (mesmo com erro de leitura), coloca um FIM na fila para cada
+    consumidor. Se a própria tarefa for cancelada, não coloca: quem cancelou já
+    está encerrando os consumidores, e a fila cheia bloquearia o cancelamento.
+
+    Args:
+        caminhos (iterable[str]): Arquivos FASTA (comprimidos ou não).
+        fila (asyncio.Queue): Fila (de preferência limitada) que recebe os registros.
+        consumidores (int): Quantos FIM colocar no final.
+        tamanho_lote (int): Registros lidos por vez em cada thread.
+
+    Returns:
+        int: Número total de registros lidos.
+    """
+    produtores = [asyncio.create_task(produzir(caminho, fila, tamanho_lote)) for caminho in caminhos]
+    cancelada = False
+    try:
+        return sum(await asyncio.gather(*produtores))
+    except asyncio.CancelledError:
+        cancelada = True
+        raise
+    finally:
+        for produtor in produtores:
+            produtor.cancel()
+        if not cancelada:
+            for _ in range(consumidores):
+                await fila.put(FIM)
+
+
+async def iter_fastas(caminhos, tamanho_fila: int = TAMANHO_FILA,
+                      tamanho_lote: int = TAMANHO_LOTE):
+    """
+    Gerador assíncrono com os registros de vários arquivos, na ordem em que ficam prontos.
+
+    Exemplo:
+        async for organismo in iter_fastas(caminhos):
+            ...
+    """
+    fila = asyncio.Queue(maxsize=tamanho_fila)
+    leitura = asyncio.create_task(ingerir(caminhos, fila, 1, tamanho_lote))
+    try:
+        while (organismo := await fila.get()) is not FIM:
+            yield organismo
+        await leitura
+    finally:
+        leitura.cancel()
+
+
+async def processar(caminhos, analisar, consumidores: int = 4, tamanho_fila: int = TAMANHO_FILA,
+                    tamanho_lote: int = TAMANHO_LOTE) -> list:
+    """
+    Lê vários arquivos e aplica a corrotina `analisar` a cada registro, com vários consumidores.
+
+    Args:
+        caminhos (iterable[str]): Arquivos FASTA.
+        analisar (callable): Função assíncrona que recebe um OrganismoFasta.
+        consumidores (int): Quantas tarefas consomem a fila ao mesmo tempo.
+        tamanho_fila (int): Máximo de registros lidos e ainda não consumidos.
+        tamanho_lote (int): Registros lidos por vez em cada thread.
+
+    Returns:
+        list: Os resultados de `analisar`, na ordem em que foram concluídos.
+    """
+    fila = asyncio.Queue(maxsize=tamanho_fila)
+    resultados = []
+
+    async def consumir():
+        while (organismo := await fila.get()) is not FIM:
+            resultados.append(await analisar(organismo))
+
+    tarefas = [asyncio.create_task(ingerir(caminhos, fila, consumidores, tamanho_lote))]
+    tarefas += [asyncio.create_task(consumir()) for _ in range(consumidores)]
+    try:
+        await asyncio.gather(*tarefas)
+    finally:
+        for tarefa in tarefas:
+            tarefa.cancel()
+        await asyncio.gather(*tarefas, return_exceptions=True)
+    return resultados
@@ -1,24 +1,107 @@
+from bio.bgzf import abrir_sequencial
+from bio.cache_fasta import carregar_cache, gravar_cache
 from bio.organismo_fasta import OrganismoFasta
 
+TAMANHO_BUFFER = 1 << 20
 
-def ler_fasta(caminho_do_arquivo):
-    organismos = []
-
-    with open(caminho_do_arquivo) as file:
-        lines = file.readlines()
-        for line in lines:
-            if line[0] == ">":
-                id_organismo, nome = line[1:].rstrip().split("|")
-                organismos.append({
-                    "id": id_organismo.strip(),
-                    "nome": nome.strip(),
-                    "sequencia": ""
-                })
-            else:
-                organismos[-1]["sequencia"] += line.rstrip()
-
-    return [OrganismoFasta(
-        id=organismo["id"],
-        nome=organismo["nome"],
-        sequencia=organismo["sequencia"],
-    ) for organismo in organismos]
\ No newline at end of file
+
+def iter_fasta(caminho_do_arquivo, tamanho_buffer: int = TAMANHO_BUFFER):
+    """
+    Lê um arquivo FASTA de forma preguiçosa, gerando um OrganismoFasta por vez.
+
+    O arquivo é lido em binário, em blocos de tamanho limitado, e cada registro é
+    montado juntando as linhas da sequência uma única vez, quando o registro
+    termina (só então a sequência é decodificada). O cabeçalho fica guardado em
+    bytes, como foi lido: id e nome só são decodificados e separados quando
+    acessados. Assim, o consumo de memória depende apenas do maior registro, e
+    não do tamanho do arquivo.
+
+    Arquivos comprimidos com gzip (.fasta.gz) são lidos de forma transparente;
+    no formato BGZF (bgzip), os blocos são descomprimidos em paralelo.
+
+    Args:
+        caminho_do_arquivo (str): Caminho do arquivo FASTA (ou multiFASTA).
+        tamanho_buffer (int): Tamanho, em bytes, do buffer de leitura.
+
+    Yields:
+        OrganismoFasta: Um registro do arquivo, na ordem em que aparece.
+
+    Exemplo:
+        for organismo in iter_fasta("arquivos/Flaviviridae-genomes.fasta"):
+            print(organismo.id, len(organismo.sequencia))
+    """
+    with abrir_sequencial(caminho_do_arquivo, tamanho_buffer) as arquivo:
+        yield from ler_registros(arquivo)
+
+
+def ler_fasta(caminho_do_arquivo, cache: bool = False, caminho_cache=None):
+    """
+    Lê um arquivo FASTA e retorna todos os registros em uma lista.
+
+    Inspirada na SeqIO.parse do BioPython. Para arquivos grandes, prefira
+    iter_fasta, que não mantém todos os registros em memória.
+
+    O cache binário (bio.cache_fasta) é opcional: com cache=True, ou informando
+    caminho_cache, a primeira leitura grava o cache e as seguintes o carregam via
+    mmap, sem processar o texto, enquanto o FASTA não mudar. Se o cache não puder
+    ser gravado (por exemplo, num diretório somente leitura), os registros lidos
+    são retornados normalmente.
+
+    Args:
+        caminho_do_arquivo (str): Caminho do arquivo FASTA (ou multiFASTA).
+        cache (bool): Usa (e cria, se preciso) o cache binário ao lado do arquivo.
+        caminho_cache (str): Onde ler e gravar o cache. Padrão: o FASTA com
+            sufixo ".bioc" (ver bio.cache_fasta.caminho_do_cache).
+
+    Returns:
+        list[OrganismoFasta]: Registros do arquivo, na ordem em que aparecem.
+    """
+    if not cache and caminho_cache is None:
+        return list(iter_fasta(caminho_do_arquivo))
+
+    organismos = carregar_cache(caminho_do_arquivo, caminho_cache)
+    if organismos is None:
+        organismos = list(iter_fasta(caminho_do_arquivo))
+        try:
+            gravar_cache(caminho_do_arquivo, organismos, caminho_cache)
+        except OSError:
+            pass
+    return organismos
+
+
+def ler_registros(linhas):
+    """
+    Agrupa as linhas de um FASTA em registros OrganismoFasta.
+
+    É o parser usado por iter_fasta; serve para qualquer fonte de linhas já aberta
+    (um trecho do arquivo, um socket, um arquivo em memória). Linhas anteriores ao
+    primeiro cabeçalho são ignoradas.
+
+    Args:
+        linhas (iterable[bytes]): Linhas em bytes, com ou sem a quebra de linha.
+
+    Yields:
+        OrganismoFasta: Um registro por cabeçalho, com o cabeçalho guardado em bytes.
+
+    Exemplo:
+        [o.id for o in ler_registros([b">A |um\n", b"ACGT\n", b">B |dois\n", b"GG\n"])]
+            -> ['A', 'B']
+    """
+    cabecalho = None
+    partes = []
+
+    for linha in linhas:
+        if linha.startswith(b">"):
+            if cabecalho is not None:
+                yield _criar_organismo(cabecalho, partes)
+            cabecalho = linha
+            partes = []
+        elif cabecalho is not None:
+            partes.append(linha.rstrip())
+
+    if cabecalho is not None:
+        yield _criar_organismo(cabecalho, partes)
+
+
+def _criar_organismo(cabecalho, partes):
+    return OrganismoFasta.de_cabecalho(cabecalho, b"".join(partes).decode())
@@ -0,0 +1,191 @@
+"""
+Coleção de sequências num único bloco de memória compartilhada entre processos.
+
+Todas as sequências de uma coleção (por exemplo, o resultado de ler_fasta) são
+copiadas uma vez para um bloco multiprocessing.shared_memory, junto com uma tabela
+de offsets e os ids/nomes. Outros processos se anexam ao bloco pelo nome e recebem
+SequenciaMapeada sobre ele, sem serialização e sem cópias por processo.
+
+Layout do bloco:
+    [cabeçalho: assinatura, n, bytes dos metadados, bytes das sequências]
+    [offsets: n + 1 inteiros de 64 bits]
+    [metadados: JSON com [id, nome] de cada registro]
+    [sequências: bases em maiúsculas, contíguas]
+"""
+import json
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia_mapeada import SequenciaMapeada
+
+_ASSINATURA = b"BIOSHM01"
+_CABECALHO = struct.Struct("<8sQQQ")
+
+
+class ColecaoCompartilhada:
+    """
+    Sequências de uma coleção guardadas num bloco de memória compartilhada.
+
+    Quem cria a coleção (criar) é responsável por liberar o bloco, com liberar()
+    ou usando a coleção num bloco with. Os processos de trabalho usam anexar(nome) e recebem visões
+    sem cópia. Antes de fechar, descarte as sequências obtidas da coleção: o
+    bloco não pode ser fechado enquanto houver visões sobre ele.
+
+    Exemplo:
+        with ColecaoCompartilhada.criar(ler_fasta(caminho)) as colecao:
+            nome = colecao.nome            # enviado aos processos
+            ...
+        # em outro processo:
+        colecao = ColecaoCompartilhada.anexar(nome)
+        colecao[0].sequencia[999]          -> 'A'
+    """
+
+    def __init__(self, memoria: SharedMemory, dono: bool = False):
+        self._memoria = memoria
+        self.dono = dono
+        self.nome = memoria.name
+
+        buffer = memoria.buf
+        assinatura, n, tamanho_meta, tamanho_seq = _CABECALHO.unpack_from(buffer, 0)
+        if assinatura != _ASSINATURA:
+            raise ValueError(f"O bloco {self.nome!r} não contém uma ColecaoCompartilhada")
+
+        inicio_offsets = _CABECALHO.size
+        inicio_meta = inicio_offsets + 8 * (n + 1)
+        self._inicio_sequencias = inicio_meta + tamanho_meta
+
+        self.offsets = buffer[inicio_offsets:inicio_meta].cast("Q")
+        registros = json.loads(bytes(buffer[inicio_meta:self._inicio_sequencias]))
+        self.ids = [id for id, _ in registros]
+        self.nomes = [nome for _, nome in registros]
+
+    @classmethod
+    def criar(cls, organismos, nome: str | None = None) -> "ColecaoCompartilhada":
+        """
+        Copia as sequências de uma coleção de OrganismoFasta para um novo bloco compartilhado.
+
+        Args:
+            organismos (iterable[OrganismoFasta]): Registros a copiar.
+            nome (str): Nome do bloco. Padrão: gerado pelo sistema.
+        """
+        organismos = list(organismos)
+        offsets = [0]
+        for organismo in organismos:
+            offsets.append(offsets[-1] + len(organismo.sequencia))
+
+        meta = json.dumps([[o.id, o.nome] for o in organismos]).encode()
+        inicio_offsets = _CABECALHO.size
+        inicio_meta = inicio_offsets + 8 * len(offsets)
+        inicio_sequencias = inicio_meta + len(meta)
+        tamanho = inicio_sequencias + offsets[-1]
+
+        memoria = SharedMemory(name=nome, create=True, size=max(tamanho, 1))
+        buffer = memoria.buf
+        _CABECALHO.pack_into(buffer, 0, _ASSINATURA, len(organismos), len(meta), offsets[-1])
+        struct.pack_into(f"<{len(offsets)}Q", buffer, inicio_offsets, *offsets)
+        buffer[inicio_meta:inicio_sequencias] = meta
+        for organismo, inicio in zip(organismos, offsets):
+            dados = str(organismo.sequencia).encode()
+            buffer[inicio_sequencias + inicio:inicio_sequencias + inicio + len(dados)] = dados
+        del buffer
+
+        return cls(memoria, dono=True)
+
+    @classmethod
+    def anexar(cls, nome: str) -> "ColecaoCompartilhada":
+        """
+        Anexa-se a um bloco criado por outro processo, pelo nome.
+
+        No Python < 3.13 o bloco é registrado no resource_tracker do processo. Processos
+        filhos do criador (como os de executar_compartilhado) compartilham o tracker
+        dele, então isso não tem efeito; já um processo independente deve manter o
+        bloco anexado só enquanto o criador existir.
+        """
+        try:
+            memoria = SharedMemory(name=nome, track=False)
+        except TypeError:  # Python < 3.13 não tem o parâmetro track
+            memoria = SharedMemory(name=nome)
+        return cls(memoria)
+
+    def __repr__(self):
+        return f"ColecaoCompartilhada(nome={self.nome!r}, registros={len(self)})"
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, i: int) -> OrganismoFasta:
+        return OrganismoFasta(id=self.ids[i], nome=self.nomes[i], sequencia=self.sequencia(i))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        # O bloco é removido mesmo que fechar() falhe (BufferError, se ainda houver
+        # visões sobre ele): a memória só é devolvida quando a última visão some.
+        try:
+            self.fechar()
+        finally:
+            if self.dono:
+                self.liberar()
+
+    def sequencia(self, i: int) -> SequenciaMapeada:
+        """
+        Retorna a sequência do registro `i` como uma visão sobre o bloco (sem cópia).
+        """
+        if i < 0:
+            i += len(self)
+        inicio = self._inicio_sequencias + self.offsets[i]
+        return SequenciaMapeada(self._memoria.buf, offset=inicio,
+                                comprimento=self.offsets[i + 1] - self.offsets[i])
+
+    def fechar(self):
+        """Desanexa este processo do bloco."""
+        self.offsets.release()
+        self._memoria.close()
+
+    def liberar(self):
+        """Remove o bloco do sistema (apenas o processo que o criou deve chamar)."""
+        self._memoria.unlink()
+
+
+def executar_compartilhado(funcao, colecao: ColecaoCompartilhada,
+                           trabalhadores: int | None = None, tamanho_lote: int = 8) -> list:
+    """
+    Aplica `funcao` a cada OrganismoFasta da coleção num pool de processos.
+
+    Cada processo se anexa ao bloco uma única vez e recebe apenas faixas de índices;
+    as sequências nunca são serializadas. Os resultados voltam na ordem da coleção.
+
+    Args:
+        funcao (callable): Função de nível de módulo que recebe um OrganismoFasta.
+        colecao (ColecaoCompartilhada): Coleção criada com ColecaoCompartilhada.criar.
+        trabalhadores (int): Número de processos. Padrão: os.cpu_count().
+        tamanho_lote (int): Número de registros por tarefa.
+    """
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=trabalhadores, initializer=_anexar_no_processo,
+                             initargs=(colecao.nome,)) as executor:
+        futuros = [
+            executor.submit(_aplicar_faixa, funcao, inicio, min(inicio + tamanho_lote, len(colecao)))
+            for inicio in range(0, len(colecao), tamanho_lote)
+        ]
+        return [resultado for futuro in futuros for resultado in futuro.result()]
+
+
+_colecao_do_processo = None
+
+
+def _anexar_no_processo(nome: str):
+    global _colecao_do_processo
+    _colecao_do_processo = ColecaoCompartilhada.anexar(nome)
+
+
+def _aplicar_faixa(funcao, inicio: int, fim: int):
+    return [funcao(_colecao_do_processo[i]) for i in range(inicio, fim)]
@@ -0,0 +1,241 @@
+"""
+Esboços MinHash para estimar rapidamente a similaridade entre genomas.
+
+O esboço de uma sequência é o conjunto dos `tamanho` menores hashes dos seus k-mers
+canônicos (bottom-k, como no Mash). Os k-mers vêm de bio.kmers e o hash (o
+finalizador do splitmix64) é aplicado a todos de uma vez sobre uint64. Dois esboços
+estimam a similaridade de Jaccard dos conjuntos de k-mers, e dela a distância de
+Mash, sem voltar às sequências. Requer NumPy.
+"""
+import json
+import math
+
+import numpy as np
+
+from bio.kmers import codigos_de_kmers
+
+K_PADRAO = 21
+TAMANHO_PADRAO = 1000
+
+_VAZIO = np.iinfo(np.uint64).max
+
+
+class Esboco:
+    """
+    Esboço MinHash de uma sequência.
+
+    Atributos:
+        id (str): Identificador do registro de origem.
+        k (int): Tamanho dos k-mers.
+        tamanho (int): Número máximo de hashes guardados.
+        hashes (np.ndarray): Os menores hashes (uint64), em ordem crescente.
+    """
+
+    def __init__(self, id: str, k: int, tamanho: int, hashes: np.ndarray):
+        self.id = id
+        self.k = k
+        self.tamanho = tamanho
+        self.hashes = hashes
+
+    def __repr__(self):
+        return f"Esboco(id={self.id!r}, k={self.k}, hashes={len(self.hashes)})"
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def jaccard(self, outro: "Esboco") -> float:
+        """
+        Estima a similaridade de Jaccard entre os k-mers das duas sequências.
+
+        Como no Mash, só os `tamanho` menores hashes da união dos dois esboços são
+        considerados, e a estimativa é a fração deles presente nos dois.
+        """
+        _verificar_compatibilidade([self, outro])
+        a, b = self.hashes, outro.hashes
+        posicoes_em_b = np.searchsorted(b, a)
+        if not len(b):
+            return 0.0
+        comuns = np.flatnonzero(b[np.minimum(posicoes_em_b, len(b) - 1)] == a)
+        # Posição de cada hash comum na união: (em a) + (em b) - (comuns antes dele).
+        posicao_na_uniao = comuns + posicoes_em_b[comuns] - np.arange(len(comuns))
+        uniao = min(self.tamanho, len(a) + len(b) - len(comuns))
+        return np.count_nonzero(posicao_na_uniao < self.tamanho) / uniao
+
+    def distancia(self, outro: "Esboco") -> float:
+        """
+        Distância de Mash: estimativa da divergência por base a partir do Jaccard.
+
+        Exemplo:
+            esbocar("ACGT" * 100, k=5).distancia(esbocar("ACGT" * 100, k=5)) -> 0.0
+        """
+        return distancia_de_mash(self.jaccard(outro), self.k)
+
+
+def esbocar(sequencia, k: int = K_PADRAO, tamanho: int = TAMANHO_PADRAO,
+            id: str = "", semente: int = 0) -> Esboco:
+    """
+    Constrói o esboço MinHash dos k-mers canônicos de uma sequência.
+
+    Args:
+        sequencia (Sequencia | str): Sequência de DNA.
+        k (int): Tamanho dos k-mers (até 32).
+        tamanho (int): Quantos dos menores hashes guardar.
+        id (str): Identificador guardado no esboço.
+        semente (int): Semente do hash (esboços só são comparáveis com a mesma semente).
+    """
+    hashes = np.unique(_hash(codigos_de_kmers(sequencia, k, canonico=True), semente))
+    return Esboco(id, k, tamanho, hashes[:tamanho])
+
+
+def esbocar_colecao(organismos, k: int = K_PADRAO, tamanho: int = TAMANHO_PADRAO,
+                    semente: int = 0) -> list[Esboco]:
+    """
+    Constrói o esboço de cada OrganismoFasta de uma coleção (lista ou iter_fasta).
+    """
+    return [esbocar(organismo.sequencia, k, tamanho, organismo.id, semente)
+            for organismo in organismos]
+
+
+def distancia_de_mash(jaccard: float, k: int) -> float:
+    """
+    Converte uma similaridade de Jaccard em distância de Mash: -ln(2J / (1 + J)) / k.
+    """
+    if jaccard <= 0:
+        return 1.0
+    return max(0.0, -math.log(2 * jaccard / (1 + jaccard)) / k)
+
+
+def matriz_de_distancias(esbocos: list[Esboco], outros: list[Esboco] | None = None) -> np.ndarray:
+    """
+    Distâncias de Mash entre cada esboço de `esbocos` e cada um de `outros`
+    (por padrão, todos contra todos).
+
+    Os hashes de todos os esboços são trocados pela sua posição na lista ordenada de
+    todos os hashes, e cada esboço j vira uma faixa j * (N + 1) + posição de um único
+    vetor ordenado. Assim, um esboço é comparado com todos os outros com um único
+    np.searchsorted, em vez de um par de cada vez.
+
+    Returns:
+        np.ndarray: Matriz len(esbocos) × len(outros) de distâncias.
+    """
+    simetrica = outros is None
+    outros = esbocos if simetrica else outros
+    _verificar_compatibilidade([*esbocos, *outros])
+    if not esbocos or not outros:
+        return np.zeros((len(esbocos), len(outros)))
+    k, tamanho = esbocos[0].k, esbocos[0].tamanho
+
+    _, posicoes = np.unique(np.concatenate([esboco.hashes for esboco in (*esbocos, *outros)]),
+                            return_inverse=True)
+    faixa = len(posicoes) + 1
+    comprimentos = np.array([len(esboco) for esboco in (*esbocos, *outros)])
+    inicios = np.concatenate(([0], np.cumsum(comprimentos)))
+
+    alvos = np.arange(len(esbocos), len(esbocos) + len(outros))
+    chaves = np.full((len(outros), tamanho), faixa - 1, dtype=np.int64)
+    for linha, alvo in zip(chaves, alvos):
+        linha[:comprimentos[alvo]] = posicoes[inicios[alvo]:inicios[alvo + 1]]
+    chaves += np.arange(len(outros))[:, None] * faixa
+    plano = chaves.ravel()
+    deslocamentos = np.arange(len(outros))[:, None]
+
+    jaccard = np.zeros((len(esbocos), len(outros)))
+    for i in range(len(esbocos)):
+        primeiro = i + 1 if simetrica else 0  # na simétrica, só o triângulo superior
+        linhas = deslocamentos[primeiro:]
+        consultas = posicoes[inicios[i]:inicios[i + 1]][None, :] + linhas * faixa
+        indices = np.searchsorted(plano, consultas)
+        comuns = plano[np.minimum(indices, len(plano) - 1)] == consultas
+        jaccard[i, primeiro:] = _estimar_jaccard(comuns, indices - linhas * tamanho,
+                                                 comprimentos[i], comprimentos[alvos[primeiro:]],
+                                                 tamanho)
+    if simetrica:
+        jaccard = np.maximum(jaccard, jaccard.T)
+        np.fill_diagonal(jaccard, comprimentos[:len(esbocos)] > 0)
+
+    with np.errstate(divide="ignore"):
+        distancias = -np.log(2 * jaccard / (1 + jaccard)) / k
+    return np.where(jaccard > 0, np.maximum(distancias, 0.0), 1.0)
+
+
+def agrupar(esbocos: list[Esboco], distancia_maxima: float = 0.05) -> list[list[str]]:
+    """
+    Agrupa os esboços por ligação simples: dois registros ficam no mesmo grupo se
+    houver uma cadeia de pares a no máximo `distancia_maxima` entre eles.
+
+    Para desreplicar uma coleção, basta manter um registro de cada grupo.
+
+    Returns:
+        list[list[str]]: Ids de cada grupo, na ordem em que aparecem.
+    """
+    grupo = list(range(len(esbocos)))
+
+    def raiz(i):
+        while grupo[i] != i:
+            grupo[i] = grupo[grupo[i]]
+            i = grupo[i]
+        return i
+
+    distancias = matriz_de_distancias(esbocos)
+    for i, j in zip(*np.nonzero(np.triu(distancias <= distancia_maxima, k=1))):
+        grupo[raiz(int(j))] = raiz(int(i))
+
+    grupos = {}
+    for i, esboco in enumerate(esbocos):
+        grupos.setdefault(raiz(i), []).append(esboco.id)
+    return list(grupos.values())
+
+
+def salvar_esbocos(esbocos: list[Esboco], caminho):
+    """
+    Grava os esboços num único arquivo .npz: uma matriz de hashes (completada com
+    o maior uint64), os comprimentos, os ids e os parâmetros.
+    """
+    k, tamanho = (esbocos[0].k, esbocos[0].tamanho) if esbocos else (K_PADRAO, TAMANHO_PADRAO)
+    hashes = np.full((len(esbocos), tamanho), _VAZIO, dtype=np.uint64)
+    for linha, esboco in zip(hashes, esbocos):
+        linha[:len(esboco)] = esboco.hashes
+    np.savez_compressed(
+        caminho,
+        hashes=hashes,
+        comprimentos=np.array([len(esboco) for esboco in esbocos], dtype=np.int64),
+        ids=np.frombuffer(json.dumps([esboco.id for esboco in esbocos]).encode(), dtype=np.uint8),
+        parametros=np.array([k, tamanho], dtype=np.int64),
+    )
+
+
+def carregar_esbocos(caminho) -> list[Esboco]:
+    """Lê os esboços gravados por salvar_esbocos."""
+    with np.load(caminho) as dados:
+        k, tamanho = dados["parametros"].tolist()
+        ids = json.loads(dados["ids"].tobytes())
+        return [Esboco(id, k, tamanho, linha[:comprimento].copy())
+                for id, linha, comprimento in zip(ids, dados["hashes"], dados["comprimentos"])]
+
+
+def _estimar_jaccard(comuns, posicoes_em_b, tamanho_a, tamanho_b, tamanho):
+    """
+    Versão de Esboco.jaccard para vários pares de uma vez (um esboço `a` contra as
+    linhas de uma matriz): `comuns` marca os hashes de a (na última dimensão) que
+    também estão em b, e `posicoes_em_b` diz quantos hashes de b são menores.
+    Um hash comum está entre os `tamanho` menores da união se a sua posição nela,
+    (posição em a) + (posição em b) - (comuns antes dele), for menor que `tamanho`.
+    """
+    anteriores = np.cumsum(comuns, axis=-1) - comuns
+    posicao_na_uniao = np.arange(comuns.shape[-1]) + posicoes_em_b - anteriores
+    compartilhados = np.count_nonzero(comuns & (posicao_na_uniao < tamanho), axis=-1)
+    uniao = np.minimum(tamanho, tamanho_a + tamanho_b - np.count_nonzero(comuns, axis=-1))
+    return np.divide(compartilhados, uniao, out=np.zeros(np.shape(uniao)), where=uniao > 0)
+
+
+def _verificar_compatibilidade(esbocos):
+    if len({(esboco.k, esboco.tamanho) for esboco in esbocos}) > 1:
+        raise ValueError("Esboços com k ou tamanho diferentes não são comparáveis")
+
+
+def _hash(codigos: np.ndarray, semente: int) -> np.ndarray:
+    """Finalizador do splitmix64, vetorizado (a multiplicação em uint64 é módulo 2**64)."""
+    x = codigos + np.uint64((0x9E3779B97F4A7C15 * (semente + 1)) % 2 ** 64)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
@@ -0,0 +1,205 @@
+"""
+Varredura de mutações pontuais em muitos sítios e muitos registros.
+
+Os sítios são ordenados e agrupados em trechos de posições próximas. Os registros
+são percorridos um a um, e de cada um só são lidos esses trechos (uma fatia da
+sequência por trecho, que para uma SequenciaIndexada ou SequenciaMapeada lê
+apenas os bytes da fatia); as bases dos sítios saem de uma indexação NumPy de
+cada trecho. Reunidas as bases de todos os registros, a classificação é feita de
+uma vez, por comparação com as colunas de referência e alternativa, gerando uma
+matriz de genótipos registro × sítio. Requer NumPy.
+"""
+import numpy as np
+
+from bio.indice_fasta import FastaIndex
+
+REFERENCIA = 0
+ALTERNATIVA = 1
+OUTRA = 2
+AMBIGUA = 3
+CURTA = 4
+
+DESCRICAO_DOS_ESTADOS = {
+    REFERENCIA: "referência",
+    ALTERNATIVA: "alternativa",
+    OUTRA: "outra base",
+    AMBIGUA: "base ambígua",
+    CURTA: "sequência muito curta",
+}
+
+_MAIUSCULAS = np.arange(256, dtype=np.uint8)
+_MAIUSCULAS[ord("a"):ord("z") + 1] -= 32
+
+_DEFINIDA = np.zeros(256, dtype=bool)
+_DEFINIDA[[ord(base) for base in "ACGT"]] = True
+
+# Sítios a menos de LACUNA_MAXIMA bases um do outro são lidos numa única fatia.
+LACUNA_MAXIMA = 1 << 12
+
+
+class Sitio:
+    """
+    Um sítio de mutação pontual.
+
+    Atributos:
+        posicao (int): Posição da base, contada a partir de 1 (como em "posição 1000").
+        ref (str): Base de referência (A, C, G ou T).
+        alt (str): Base alternativa (mutação).
+
+    Raises:
+        ValueError: Se a posição for menor que 1 ou se ref/alt não forem uma única
+            base A, C, G ou T.
+    """
+
+    def __init__(self, posicao: int, ref: str, alt: str):
+        if isinstance(posicao, bool) or not isinstance(posicao, (int, np.integer)) or posicao < 1:
+            raise ValueError(f"A posição do sítio deve ser um inteiro a partir de 1, não {posicao!r}")
+        for nome, base in (("ref", ref), ("alt", alt)):
+            if not isinstance(base, str) or len(base) != 1 or base.upper() not in "ACGT":
+                raise ValueError(f"{nome} deve ser uma única base A, C, G ou T, não {base!r}")
+        self.posicao = int(posicao)
+        self.ref = ref.upper()
+        self.alt = alt.upper()
+
+    def __repr__(self):
+        return f"Sitio({self.posicao}, {self.ref!r}, {self.alt!r})"
+
+    def __str__(self):
+        return f"{self.ref}{self.posicao}{self.alt}"
+
+
+class Genotipos:
+    """
+    Resultado de varrer_mutacoes: o estado de cada sítio em cada registro.
+
+    Atributos:
+        ids (list[str]): Ids dos registros (linhas).
+        sitios (list[Sitio]): Sítios (colunas).
+        estados (np.ndarray): Matriz uint8 registros × sítios com REFERENCIA,
+            ALTERNATIVA, OUTRA, AMBIGUA ou CURTA.
+        bases (np.ndarray): Matriz uint8 com a base encontrada (0 onde a sequência é curta).
+
+    Exemplo:
+        genotipos = varrer_mutacoes(ler_fasta(caminho), [(1000, "A", "G")])
+        genotipos.estados[:3, 0]  -> array([0, 0, 2], dtype=uint8)
+        genotipos.base(0, 0)      -> 'A'
+    """
+
+    def __init__(self, ids: list[str], sitios: list[Sitio], estados: np.ndarray, bases: np.ndarray):
+        self.ids = ids
+        self.sitios = sitios
+        self.estados = estados
+        self.bases = bases
+
+    def __repr__(self):
+        return f"Genotipos(registros={len(self.ids)}, sitios={len(self.sitios)})"
+
+    def base(self, registro: int, sitio: int) -> str:
+        """Base encontrada no sítio, ou '' se a sequência não chega até ele."""
+        codigo = int(self.bases[registro, sitio])
+        return chr(codigo) if codigo else ""
+
+    def contagens(self) -> np.ndarray:
+        """
+        Número de registros em cada estado, por sítio: matriz sítios × 5 estados.
+        """
+        contagens = np.zeros((len(self.sitios), len(DESCRICAO_DOS_ESTADOS)), dtype=np.int64)
+        for estado in DESCRICAO_DOS_ESTADOS:
+            contagens[:, estado] = np.count_nonzero(self.estados == estado, axis=0)
+        return contagens
+
+    def frequencia_da_mutacao(self) -> np.ndarray:
+        """
+        Fração de registros com a base alternativa em cada sítio, entre os que têm
+        base definida (referência, alternativa ou outra) no sítio.
+        """
+        definidos = np.count_nonzero(self.estados <= OUTRA, axis=0)
+        mutados = np.count_nonzero(self.estados == ALTERNATIVA, axis=0)
+        return np.divide(mutados, definidos, out=np.zeros(len(self.sitios)), where=definidos > 0)
+
+
+def varrer_mutacoes(organismos, sitios) -> Genotipos:
+    """
+    Verifica todos os sítios em todos os registros de uma coleção.
+
+    Só as bases em volta dos sítios são lidas de cada registro: a coleção nunca
+    é copiada inteira, e com um FastaIndex as sequências nem chegam a ser lidas
+    do disco fora desses trechos.
+
+    Args:
+        organismos (FastaIndex | iterable[OrganismoFasta]): Registros (lista,
+            iter_fasta...) ou um FastaIndex aberto.
+        sitios (iterable[Sitio | tuple[int, str, str]]): Sítios (posicao, ref, alt),
+            com posições contadas a partir de 1.
+
+    Returns:
+        Genotipos: Matriz registros × sítios de estados e bases.
+
+    Raises:
+        ValueError: Se algum sítio tiver posição menor que 1 ou ref/alt inválidos.
+
+    Exemplo:
+        varrer_mutacoes(ler_fasta(caminho), [(1000, "A", "G"), (2500, "C", "T")])
+        with FastaIndex(caminho) as indice:
+            varrer_mutacoes(indice, [(1000, "A", "G")])
+    """
+    sitios = [sitio if isinstance(sitio, Sitio) else Sitio(*sitio) for sitio in sitios]
+    indices = np.array([sitio.posicao - 1 for sitio in sitios], dtype=np.int64)
+    ref = np.array([ord(sitio.ref) for sitio in sitios], dtype=np.uint8)
+    alt = np.array([ord(sitio.alt) for sitio in sitios], dtype=np.uint8)
+    trechos = _agrupar_sitios(indices)
+
+    if isinstance(organismos, FastaIndex):
+        registros = ((id, organismos[id]) for id in organismos)
+    else:
+        registros = ((organismo.id, organismo.sequencia) for organismo in organismos)
+
+    ids = []
+    linhas = []
+    comprimentos = []
+    for id, sequencia in registros:
+        ids.append(id)
+        comprimentos.append(len(sequencia))
+        linhas.append(_bases_dos_sitios(sequencia, indices, trechos))
+
+    bases = np.array(linhas, dtype=np.uint8).reshape(len(ids), len(sitios))
+    comprimentos = np.array(comprimentos, dtype=np.int64)
+    cobertos = indices[None, :] < comprimentos[:, None]
+
+    estados = np.full(bases.shape, OUTRA, dtype=np.uint8)
+    estados[~_DEFINIDA[bases]] = AMBIGUA
+    estados[bases == alt] = ALTERNATIVA
+    estados[bases == ref] = REFERENCIA
+    estados[~cobertos] = CURTA
+
+    return Genotipos(ids, sitios, estados, bases)
+
+
+def _agrupar_sitios(indices: np.ndarray) -> list[tuple[int, int, np.ndarray]]:
+    """
+    Agrupa os sítios (posições 0-based) em trechos [inicio, fim) de posições próximas.
+
+    Returns:
+        list[tuple[int, int, np.ndarray]]: Cada trecho, com as colunas dos seus sítios.
+    """
+    colunas = np.argsort(indices, kind="stable")
+    posicoes = indices[colunas]
+    cortes = np.flatnonzero(np.diff(posicoes) > LACUNA_MAXIMA) + 1
+    return [(int(grupo[0]), int(grupo[-1]) + 1, colunas_do_grupo)
+            for grupo, colunas_do_grupo in zip(np.split(posicoes, cortes), np.split(colunas, cortes))
+            if len(grupo)]
+
+
+def _bases_dos_sitios(sequencia, indices: np.ndarray, trechos) -> np.ndarray:
+    """Bases (em maiúsculas) da sequência em cada sítio, com 0 onde ela não chega."""
+    bases = np.zeros(len(indices), dtype=np.uint8)
+    comprimento = len(sequencia)
+    for inicio, fim, colunas in trechos:
+        if inicio >= comprimento:
+            break
+        trecho = str(sequencia[inicio:min(fim, comprimento)]).encode("ascii", "replace")
+        deslocamentos = indices[colunas] - inicio
+        dentro = deslocamentos < len(trecho)
+        bases[colunas[dentro]] = _MAIUSCULAS[
+            np.frombuffer(trecho, dtype=np.uint8)[deslocamentos[dentro]]]
+    return bases
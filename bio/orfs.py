@@ -0,0 +1,112 @@
+"""
+Busca de ORFs (open reading frames) nas seis fases de leitura de uma sequência.
+
+A sequência é codificada uma única vez; os índices dos códons de todas as posições
+são calculados juntos para a fita direta e para a complementar reversa, e cada fase
+é só uma fatia desses arrays. Os ORFs de cada fase saem de buscas vetorizadas
+entre os códons de início (ATG) e de parada. Requer NumPy.
+"""
+import numpy as np
+
+from bio.traducao import CODIGO_INDEFINIDO, TABELA_CODONS, codificar, indices_em_todas_as_posicoes
+
+_M = ord("M")
+_PARADA = ord("*")
+
+
+class ORF:
+    """
+    Uma fase aberta de leitura: do códon ATG até o códon de parada (inclusive).
+
+    Atributos:
+        inicio (int): Posição inicial na fita direta (0-based, inclusiva).
+        fim (int): Posição final na fita direta (exclusiva), incluindo o códon de parada.
+        fita (int): +1 para a fita direta, -1 para a complementar reversa.
+        quadro (int): Fase de leitura (0, 1 ou 2), contada a partir do início da fita lida.
+        proteina (str): Proteína traduzida, sem o '*' final.
+    """
+
+    def __init__(self, inicio: int, fim: int, fita: int, quadro: int, proteina: str):
+        self.inicio = inicio
+        self.fim = fim
+        self.fita = fita
+        self.quadro = quadro
+        self.proteina = proteina
+
+    def __repr__(self):
+        return (f"ORF(inicio={self.inicio}, fim={self.fim}, fita={self.fita:+d}, "
+                f"quadro={self.quadro}, proteina={len(self.proteina)} aa)")
+
+    def __len__(self):
+        return self.fim - self.inicio
+
+
+def encontrar_orfs(sequencia, tamanho_minimo: int = 100) -> list[ORF]:
+    """
+    Encontra os ORFs das seis fases de leitura com pelo menos `tamanho_minimo` aminoácidos.
+
+    Cada ORF começa no primeiro ATG após o códon de parada anterior da mesma fase e
+    termina no códon de parada seguinte. Trechos sem códon de parada no fim são ignorados.
+
+    Args:
+        sequencia (Sequencia | str): Sequência de DNA.
+        tamanho_minimo (int): Número mínimo de aminoácidos (sem contar o '*').
+
+    Returns:
+        list[ORF]: ORFs ordenados pela posição inicial na fita direta.
+
+    Exemplo:
+        encontrar_orfs("CCATGAAATTTTAGCC", tamanho_minimo=2)
+            -> [ORF(inicio=2, fim=14, fita=+1, quadro=2, proteina=3 aa)]
+    """
+    codigos = codificar(str(sequencia))
+    n = len(codigos)
+
+    complementares = np.where(codigos < 4, 3 - codigos, CODIGO_INDEFINIDO)[::-1]
+
+    orfs = []
+    for fita, fita_codigos in ((1, codigos), (-1, complementares)):
+        aminoacidos = TABELA_CODONS[indices_em_todas_as_posicoes(fita_codigos)]
+        for quadro in range(3):
+            fase = aminoacidos[quadro::3]
+            for inicio, fim in _orfs_da_fase(fase, tamanho_minimo):
+                proteina = fase[inicio:fim].tobytes().decode()
+                comeco = quadro + 3 * inicio
+                final = quadro + 3 * fim + 3
+                if fita == -1:
+                    comeco, final = n - final, n - comeco
+                orfs.append(ORF(comeco, final, fita, quadro, proteina))
+
+    orfs.sort(key=lambda orf: (orf.inicio, orf.fita))
+    return orfs
+
+
+def encontrar_orfs_colecao(organismos, tamanho_minimo: int = 100) -> dict[str, list[ORF]]:
+    """
+    Executa encontrar_orfs para cada OrganismoFasta de uma coleção (lista ou iter_fasta).
+
+    Returns:
+        dict[str, list[ORF]]: ORFs de cada organismo, indexados pelo id.
+
+    Exemplo:
+        encontrar_orfs_colecao(ler_fasta("arquivos/Flaviviridae-genomes.fasta"))
+    """
+    return {
+        organismo.id: encontrar_orfs(organismo.sequencia, tamanho_minimo)
+        for organismo in organismos
+    }
+
+
+def _orfs_da_fase(fase: np.ndarray, tamanho_minimo: int):
+    paradas = np.flatnonzero(fase == _PARADA)
+    inicios = np.flatnonzero(fase == _M)
+    if len(paradas) == 0 or len(inicios) == 0:
+        return []
+
+    parada_anterior = np.concatenate(([-1], paradas[:-1]))
+    proximo_inicio = np.searchsorted(inicios, parada_anterior + 1)
+    tem_inicio = proximo_inicio < len(inicios)
+    primeiro_m = inicios[np.minimum(proximo_inicio, len(inicios) - 1)]
+
+    validos = tem_inicio & (primeiro_m < paradas) & (paradas - primeiro_m >= tamanho_minimo)
+    return list(zip(primeiro_m[validos].tolist(), paradas[validos].tolist()))
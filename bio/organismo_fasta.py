@@ -1,13 +1,5 @@
 from bio.sequencia import Sequencia
 
-<<<<<<< HEAD
-
-class OrganismoFasta:
-    def __init__(self, id, nome, sequencia):
-        self.id = id
-        self.nome = nome
-        self.sequencia = Sequencia(sequencia)
-=======
 class OrganismoFasta:
     """
     Representa um organismo biológico modelado a partir de uma entrada FASTA.
@@ -16,12 +8,20 @@ class OrganismoFasta:
     e serve como um contêiner para armazenar informações básicas de uma sequência,
     como ID, descrição e o conteúdo da sequência em si (encapsulado como um objeto da classe Sequencia).
 
+    Para coleções com milhões de registros, a classe usa __slots__ (sem __dict__ por
+    instância) e, quando criada por de_cabecalho (como faz ler_fasta), guarda apenas a
+    linha de cabeçalho original (em bytes, na leitura de arquivos): id e nome só são
+    decodificados e separados no primeiro acesso.
+
     Atributos:
         id (str): Identificador único da sequência (geralmente a primeira palavra do cabeçalho FASTA).
         nome (str): Nome descritivo do organismo ou da sequência (restante da linha do cabeçalho).
         sequencia (Sequencia): Objeto da classe Sequencia contendo a cadeia de nucleotídeos.
+        cabecalho (str): Linha de cabeçalho, sem o ">" (a original, se houver uma).
     """
 
+    __slots__ = ("_cabecalho", "_id", "_nome", "sequencia")
+
     def __init__(self, id: str, nome: str, sequencia: str | Sequencia):
         """
         Inicializa um novo objeto OrganismoFasta.
@@ -38,10 +38,54 @@ class OrganismoFasta:
             OrganismoFasta("NC_001477.1", "Yellow fever virus", "ATGCGTA...")
 
         """
-        self.id = id
-        self.nome = nome
+        self._cabecalho = None
+        self._id = id
+        self._nome = nome
         self.sequencia = sequencia if isinstance(sequencia, Sequencia) else Sequencia(sequencia)
 
+    @classmethod
+    def de_cabecalho(cls, cabecalho: str | bytes, sequencia: str | Sequencia) -> "OrganismoFasta":
+        """
+        Cria um registro a partir da linha de cabeçalho, sem separá-la ainda.
+
+        A linha é guardada como veio (str ou bytes, com ou sem ">" e quebra de linha);
+        id e nome são extraídos por separar_cabecalho no primeiro acesso.
+
+        Exemplo:
+            o = OrganismoFasta.de_cabecalho(">NC_001477.1 |Dengue virus 1\\n", "AGTT")
+            o.id   -> 'NC_001477.1'
+            o.nome -> 'Dengue virus 1'
+        """
+        organismo = cls(None, None, sequencia)
+        organismo._cabecalho = cabecalho
+        return organismo
+
+    @property
+    def id(self) -> str:
+        if self._id is None and self._cabecalho is not None:
+            self._separar_cabecalho()
+        return self._id
+
+    @id.setter
+    def id(self, valor: str):
+        self._id = valor
+
+    @property
+    def nome(self) -> str:
+        if self._nome is None and self._cabecalho is not None:
+            self._separar_cabecalho()
+        return self._nome
+
+    @nome.setter
+    def nome(self, valor: str):
+        self._nome = valor
+
+    @property
+    def cabecalho(self) -> str:
+        if self._cabecalho is None:
+            return f"{self._id} |{self._nome}"
+        return _texto_do_cabecalho(self._cabecalho)
+
     def __repr__(self):
         """
         Retorna uma representação legível do objeto OrganismoFasta.
@@ -56,4 +100,46 @@ class OrganismoFasta:
         """
         return (f"OrganismoFasta(id={self.id!r}, nome={self.nome!r}, "
                 f"sequencia={self.sequencia!r})")
->>>>>>> anderson
+
+    def _separar_cabecalho(self):
+        id_organismo, nome = separar_cabecalho(self._cabecalho)
+        if self._id is None:
+            self._id = id_organismo
+        if self._nome is None:
+            self._nome = nome
+
+
+def separar_cabecalho(cabecalho: str | bytes) -> tuple[str, str]:
+    """
+    Separa uma linha de cabeçalho FASTA em (id, nome), sem nunca lançar erro.
+
+    Regras, na ordem:
+        - "ID |nome" (o formato do projeto): separa no primeiro " |"; barras
+          no nome são mantidas;
+        - "ID|nome", com uma única barra: separa nela;
+        - qualquer outro (NCBI, UniProt "sp|P12345|NOME_HUMAN descrição", sem
+          descrição...): o id é a primeira palavra e o nome, o resto da linha.
+
+    Exemplo:
+        separar_cabecalho(">NC_001477.1 |Dengue virus 1")   -> ('NC_001477.1', 'Dengue virus 1')
+        separar_cabecalho(">sp|P0DTC2|SPIKE_SARS2 Spike")   -> ('sp|P0DTC2|SPIKE_SARS2', 'Spike')
+        separar_cabecalho(">read_42")                       -> ('read_42', '')
+    """
+    texto = _texto_do_cabecalho(cabecalho)
+
+    id_organismo, separador, nome = texto.partition(" |")
+    if not separador and texto.count("|") == 1:
+        id_organismo, separador, nome = texto.partition("|")
+    if separador:
+        return id_organismo.strip(), nome.strip()
+
+    campos = texto.split(None, 1)
+    if not campos:
+        return "", ""
+    return campos[0], campos[1] if len(campos) > 1 else ""
+
+
+def _texto_do_cabecalho(cabecalho: str | bytes) -> str:
+    if isinstance(cabecalho, (bytes, bytearray, memoryview)):
+        cabecalho = bytes(cabecalho).decode(errors="replace")
+    return cabecalho.strip().removeprefix(">").strip()
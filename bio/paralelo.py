@@ -0,0 +1,163 @@
+"""
+Execução em lote das análises em vários processos (concurrent.futures).
+
+Há duas formas de distribuir o trabalho:
+
+- iterar_em_lote / executar_em_lote: recebem registros OrganismoFasta (uma lista
+  ou o gerador de iter_fasta) e enviam lotes deles para os processos.
+- executar_em_fragmentos: divide o próprio arquivo FASTA em faixas de bytes que
+  começam em um cabeçalho; cada processo lê e analisa a sua faixa, e nenhuma
+  sequência precisa ser enviada entre processos.
+
+Em ambos os casos os resultados voltam na mesma ordem dos registros de entrada.
+A função aplicada precisa ser definida no nível de módulo (para poder ser enviada
+aos processos).
+"""
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import bio.ler_fasta
+from bio.bgzf import tipo_de_compressao
+
+TAMANHO_LOTE = 8
+
+
+def iterar_em_lote(funcao, organismos, trabalhadores: int | None = None,
+                   tamanho_lote: int = TAMANHO_LOTE):
+    """
+    Aplica `funcao` a cada organismo num pool de processos, gerando os resultados em ordem.
+
+    Os organismos são enviados em lotes de `tamanho_lote`, e só alguns lotes ficam
+    pendentes por vez, então um gerador como iter_fasta é consumido aos poucos.
+
+    Args:
+        funcao (callable): Função de nível de módulo que recebe um OrganismoFasta.
+        organismos (iterable): Registros a processar.
+        trabalhadores (int): Número de processos. Padrão: os.cpu_count().
+        tamanho_lote (int): Número de registros enviados em cada tarefa.
+
+    Yields:
+        O resultado de `funcao` para cada organismo, na ordem de entrada.
+
+    Exemplo:
+        for gc in iterar_em_lote(calcular_gc, iter_fasta(caminho), trabalhadores=4):
+            print(gc)
+    """
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    organismos = iter(organismos)
+
+    with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+        pendentes = deque()
+        while True:
+            while len(pendentes) < 2 * trabalhadores:
+                lote = list(islice(organismos, tamanho_lote))
+                if not lote:
+                    break
+                pendentes.append(executor.submit(_aplicar_lote, funcao, lote))
+
+            if not pendentes:
+                break
+            yield from pendentes.popleft().result()
+
+
+def executar_em_lote(funcao, organismos, trabalhadores: int | None = None,
+                     tamanho_lote: int = TAMANHO_LOTE) -> list:
+    """
+    Versão de iterar_em_lote que devolve todos os resultados numa lista.
+    """
+    return list(iterar_em_lote(funcao, organismos, trabalhadores, tamanho_lote))
+
+
+def fragmentar_fasta(caminho_do_arquivo, partes: int) -> list[tuple[int, int]]:
+    """
+    Divide um arquivo FASTA em até `partes` faixas de bytes [inicio, fim).
+
+    Cada faixa começa no início de uma linha de cabeçalho ('>'), de modo que
+    nenhum registro fica dividido entre duas faixas.
+
+    Raises:
+        ValueError: Para arquivos comprimidos (use iterar_em_lote com iter_fasta).
+
+    Exemplo:
+        fragmentar_fasta("arquivos/Flaviviridae-genomes.fasta", 4)
+            -> [(0, 425545), (425545, 860684), (860684, 1274349), (1274349, 1694233)]
+    """
+    if tipo_de_compressao(caminho_do_arquivo) is not None:
+        raise ValueError("Arquivos comprimidos não podem ser divididos em faixas de bytes")
+
+    tamanho = os.path.getsize(caminho_do_arquivo)
+    inicios = [0]
+
+    with open(caminho_do_arquivo, "rb") as arquivo:
+        for parte in range(1, partes):
+            posicao = _proximo_cabecalho(arquivo, max(tamanho * parte // partes, inicios[-1]))
+            if posicao >= tamanho:
+                break
+            if posicao > inicios[-1]:
+                inicios.append(posicao)
+
+    return list(zip(inicios, inicios[1:] + [tamanho]))
+
+
+def executar_em_fragmentos(funcao, caminho_do_arquivo, trabalhadores: int | None = None,
+                           fragmentos: int | None = None) -> list:
+    """
+    Aplica `funcao` a todos os registros de um FASTA, com cada processo lendo uma faixa do arquivo.
+
+    Args:
+        funcao (callable): Função de nível de módulo que recebe um OrganismoFasta.
+        caminho_do_arquivo (str): Caminho do arquivo FASTA.
+        trabalhadores (int): Número de processos. Padrão: os.cpu_count().
+        fragmentos (int): Em quantas faixas dividir o arquivo. Padrão: 4 por processo.
+
+    Returns:
+        list: Os resultados de `funcao`, na ordem dos registros no arquivo.
+    """
+    trabalhadores = trabalhadores or os.cpu_count() or 1
+    faixas = fragmentar_fasta(caminho_do_arquivo, fragmentos or 4 * trabalhadores)
+
+    with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+        futuros = [
+            executor.submit(_aplicar_fragmento, funcao, caminho_do_arquivo, inicio, fim)
+            for inicio, fim in faixas
+        ]
+        return [resultado for futuro in futuros for resultado in futuro.result()]
+
+
+def _aplicar_lote(funcao, lote):
+    return [funcao(organismo) for organismo in lote]
+
+
+def _aplicar_fragmento(funcao, caminho_do_arquivo, inicio, fim):
+    return [funcao(organismo) for organismo in
+            bio.ler_fasta.ler_registros(_linhas_da_faixa(caminho_do_arquivo, inicio, fim))]
+
+
+def _linhas_da_faixa(caminho_do_arquivo, inicio, fim):
+    with open(caminho_do_arquivo, "rb") as arquivo:
+        arquivo.seek(inicio)
+        posicao = inicio
+        for linha in arquivo:
+            if posicao >= fim:
+                break
+            posicao += len(linha)
+            yield linha
+
+
+def _proximo_cabecalho(arquivo, posicao: int) -> int:
+    """Posição do primeiro '>' em início de linha a partir de `posicao`."""
+    if posicao == 0:
+        return 0
+
+    arquivo.seek(posicao - 1)
+    anterior = arquivo.read(1)
+    while True:
+        bloco = arquivo.read(1 << 16)
+        if not bloco:
+            return arquivo.tell()
+        achado = (anterior + bloco).find(b"\n>")
+        if achado != -1:
+            return arquivo.tell() - len(bloco) - len(anterior) + achado + 1
+        anterior = bloco[-1:]
@@ -1,10 +1,10 @@
-<<<<<<< HEAD
-from bio.constantes import DNA_PARA_AMINOACIDO
-from bio.constantes import DNA_STOP_CODONS
-=======
-from bio.constantes import DNA_PARA_AMINOACIDO, DNA_STOP_CODONS
+from collections import Counter
+
+from bio import traducao
+
+_BASES_POR_BLOCO = 1 << 16
+
 
->>>>>>> anderson
 class Sequencia:
     """
     Classe principal do projeto para manipulação de sequências biológicas (DNA ou RNA).
@@ -17,12 +17,28 @@ class Sequencia:
         - complementar_reversa(): Retorna a fita complementar reversa (3' → 5').
         - transcrever(): Transforma DNA em RNA substituindo T por U.
         - traduzir(parar=False): Traduz a sequência para proteína (usa códons).
+        - encontrar_orfs(tamanho_minimo): Encontra ORFs nas seis fases de leitura.
+        - contar_kmers(k, canonico): Conta os k-mers da sequência.
         - calcular_percentual(bases): Calcula percentual de bases informadas.
+        - composicao(): Contagem de cada base (inclusive códigos IUPAC), calculada uma vez.
+        - conteudo_gc(): Fração de G e C na sequência.
+        - perfil_janelas(janela, passo): Conteúdo GC e skew em janelas deslizantes.
     """
 
+    _composicao = None
+
     def __init__(self, sequencia):
         self.sequencia = sequencia.upper()
 
+    @property
+    def sequencia(self) -> str:
+        return self._sequencia
+
+    @sequencia.setter
+    def sequencia(self, valor: str):
+        self._sequencia = valor
+        self._composicao = None
+
     def __repr__(self):
         return f'Sequencia("{self.sequencia}")'
 
@@ -39,80 +55,6 @@ class Sequencia:
         return str(self) == str(outra_sequencia)
 
     def __getitem__(self, index):
-<<<<<<< HEAD
-        return self.sequencia.__getitem__(index)
-    
-    def calcular_sequencia(self):
-        return len(self.sequencia)
-    
-    def complementar(self, inplace: bool = False):
-        comp_dict = str.maketrans("ATCGatcg", "TAGCtagc")
-        comp = self.sequencia.translate(comp_dict)
-        return Sequencia(comp)
-    
-    def complementar_reversa(self):
-        comp = self.complementar().sequencia[::-1]
-        return Sequencia(comp)
-
-    def transcrever(self):
-        trans_dict = str.maketrans("Tt", "Uu")
-        trans = self.sequencia.translate(trans_dict)
-        return Sequencia(trans)
-    
-    def traduzir(self, parar):
-        proteina = []
-        seq = self.sequencia
-        
-        for i in range(0, len(seq) - 2 , 3):
-            codon = seq[i:i+3]
-
-            if codon in DNA_STOP_CODONS:
-                aa = '*'
-            else:
-                aa = DNA_PARA_AMINOACIDO.get(codon, "X")
-
-            proteina.append(aa)
-
-            if parar and  aa == '*':
-                break
-
-        return "".join(proteina)
-    
-    def calcular_percentual(self, bases=None):
-        seq = self.sequencia.upper()
-        
-        total = len(self.sequencia)
-        
-        total_a = seq.count("A")
-        total_t = seq.count("T")
-        total_c = seq.count("C")
-        total_g = seq.count("G")
-        
-        percentuais = {}
-
-        if total == 0:
-            percentuais = {
-                "A": 0,
-                "T": 0,
-                "C": 0,
-                "G": 0
-            }
-        else:
-            percentuais = {
-                "A": total_a / total,
-                "T": total_t / total,
-                "C": total_c / total,
-                "G": total_g / total
-            }
-        
-        if bases is not None:
-            percentuais = {base: percentuais[base] for base in bases if base in percentuais}
-            
-        return percentuais
-            
-
-        
-=======
         return self.sequencia[index]
 
     def complementar(self):
@@ -123,31 +65,31 @@ class Sequencia:
             A ↔ T
             C ↔ G
 
+        A fita não é gerada de imediato: o retorno é uma SequenciaVisao, que só
+        converte as bases efetivamente acessadas.
+
         Returns:
-            Sequencia: Nova instância com a sequência complementar.
+            SequenciaVisao: Visão da sequência complementar.
 
         Exemplo:
-            Sequencia("ATCG").complementar() -> Sequencia("TAGC")
+            Sequencia("ATCG").complementar() -> SequenciaVisao("TAGC")
         """
-        comp_dict = str.maketrans("ATCGatcg", "TAGCtagc")
-        comp = self.sequencia.translate(comp_dict)
-        return Sequencia(comp)
+        return SequenciaVisao(self, tabela=_COMPLEMENTO)
 
     def complementar_reversa(self):
         """
         Gera a fita complementar reversa (sentido 3' → 5') da sequência de DNA.
 
-        Combina o resultado de .complementar() com inversão da sequência.
+        Combina o resultado de .complementar() com inversão da sequência, sem
+        copiá-la: o retorno é uma SequenciaVisao.
 
         Returns:
-            Sequencia: Complementar reversa da sequência original.
+            SequenciaVisao: Visão da complementar reversa da sequência original.
 
         Exemplo:
-            Sequencia("ATCG").complementar_reversa() -> Sequencia("CGAT")
+            Sequencia("ATCG").complementar_reversa() -> SequenciaVisao("CGAT")
         """
-        complementar = self.complementar()
-        reversa = complementar.sequencia[::-1]
-        return Sequencia(reversa)
+        return self.complementar().reverter()
 
     def transcrever(self, inplace: bool = False):
         """
@@ -157,21 +99,29 @@ class Sequencia:
             inplace (bool): Compatibilidade com BioPython (não usado; sempre retorna nova instância).
 
         Returns:
-            Sequencia: Nova sequência transcrita como RNA.
+            SequenciaVisao: Visão da sequência transcrita como RNA.
 
         Exemplo:
-            Sequencia("ATGCTT").transcrever() -> Sequencia("AUGCUU")
+            Sequencia("ATGCTT").transcrever() -> SequenciaVisao("AUGCUU")
         """
-        transcricao_dict = str.maketrans("Tt", "Uu")
-        rna = self.sequencia.translate(transcricao_dict)
-        return Sequencia(rna)
+        return SequenciaVisao(self, tabela=_TRANSCRICAO)
+
+    def reverter(self):
+        """
+        Inverte a ordem das bases (sem complementar), como uma SequenciaVisao.
+
+        Exemplo:
+            Sequencia("ATCG").reverter() -> SequenciaVisao("GCTA")
+        """
+        return SequenciaVisao(self, reversa=True)
 
     def traduzir(self, parar=False) -> str:
         """
         Traduz a sequência de DNA para uma cadeia de aminoácidos (proteína).
 
         A leitura é feita em trincas (códons), e os códons são convertidos
-        usando o dicionário DNA_PARA_AMINOACIDO.
+        usando o dicionário DNA_PARA_AMINOACIDO. Com NumPy instalado, todos os
+        códons são traduzidos de uma vez (ver bio.traducao).
 
         Regras:
             - Códons de parada (TAA, TAG, TGA) são convertidos para '*'.
@@ -188,23 +138,57 @@ class Sequencia:
             Sequencia("ATGGCTTGA").traduzir() -> "MA*"
             Sequencia("ATGGCTTGA").traduzir(parar=True) -> "MA"
         """
-        proteina = []
-        seq = self.sequencia.upper()
+        return traducao.traduzir(self.sequencia, parar)
+
+    def encontrar_orfs(self, tamanho_minimo: int = 100) -> list:
+        """
+        Encontra os ORFs (do ATG ao códon de parada) nas seis fases de leitura.
+
+        As fases da fita direta e da complementar reversa são traduzidas numa única
+        passada vetorizada (ver bio.orfs, que requer NumPy).
+
+        Args:
+            tamanho_minimo (int): Número mínimo de aminoácidos de cada ORF.
+
+        Returns:
+            list[ORF]: ORFs com inicio, fim, fita, quadro e proteina.
+
+        Exemplo:
+            Sequencia("CCATGAAATTTTAGCC").encontrar_orfs(tamanho_minimo=2)
+                -> [ORF(inicio=2, fim=14, fita=+1, quadro=2, proteina=3 aa)]
+        """
+        from bio.orfs import encontrar_orfs
+
+        return encontrar_orfs(self, tamanho_minimo)
+
+    def contar_kmers(self, k: int, canonico: bool = False):
+        """
+        Conta os k-mers (subsequências de tamanho k) da sequência.
 
-        for i in range(0, len(seq) - 2, 3):
-            codon = seq[i:i+3]
-            aa = DNA_PARA_AMINOACIDO.get(codon, "X")
-            proteina.append(aa)
+        Janelas com bases ambíguas são ignoradas. A contagem é vetorizada sobre
+        códigos inteiros dos k-mers (ver bio.kmers, que requer NumPy).
 
-            if parar and aa == "*":
-                break
+        Args:
+            k (int): Tamanho dos k-mers (1 a 32).
+            canonico (bool): Se True, soma cada k-mer ao seu complementar reverso.
+
+        Returns:
+            ContagemKmers: Contagens, com consulta por k-mer e mais_frequentes(n).
+
+        Exemplo:
+            Sequencia("ATGATGA").contar_kmers(3)["ATG"] -> 2
+        """
+        from bio.kmers import contar_kmers
 
-        return "".join(proteina)
+        return contar_kmers(self, k, canonico)
 
     def calcular_percentual(self, bases: list[str]) -> float:
         """
         Calcula o percentual de ocorrência de uma ou mais bases na sequência.
 
+        A contagem vem de composicao(), que percorre a sequência uma única vez;
+        as chamadas seguintes não voltam a varrer a sequência.
+
         Args:
             bases (list[str]): Lista com as bases (ex: ['A'], ['C', 'G'])
 
@@ -215,10 +199,193 @@ class Sequencia:
             Sequencia("ATCGAAA").calcular_percentual(["A"]) -> 0.5
             Sequencia("ATCGCC").calcular_percentual(["C", "G"]) -> 0.5
         """
-        total = len(self.sequencia)
+        total = len(self)
         if total == 0:
             return 0.0
 
-        count = sum(self.sequencia.count(base.upper()) for base in bases)
+        contagem = self.composicao()
+        count = sum(contagem.get(base.upper(), 0) for base in bases)
         return round(count / total, 2)
->>>>>>> anderson
+
+    def composicao(self) -> dict[str, int]:
+        """
+        Conta quantas vezes cada base (inclusive códigos IUPAC) aparece na sequência.
+
+        A contagem é feita numa única passada e guardada na instância; as consultas
+        seguintes (calcular_percentual, conteudo_gc...) são respondidas sem varrer
+        a sequência de novo.
+
+        Returns:
+            dict[str, int]: Número de ocorrências de cada base presente.
+
+        Exemplo:
+            Sequencia("ATCGNA").composicao() -> {'A': 2, 'T': 1, 'C': 1, 'G': 1, 'N': 1}
+        """
+        if self._composicao is None:
+            self._composicao = {base: n for base, n in self._contar_bases().items() if n > 0}
+        return dict(self._composicao)
+
+    def conteudo_gc(self) -> float:
+        """
+        Calcula a fração de G e C na sequência, sem arredondamento.
+
+        Exemplo:
+            Sequencia("ATCGCC").conteudo_gc() -> 0.6666666666666666
+        """
+        total = len(self)
+        if total == 0:
+            return 0.0
+
+        contagem = self.composicao()
+        return (contagem.get("G", 0) + contagem.get("C", 0)) / total
+
+    def perfil_janelas(self, janela: int = 1000, passo: int | None = None):
+        """
+        Calcula conteúdo GC, skew GC/AT e skew acumulado em janelas deslizantes.
+
+        Usa somas acumuladas das bases, então o custo é linear no tamanho da
+        sequência para qualquer janela e passo (ver bio.janelas, que requer NumPy).
+
+        Args:
+            janela (int): Tamanho de cada janela, em bases.
+            passo (int): Distância entre janelas. Padrão: igual à janela.
+
+        Returns:
+            PerfilJanelas: Arrays inicios, gc, skew_gc, skew_at e skew_acumulado.
+
+        Exemplo:
+            Sequencia("GGGGCCAT").perfil_janelas(4, passo=2).gc -> array([1. , 1. , 0.5])
+        """
+        from bio.janelas import perfil_janelas
+
+        return perfil_janelas(self, janela, passo)
+
+    def _contar_bases(self) -> Counter:
+        return Counter(self.sequencia)
+
+
+_COMPLEMENTO = str.maketrans("ATCGatcg", "TAGCtagc")
+_TRANSCRICAO = str.maketrans("Tt", "Uu")
+
+
+def _compor_tabelas(primeira: dict | None, segunda: dict | None) -> dict | None:
+    if primeira is None:
+        return segunda
+    if segunda is None:
+        return primeira
+    chaves = set(primeira) | set(segunda)
+    return {
+        chave: segunda.get(primeira.get(chave, chave), primeira.get(chave, chave))
+        for chave in chaves
+    }
+
+
+class SequenciaVisao(Sequencia):
+    """
+    Visão preguiçosa de uma Sequencia: complementar, reversa, transcrita ou uma fatia dela.
+
+    Nenhuma base é copiada na criação. Indexar, fatiar ou iterar converte só o trecho
+    acessado, e as operações se compõem: a complementar reversa de uma transcrição,
+    ou uma fatia dela, continua sendo uma visão sobre a mesma sequência de origem.
+    A sequência inteira só é montada quando pedida (str(), .sequencia ou materializar()).
+
+    Atributos:
+        origem (Sequencia): Sequência sobre a qual a visão é construída.
+        tabela (dict | None): Tabela de str.translate aplicada às bases (None = nenhuma).
+        reversa (bool): Se True, as bases são lidas de trás para a frente.
+        inicio (int): Primeira posição da origem coberta pela visão.
+        comprimento (int): Número de bases da visão.
+
+    Exemplo:
+        visao = Sequencia("AATTGGCC").complementar_reversa()[:4]
+        visao             -> SequenciaVisao("GGCC")
+        visao[0]          -> 'G'
+        visao.materializar() -> Sequencia("GGCC")
+    """
+
+    def __init__(self, origem: Sequencia, tabela: dict | None = None, reversa: bool = False,
+                 inicio: int = 0, comprimento: int | None = None):
+        self.origem = origem
+        self.tabela = tabela
+        self.reversa = reversa
+        self.inicio = inicio
+        self.comprimento = len(origem) - inicio if comprimento is None else comprimento
+
+    @property
+    def sequencia(self) -> str:
+        return self._ler(0, self.comprimento)
+
+    def __repr__(self):
+        return f'SequenciaVisao("{self.sequencia}")'
+
+    def __len__(self):
+        return self.comprimento
+
+    def __iter__(self):
+        for inicio in range(0, self.comprimento, _BASES_POR_BLOCO):
+            yield from self._ler(inicio, min(inicio + _BASES_POR_BLOCO, self.comprimento))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            inicio, fim, passo = index.indices(self.comprimento)
+            if passo != 1:
+                return self.sequencia[index]
+            fim = max(fim, inicio)
+            return self._derivar(inicio=self._na_origem(inicio, fim), comprimento=fim - inicio)
+
+        if index < 0:
+            index += self.comprimento
+        if not 0 <= index < self.comprimento:
+            raise IndexError("índice fora da sequência")
+        return self._ler(index, index + 1)
+
+    def materializar(self) -> Sequencia:
+        """
+        Monta a sequência inteira e a devolve como uma Sequencia comum.
+        """
+        return Sequencia(self.sequencia)
+
+    def complementar(self):
+        return self._derivar(tabela=_compor_tabelas(self.tabela, _COMPLEMENTO))
+
+    def transcrever(self, inplace: bool = False):
+        return self._derivar(tabela=_compor_tabelas(self.tabela, _TRANSCRICAO))
+
+    def reverter(self):
+        return self._derivar(reversa=not self.reversa)
+
+    def _derivar(self, **alteracoes) -> "SequenciaVisao":
+        atributos = {
+            "tabela": self.tabela,
+            "reversa": self.reversa,
+            "inicio": self.inicio,
+            "comprimento": self.comprimento,
+        }
+        atributos.update(alteracoes)
+        return SequenciaVisao(self.origem, **atributos)
+
+    def _na_origem(self, inicio: int, fim: int) -> int:
+        """Primeira posição da origem correspondente ao trecho [inicio, fim) da visão."""
+        if self.reversa:
+            return self.inicio + self.comprimento - fim
+        return self.inicio + inicio
+
+    def _ler(self, inicio: int, fim: int) -> str:
+        if fim <= inicio:
+            return ""
+        comeco = self._na_origem(inicio, fim)
+        texto = str(self.origem[comeco:comeco + fim - inicio])
+        if self.tabela is not None:
+            texto = texto.translate(self.tabela)
+        if self.reversa:
+            texto = texto[::-1]
+        return texto
+
+    def _contar_bases(self) -> Counter:
+        if self.inicio != 0 or self.comprimento != len(self.origem):
+            return super()._contar_bases()
+
+        contagem = Counter()
+        for base, n in self.origem.composicao().items():
+            contagem[base.translate(self.tabela) if self.tabela else base] += n
+        return contagem
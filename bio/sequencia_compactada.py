@@ -0,0 +1,221 @@
+import re
+from bisect import bisect_right
+from collections import Counter
+
+from bio import traducao
+from bio.sequencia import Sequencia
+
+_BASES = "ACGT"
+_PARA_BITS = str.maketrans({"A": "00", "C": "01", "G": "10", "T": "11"})
+_DE_BYTE = ["".join(_BASES[(byte >> deslocamento) & 3] for deslocamento in (6, 4, 2, 0))
+            for byte in range(256)]
+_COMPLEMENTO = bytes(byte ^ 0xFF for byte in range(256))
+_INVERSO = bytes(
+    ((byte & 0x03) << 6) | ((byte & 0x0C) << 2) | ((byte & 0x30) >> 2) | ((byte & 0xC0) >> 6)
+    for byte in range(256)
+)
+_CONTAGEM_POR_BYTE = [Counter(_DE_BYTE[byte]) for byte in range(256)]
+_AMBIGUAS = re.compile(r"([^ACGT])\1*")
+_BASES_POR_BLOCO = 12 << 16  # múltiplo de 4 (bytes inteiros) e de 3 (códons inteiros)
+if traducao.np is not None:
+    _DESLOCAMENTOS = traducao.np.array([6, 4, 2, 0], dtype=traducao.np.uint8)
+
+
+class SequenciaCompactada(Sequencia):
+    """
+    Sequencia guardada com 2 bits por base (4 bases por byte).
+
+    As bases A, C, G e T são codificadas como 00, 01, 10 e 11. As demais (códigos IUPAC
+    como N, R, Y...) ficam numa lista esparsa de exceções, com trechos (inicio, fim, base),
+    e o valor guardado nessas posições dos bytes compactados é ignorado. Para genomas quase só ACGT,
+    isso usa cerca de 1/4 da memória de uma string.
+
+    complementar(), complementar_reversa() e composicao() (e, portanto,
+    calcular_percentual() e conteudo_gc()) operam direto nos bytes compactados. traduzir()
+    calcula os índices dos códons a partir dos 2 bits de cada base, bloco a bloco,
+    sem montar a sequência como texto.
+
+    Atributos:
+        dados (bytes): Bases compactadas, 4 por byte, da mais significativa para a menos.
+        comprimento (int): Número de bases.
+        excecoes (list[tuple[int, int, str]]): Trechos [inicio, fim) de uma base não ACGT.
+
+    Exemplo:
+        compactada = SequenciaCompactada("ATGNNC")
+        compactada.excecoes              -> [(3, 5, 'N')]
+        compactada.descompactar()        -> Sequencia("ATGNNC")
+    """
+
+    def __init__(self, sequencia):
+        texto = str(sequencia).upper()
+        self.comprimento = len(texto)
+        self.excecoes = [(m.start(), m.end(), m.group(1)) for m in _AMBIGUAS.finditer(texto)]
+        if self.excecoes:
+            texto = _AMBIGUAS.sub(lambda m: "A" * len(m.group()), texto)
+
+        blocos = []
+        for inicio in range(0, len(texto), _BASES_POR_BLOCO):
+            bits = texto[inicio:inicio + _BASES_POR_BLOCO].translate(_PARA_BITS)
+            bits += "0" * (-len(bits) % 8)
+            blocos.append(int(bits, 2).to_bytes(len(bits) // 8, "big"))
+        self.dados = b"".join(blocos)
+        self._inicios_excecoes = [inicio for inicio, _, _ in self.excecoes]
+
+    @classmethod
+    def _de_dados(cls, dados: bytes, comprimento: int, excecoes: list) -> "SequenciaCompactada":
+        compactada = cls.__new__(cls)
+        compactada.dados = dados
+        compactada.comprimento = comprimento
+        compactada.excecoes = excecoes
+        compactada._inicios_excecoes = [inicio for inicio, _, _ in excecoes]
+        return compactada
+
+    def descompactar(self) -> Sequencia:
+        """
+        Converte de volta para uma Sequencia comum.
+        """
+        return Sequencia(self.sequencia)
+
+    @property
+    def sequencia(self) -> str:
+        return self._decodificar(0, self.comprimento)
+
+    def __repr__(self):
+        return (f"SequenciaCompactada(comprimento={self.comprimento}, "
+                f"excecoes={len(self.excecoes)})")
+
+    def __len__(self):
+        return self.comprimento
+
+    def __iter__(self):
+        for inicio in range(0, self.comprimento, _BASES_POR_BLOCO):
+            yield from self._decodificar(inicio, min(inicio + _BASES_POR_BLOCO, self.comprimento))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            inicio, fim, passo = index.indices(self.comprimento)
+            if passo == 1:
+                return self._decodificar(inicio, fim)
+            return self.sequencia[index]
+
+        if index < 0:
+            index += self.comprimento
+        if not 0 <= index < self.comprimento:
+            raise IndexError("índice fora da sequência")
+        return self._decodificar(index, index + 1)
+
+    def complementar(self) -> "SequenciaCompactada":
+        """
+        Gera a fita complementar invertendo os bits de cada base (A↔T, C↔G).
+
+        As exceções (bases não ACGT) são mantidas, como em Sequencia.complementar().
+        """
+        return SequenciaCompactada._de_dados(
+            self.dados.translate(_COMPLEMENTO), self.comprimento, list(self.excecoes)
+        )
+
+    def complementar_reversa(self) -> "SequenciaCompactada":
+        """
+        Gera a fita complementar reversa sem descompactar a sequência.
+
+        Os bytes são invertidos e as bases de cada byte trocam de ordem por tabela;
+        depois, os bits de preenchimento do último byte são descartados com um deslocamento.
+        """
+        dados = self.dados[::-1].translate(_INVERSO).translate(_COMPLEMENTO)
+        preenchimento = 2 * (-self.comprimento % 4)
+        if preenchimento:
+            valor = int.from_bytes(dados, "big") << preenchimento
+            dados = (valor & ((1 << (8 * len(dados))) - 1)).to_bytes(len(dados), "big")
+
+        n = self.comprimento
+        excecoes = [(n - fim, n - inicio, base) for inicio, fim, base in reversed(self.excecoes)]
+        return SequenciaCompactada._de_dados(dados, n, excecoes)
+
+    def traduzir(self, parar=False) -> str:
+        """
+        Traduz a sequência para proteína direto dos bytes compactados.
+
+        Com NumPy, cada bloco de bytes é desempacotado nos códigos 0-3 (os mesmos de
+        bio.traducao), as posições das exceções recebem o código indefinido e os
+        códons são traduzidos por traducao.traduzir_indices. Sem NumPy, cada bloco
+        é descompactado para texto e traduzido pelo laço em Python.
+
+        O resultado é o mesmo de Sequencia.traduzir().
+        """
+        proteina = []
+        fim_dos_codons = self.comprimento - self.comprimento % 3
+
+        for inicio in range(0, fim_dos_codons, _BASES_POR_BLOCO):
+            fim = min(inicio + _BASES_POR_BLOCO, fim_dos_codons)
+            if traducao.np is None:
+                parte = traducao.traduzir(self._decodificar(inicio, fim), parar)
+            else:
+                parte = traducao.traduzir_indices(
+                    traducao.indices_de_codons(self._codigos(inicio, fim)), parar)
+            proteina.append(parte)
+            if parar and len(parte) * 3 < fim - inicio:
+                break
+
+        return "".join(proteina)
+
+    def _codigos(self, inicio: int, fim: int):
+        """Códigos 0-3 das bases [inicio, fim), com CODIGO_INDEFINIDO nas exceções."""
+        np = traducao.np
+        dados = np.frombuffer(self.dados, dtype=np.uint8, count=(fim - inicio + 3) // 4,
+                              offset=inicio // 4)
+        codigos = ((dados[:, None] >> _DESLOCAMENTOS) & 3).reshape(-1)[:fim - inicio].astype(np.uint16)
+
+        indice = max(bisect_right(self._inicios_excecoes, inicio) - 1, 0)
+        for exc_inicio, exc_fim, _ in self.excecoes[indice:]:
+            if exc_inicio >= fim:
+                break
+            if exc_fim > inicio:
+                codigos[max(exc_inicio, inicio) - inicio:min(exc_fim, fim) - inicio] = \
+                    traducao.CODIGO_INDEFINIDO
+        return codigos
+
+    def _contar_bases(self) -> Counter:
+        contagem = Counter()
+        for byte, vezes in Counter(self.dados).items():
+            for base, n in _CONTAGEM_POR_BYTE[byte].items():
+                contagem[base] += n * vezes
+
+        preenchimento = -self.comprimento % 4
+        if preenchimento:
+            contagem.subtract(_DE_BYTE[self.dados[-1]][4 - preenchimento:])
+
+        for inicio, fim, base in self.excecoes:
+            contagem.subtract(self._decodificar_bruto(inicio, fim))
+            contagem[base] += fim - inicio
+
+        return contagem
+
+    def _decodificar_bruto(self, inicio: int, fim: int) -> str:
+        primeiro_byte, deslocamento = divmod(inicio, 4)
+        ultimo_byte = (fim + 3) // 4
+        texto = "".join(map(_DE_BYTE.__getitem__, self.dados[primeiro_byte:ultimo_byte]))
+        return texto[deslocamento:deslocamento + fim - inicio]
+
+    def _decodificar(self, inicio: int, fim: int) -> str:
+        if fim <= inicio:
+            return ""
+
+        texto = self._decodificar_bruto(inicio, fim)
+        if not self.excecoes:
+            return texto
+
+        partes = []
+        anterior = 0
+        indice = max(bisect_right(self._inicios_excecoes, inicio) - 1, 0)
+        for exc_inicio, exc_fim, base in self.excecoes[indice:]:
+            if exc_inicio >= fim:
+                break
+            a = max(exc_inicio, inicio) - inicio
+            b = min(exc_fim, fim) - inicio
+            if a >= b:
+                continue
+            partes.append(texto[anterior:a])
+            partes.append(base * (b - a))
+            anterior = b
+        partes.append(texto[anterior:])
+        return "".join(partes)
@@ -0,0 +1,120 @@
+import string
+
+from bio.sequencia import Sequencia
+
+_MAIUSCULAS = bytes.maketrans(string.ascii_lowercase.encode(), string.ascii_uppercase.encode())
+_QUEBRAS_DE_LINHA = b"\r\n"
+_BASES_POR_BLOCO = 1 << 16
+
+
+class SequenciaMapeada(Sequencia):
+    """
+    Sequencia que lê as bases direto de um buffer compartilhado, sem cópia própria.
+
+    O buffer pode ser um mmap de um arquivo FASTA (com as quebras de linha do arquivo)
+    ou um memoryview sobre bytes contíguos. Vários processos que mapeiam o mesmo
+    arquivo compartilham as páginas do cache do sistema operacional, em vez de cada
+    um manter uma cópia da sequência.
+
+    Fatiar com passo 1 devolve outra SequenciaMapeada sobre o mesmo buffer; len(),
+    indexação e iteração leem só os bytes necessários. Os demais métodos de Sequencia
+    funcionam normalmente, materializando a sequência quando precisam dela.
+
+    Atributos:
+        buffer (mmap | memoryview): Memória onde estão as bases.
+        offset (int): Byte da primeira base da primeira linha do registro.
+        inicio (int): Posição, dentro do registro, da primeira base desta visão.
+        comprimento (int): Número de bases da visão.
+        bases_por_linha (int): Bases por linha no buffer (0 para bases contíguas).
+        bytes_por_linha (int): Bytes por linha no buffer, incluindo a quebra.
+    """
+
+    def __init__(self, buffer, offset: int = 0, comprimento: int | None = None,
+                 bases_por_linha: int = 0, bytes_por_linha: int = 0, inicio: int = 0):
+        self.buffer = buffer
+        self.offset = offset
+        self.inicio = inicio
+        self.bases_por_linha = bases_por_linha
+        self.bytes_por_linha = bytes_por_linha
+        if comprimento is None:
+            comprimento = len(buffer) - offset
+        self.comprimento = comprimento
+
+    @classmethod
+    def de_bytes(cls, dados) -> "SequenciaMapeada":
+        """
+        Cria uma visão sobre bytes contíguos (bytes, bytearray, memoryview, shared memory).
+
+        Exemplo:
+            str(SequenciaMapeada.de_bytes(b"ATGCGT")[1:4]) -> "TGC"
+        """
+        return cls(memoryview(dados).cast("B"))
+
+    @property
+    def sequencia(self) -> str:
+        return self._ler(0, self.comprimento)
+
+    def __reduce__(self):
+        # O buffer (mmap, memória compartilhada) não pode ser enviado a outro
+        # processo; a cópia leva a sequência materializada.
+        return Sequencia, (self.sequencia,)
+
+    def __repr__(self):
+        return f"SequenciaMapeada(comprimento={self.comprimento})"
+
+    def __len__(self):
+        return self.comprimento
+
+    def __iter__(self):
+        for inicio in range(0, self.comprimento, _BASES_POR_BLOCO):
+            yield from self._ler(inicio, min(inicio + _BASES_POR_BLOCO, self.comprimento))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            inicio, fim, passo = index.indices(self.comprimento)
+            if passo != 1:
+                return self.sequencia[index]
+            return SequenciaMapeada(
+                self.buffer,
+                offset=self.offset,
+                comprimento=max(fim - inicio, 0),
+                bases_por_linha=self.bases_por_linha,
+                bytes_por_linha=self.bytes_por_linha,
+                inicio=self.inicio + inicio,
+            )
+
+        if index < 0:
+            index += self.comprimento
+        if not 0 <= index < self.comprimento:
+            raise IndexError("índice fora da sequência")
+        return chr(self.buffer[self._byte(index)]).upper()
+
+    def visao_de_memoria(self) -> memoryview:
+        """
+        Retorna um memoryview das bases, sem cópia (os bytes como estão no buffer,
+        sem conversão para maiúsculas).
+
+        Só é possível quando as bases estão contíguas no buffer (sem quebras de linha).
+
+        Raises:
+            ValueError: Se a visão atravessa quebras de linha do arquivo.
+        """
+        inicio = self._byte(0)
+        if self.comprimento and self._byte(self.comprimento - 1) - inicio + 1 != self.comprimento:
+            raise ValueError("As bases não estão contíguas no buffer (há quebras de linha)")
+        return memoryview(self.buffer)[inicio:inicio + self.comprimento]
+
+    def _byte(self, posicao: int) -> int:
+        posicao += self.inicio
+        if not self.bases_por_linha:
+            return self.offset + posicao
+        linha, coluna = divmod(posicao, self.bases_por_linha)
+        return self.offset + linha * self.bytes_por_linha + coluna
+
+    def _ler(self, inicio: int, fim: int) -> str:
+        if fim <= inicio:
+            return ""
+        byte_inicio = self._byte(inicio)
+        byte_fim = self._byte(fim - 1) + 1
+        dados = bytes(self.buffer[byte_inicio:byte_fim])
+        return dados.translate(_MAIUSCULAS, _QUEBRAS_DE_LINHA).decode()
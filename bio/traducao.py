@@ -0,0 +1,115 @@
+"""
+Motor de tradução de DNA para proteína usado por Sequencia.traduzir().
+
+Com NumPy instalado, a tradução é vetorizada: as bases viram códigos inteiros
+(A=0, C=1, G=2, T=3 e 64 para qualquer outro caractere), os índices de todos os
+códons são calculados de uma vez (16*b1 + 4*b2 + b3) e consultados numa tabela
+de 65 posições, onde a última é o 'X' dos códons indefinidos. Sem NumPy, a
+tradução usa o laço em Python, com exatamente o mesmo resultado.
+"""
+from bio.constantes import DNA_PARA_AMINOACIDO, DNA_STOP_CODONS
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, usamos o laço em Python
+    np = None
+
+BASES = "ACGT"
+CODIGO_INDEFINIDO = 64
+
+CODONS = [a + b + c for a in BASES for b in BASES for c in BASES]
+AMINOACIDO_DO_CODON = "".join(
+    "*" if codon in DNA_STOP_CODONS else DNA_PARA_AMINOACIDO.get(codon, "X")
+    for codon in CODONS
+) + "X"
+
+if np is not None:
+    CODIGO_DA_BASE = np.full(256, CODIGO_INDEFINIDO, dtype=np.uint16)
+    for _codigo, _base in enumerate(BASES):
+        CODIGO_DA_BASE[ord(_base)] = _codigo
+        CODIGO_DA_BASE[ord(_base.lower())] = _codigo
+
+    TABELA_CODONS = np.frombuffer(AMINOACIDO_DO_CODON.encode(), dtype=np.uint8)
+
+
+def codificar(sequencia) -> "np.ndarray":
+    """
+    Converte uma sequência (str, bytes ou memoryview) em códigos 0-3, com 64 para bases indefinidas.
+
+    Exemplo:
+        codificar("ACGTN") -> array([ 0,  1,  2,  3, 64], dtype=uint16)
+    """
+    if isinstance(sequencia, str):
+        sequencia = sequencia.encode("ascii", "replace")
+    return CODIGO_DA_BASE[np.frombuffer(sequencia, dtype=np.uint8)]
+
+
+def indices_de_codons(codigos: "np.ndarray", quadro: int = 0) -> "np.ndarray":
+    """
+    Calcula, de uma vez, o índice (0-63) de cada códon completo a partir de `quadro`.
+
+    Códons com alguma base indefinida recebem o índice 64.
+    """
+    codigos = codigos[quadro:]
+    n = len(codigos) // 3
+    indices = (codigos[0:3 * n:3] * 16) + (codigos[1:3 * n:3] * 4) + codigos[2:3 * n:3]
+    return np.minimum(indices, CODIGO_INDEFINIDO)
+
+
+def indices_em_todas_as_posicoes(codigos: "np.ndarray") -> "np.ndarray":
+    """
+    Calcula o índice (0-63) da trinca que começa em cada posição (todas as fases juntas).
+
+    O resultado tem len(codigos) - 2 posições; a fase f é o fatiamento [f::3].
+    Trincas com alguma base indefinida recebem o índice 64.
+
+    Exemplo:
+        indices_em_todas_as_posicoes(codificar("ATGA")) -> array([14, 56], dtype=uint16)
+    """
+    if len(codigos) < 3:
+        return np.zeros(0, dtype=codigos.dtype)
+    indices = codigos[:-2] * 16 + codigos[1:-1] * 4 + codigos[2:]
+    return np.minimum(indices, CODIGO_INDEFINIDO)
+
+
+def traduzir_indices(indices: "np.ndarray", parar: bool = False) -> str:
+    """
+    Converte índices de códons em aminoácidos pela tabela de 65 posições.
+    """
+    aminoacidos = TABELA_CODONS[indices]
+    if parar:
+        paradas = np.flatnonzero(aminoacidos == ord("*"))
+        if len(paradas):
+            aminoacidos = aminoacidos[:paradas[0]]
+    return aminoacidos.tobytes().decode()
+
+
+def traduzir(sequencia: str, parar: bool = False) -> str:
+    """
+    Traduz uma sequência de DNA (já em maiúsculas) para proteína.
+
+    Mesmas regras de Sequencia.traduzir(): stop codons viram '*', códons
+    indefinidos viram 'X' e, com parar=True, a tradução termina antes do primeiro '*'.
+    """
+    if np is None:
+        return _traduzir_python(sequencia, parar)
+    return traduzir_indices(indices_de_codons(codificar(sequencia)), parar)
+
+
+def _traduzir_python(seq: str, parar: bool) -> str:
+    proteina = []
+
+    for i in range(0, len(seq) - 2, 3):
+        codon = seq[i:i+3]
+
+        if codon in DNA_STOP_CODONS:
+            aa = "*"
+        else:
+            aa = DNA_PARA_AMINOACIDO.get(codon, "X")
+
+        if parar and aa == "*":
+            break
+
+        proteina.append(aa)
+
+    return "".join(proteina)
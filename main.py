@@ -13,7 +13,7 @@ Para cada organismo, são exibidas:
 - Percentual de bases A e T na sequência
 
 Requerimentos:
-- O módulo `bio.ler_fasta` deve conter a função `ler_fasta`, que retorna uma lista de objetos do tipo `OrganismoFasta`.
+- O módulo `bio.ler_fasta` deve conter a função `iter_fasta`, que gera objetos do tipo `OrganismoFasta` um a um.
 - Cada `OrganismoFasta` deve ter os atributos `id`, `nome` e `sequencia`.
 - O atributo `sequencia` deve ser uma instância da classe `Sequencia`, com os seguintes métodos:
 
@@ -26,7 +26,8 @@ Requerimentos:
 Uso:
     Execute este script diretamente. Ele irá processar o arquivo definido na variável `caminho` dentro da função `main`.
 """
-from bio.ler_fasta import ler_fasta
+from bio.ler_fasta import iter_fasta
+from bio.instrumentacao import relatorio_se_pedido
 
 def exibir_resultado(organismo):
     """
@@ -78,21 +79,28 @@ def main():
     Responsável por:
     ----------------
     - Definir o caminho do arquivo FASTA a ser processado.
-    - Carregar os dados genômicos utilizando a função `ler_fasta`.
+    - Percorrer os dados genômicos utilizando a função `iter_fasta`, guardando só os três primeiros organismos.
     - Exibir o total de organismos lidos.
-    - Chamar `exibir_resultado` para os três primeiros organismos da lista.
+    - Chamar `exibir_resultado` para os três primeiros organismos do arquivo.
 
     Observação:
     ----------
     O arquivo FASTA deve estar codificado corretamente e conter múltiplos registros no padrão FASTA.
     """
     caminho = "arquivos/Flaviviridae-genomes.fasta"
-    organismos = ler_fasta(caminho)
+    primeiros = []
+    total = 0
 
-    print(f"Total de organismos lidos: {len(organismos)}\n")
+    for organismo in iter_fasta(caminho):
+        if total < 3:  # Limita saída para os 3 primeiros
+            primeiros.append(organismo)
+        total += 1
 
-    for organismo in organismos[:3]:  # Limita saída para os 3 primeiros
+    print(f"Total de organismos lidos: {total}\n")
+
+    for organismo in primeiros:
         exibir_resultado(organismo)
 
 if __name__ == "__main__":
-    main()
+    with relatorio_se_pedido():
+        main()
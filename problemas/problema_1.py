@@ -5,6 +5,9 @@ Este script realiza o parse de um arquivo multiFASTA e imprime:
 - O percentual de cada base (A, T, C, G)
 - O conteúdo GC para cada sequência
 
+Os registros são analisados em paralelo, em vários processos (bio.paralelo),
+e os relatórios são impressos na ordem do arquivo.
+
 Uso:
     python problemas/problema_1.py
 """
@@ -12,27 +15,38 @@ Uso:
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from bio.ler_fasta import ler_fasta
+from bio.ler_fasta import iter_fasta
+from bio.paralelo import iterar_em_lote
+from bio.instrumentacao import relatorio_se_pedido
 
 def main():
     """
     Executa a análise de composição de nucleotídeos para cada organismo do FASTA.
     """
-    organismos = ler_fasta("arquivos/Flaviviridae-genomes.fasta")
+    organismos = iter_fasta("arquivos/Flaviviridae-genomes.fasta")
 
     print("Análise de composição de nucleotídeos:\n")
-    for o in organismos:
-        print("=" * 60)
-        print(f"ID: {o.id}")
-        print(f"Nome: {o.nome}")
-        print(f"A: {o.sequencia.calcular_percentual(['A']) * 100:.2f}%")
-        print(f"T: {o.sequencia.calcular_percentual(['T']) * 100:.2f}%")
-        print(f"C: {o.sequencia.calcular_percentual(['C']) * 100:.2f}%")
-        print(f"G: {o.sequencia.calcular_percentual(['G']) * 100:.2f}%")
-        gc = o.sequencia.calcular_percentual(['G', 'C']) * 100
-        print(f"GC Content: {gc:.2f}%")
-        print("=" * 60)
-        print()
+    for relatorio in iterar_em_lote(gerar_relatorio, organismos):
+        print(relatorio)
+
+def gerar_relatorio(o):
+    """
+    Monta o relatório de composição de um organismo.
+    """
+    gc = o.sequencia.calcular_percentual(['G', 'C']) * 100
+    return "\n".join([
+        "=" * 60,
+        f"ID: {o.id}",
+        f"Nome: {o.nome}",
+        f"A: {o.sequencia.calcular_percentual(['A']) * 100:.2f}%",
+        f"T: {o.sequencia.calcular_percentual(['T']) * 100:.2f}%",
+        f"C: {o.sequencia.calcular_percentual(['C']) * 100:.2f}%",
+        f"G: {o.sequencia.calcular_percentual(['G']) * 100:.2f}%",
+        f"GC Content: {gc:.2f}%",
+        "=" * 60,
+        "",
+    ])
 
 if __name__ == "__main__":
-    main()
+    with relatorio_se_pedido():
+        main()
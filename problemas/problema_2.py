@@ -4,6 +4,9 @@ Problema 2: Tradução de Sequências para Proteínas
 Este script faz o parse de um arquivo multiFASTA, traduz cada sequência
 de nucleotídeos para sua cadeia de aminoácidos e imprime o resultado.
 
+Cada processo lê e traduz uma faixa do arquivo (bio.paralelo), e os
+resultados são impressos na ordem do arquivo.
+
 Uso:
     python problemas/problema_2.py
 """
@@ -11,23 +14,33 @@ Uso:
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from bio.ler_fasta import ler_fasta
+from bio.paralelo import executar_em_fragmentos
+from bio.instrumentacao import relatorio_se_pedido
 
 def main():
     """
     Executa a tradução de todas as sequências do FASTA para proteínas.
     """
-    organismos = ler_fasta("arquivos/Flaviviridae-genomes.fasta")
+    relatorios = executar_em_fragmentos(gerar_relatorio, "arquivos/Flaviviridae-genomes.fasta")
 
     print("Tradução das sequências de nucleotídeos:\n")
-    for o in organismos:
-        print("=" * 60)
-        print(f"ID: {o.id}")
-        print(f"Nome: {o.nome}")
-        proteina = o.sequencia.traduzir(parar=False)
-        print(f"Proteína (início): {proteina[:100]}...")
-        print("=" * 60)
-        print()
+    for relatorio in relatorios:
+        print(relatorio)
+
+def gerar_relatorio(o):
+    """
+    Traduz a sequência de um organismo e monta o seu relatório.
+    """
+    proteina = o.sequencia.traduzir(parar=False)
+    return "\n".join([
+        "=" * 60,
+        f"ID: {o.id}",
+        f"Nome: {o.nome}",
+        f"Proteína (início): {proteina[:100]}...",
+        "=" * 60,
+        "",
+    ])
 
 if __name__ == "__main__":
-    main()
+    with relatorio_se_pedido():
+        main()
@@ -6,6 +6,12 @@ na posição 1000 das sequências de um arquivo multiFASTA.
 
 Se a base na posição 1000 for 'G', considera-se que a mutação está presente.
 
+A verificação usa a varredura vetorizada de bio.mutacoes, que recebe uma tabela
+de sítios (posição, referência, alternativa): aqui há um só sítio, mas o mesmo
+código verifica um painel com milhares de sítios numa única chamada. As bases
+são lidas pelo índice .fai do arquivo (bio.indice_fasta), com um seek por
+registro, sem carregar as sequências.
+
 Uso:
     python problemas/problema_3.py
 """
@@ -13,29 +19,41 @@ Uso:
 import sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from bio.ler_fasta import ler_fasta
+from bio.indice_fasta import FastaIndex
+from bio.mutacoes import ALTERNATIVA, CURTA, REFERENCIA, varrer_mutacoes
+from bio.instrumentacao import relatorio_se_pedido
+
+SITIOS = [(1000, "A", "G")]
 
 def main():
     """
     Verifica a presença da mutação A → G na posição 1000 das sequências.
     Gera um relatório com os organismos que têm ou não a mutação.
     """
-    organismos = ler_fasta("arquivos/Flaviviridae-genomes.fasta")
-
-    print("Relatório de mutação na posição 1000 (A → G):\n")
-    for o in organismos:
-        if len(o.sequencia) < 1000:
-            status = "Sequência muito curta"
-        else:
-            nt = o.sequencia[999]  # posição 1000 = índice 999
-            if nt.upper() == "G":
-                status = "Mutação presente (A→G)"
-            elif nt.upper() == "A":
-                status = "Sem mutação (ainda é A)"
-            else:
-                status = f"Outro nucleotídeo encontrado: {nt}"
-
-        print(f"{o.id} - {o.nome} → {status}")
+    with FastaIndex("arquivos/Flaviviridae-genomes.fasta") as indice:
+        genotipos = varrer_mutacoes(indice, SITIOS)
+
+        print("Relatório de mutação na posição 1000 (A → G):\n")
+        for i, id_organismo in enumerate(genotipos.ids):
+            o = indice.organismo(id_organismo)
+            exibir_status(o, genotipos.estados[i, 0], genotipos.base(i, 0))
+
+
+def exibir_status(o, estado, nt):
+    """
+    Imprime se o organismo tem a mutação A → G na posição 1000.
+    """
+    if estado == CURTA:
+        status = "Sequência muito curta"
+    elif estado == ALTERNATIVA:
+        status = "Mutação presente (A→G)"
+    elif estado == REFERENCIA:
+        status = "Sem mutação (ainda é A)"
+    else:
+        status = f"Outro nucleotídeo encontrado: {nt}"
+
+    print(f"{o.id} - {o.nome} → {status}")
 
 if __name__ == "__main__":
-    main()
+    with relatorio_se_pedido():
+        main()
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(RAIZ)
+
+ARQUIVO_FLAVIVIRIDAE = os.path.join(RAIZ, "arquivos", "Flaviviridae-genomes.fasta")
+
+
+@pytest.fixture
+def escrever_fasta_texto(tmp_path):
+    """Grava um texto FASTA num arquivo temporário e devolve o caminho."""
+    def escrever(texto: str, nome: str = "entrada.fasta") -> str:
+        caminho = tmp_path / nome
+        caminho.write_text(texto)
+        return str(caminho)
+
+    return escrever
@@ -0,0 +1,126 @@
+import random
+
+import pytest
+
+from bio.alinhamento import alinhar, alinhar_contra_colecao, pontuar
+from bio.organismo_fasta import OrganismoFasta
+
+INFINITO = float("-inf")
+PARAMETROS = dict(correspondencia=2, divergencia=-1, abertura=-5, extensao=-1)
+
+
+def _gotoh(a, b, local, correspondencia, divergencia, abertura, extensao):
+    """Gotoh com as matrizes completas, célula a célula."""
+    n, m = len(a), len(b)
+    H = [[INFINITO] * (m + 1) for _ in range(n + 1)]
+    E = [[INFINITO] * (m + 1) for _ in range(n + 1)]
+    F = [[INFINITO] * (m + 1) for _ in range(n + 1)]
+    H[0][0] = 0.0
+    melhor = 0.0
+    for i in range(n + 1):
+        for j in range(m + 1):
+            if i == 0 and j == 0:
+                continue
+            if j > 0:
+                E[i][j] = max(H[i][j - 1] + abertura, E[i][j - 1] + extensao)
+            if i > 0:
+                F[i][j] = max(H[i - 1][j] + abertura, F[i - 1][j] + extensao)
+            diagonal = INFINITO
+            if i > 0 and j > 0:
+                diagonal = H[i - 1][j - 1] + (correspondencia if a[i - 1] == b[j - 1] else divergencia)
+            H[i][j] = max(diagonal, E[i][j], F[i][j])
+            if local:
+                H[i][j] = max(H[i][j], 0.0)
+                melhor = max(melhor, H[i][j])
+    return melhor if local else H[n][m]
+
+
+def _pontuar_colunas(alinhada_a, alinhada_b, correspondencia, divergencia, abertura, extensao):
+    total, gap_a, gap_b = 0.0, False, False
+    for x, y in zip(alinhada_a, alinhada_b):
+        if x == "-":
+            total += extensao if gap_a else abertura
+            gap_a, gap_b = True, False
+        elif y == "-":
+            total += extensao if gap_b else abertura
+            gap_a, gap_b = False, True
+        else:
+            total += correspondencia if x == y else divergencia
+            gap_a = gap_b = False
+    return total
+
+
+def _par(semente, n, m):
+    gerador = random.Random(semente)
+    a = "".join(gerador.choices("ACGT", k=n))
+    b = list(a[:m].ljust(m, "A"))
+    for _ in range(m // 6):
+        b[gerador.randrange(m)] = gerador.choice("ACGT")
+    if m > 10:
+        del b[m // 3:m // 3 + 3]
+        b.insert(2 * m // 3, "TTAG")
+    return a, "".join(b)
+
+
+CASOS = [(0, 0, 0), (1, 1, 0), (2, 0, 5), (3, 5, 0), (4, 12, 15), (5, 30, 22), (6, 40, 40)]
+
+
+@pytest.mark.parametrize("modo", ["global", "local"])
+@pytest.mark.parametrize("semente,n,m", CASOS)
+def test_pontuacao_igual_a_forca_bruta(modo, semente, n, m):
+    a, b = _par(semente, n, m)
+    esperado = _gotoh(a, b, modo == "local", **PARAMETROS)
+    assert pontuar(a, b, modo, **PARAMETROS) == esperado
+    assert pontuar(a, b, modo, banda=max(n, m) + 1, **PARAMETROS) == esperado
+
+
+@pytest.mark.parametrize("modo", ["global", "local"])
+@pytest.mark.parametrize("semente,n,m", CASOS)
+def test_alinhamento_reconstruido_e_coerente(modo, semente, n, m):
+    a, b = _par(semente, n, m)
+    alinhamento = alinhar(a, b, modo, **PARAMETROS)
+    assert alinhamento.pontuacao == pontuar(a, b, modo, **PARAMETROS)
+    assert len(alinhamento.alinhada_a) == len(alinhamento.alinhada_b)
+    assert alinhamento.alinhada_a.replace("-", "") == a[alinhamento.inicio_a:alinhamento.fim_a]
+    assert alinhamento.alinhada_b.replace("-", "") == b[alinhamento.inicio_b:alinhamento.fim_b]
+    if len(alinhamento):
+        assert _pontuar_colunas(alinhamento.alinhada_a, alinhamento.alinhada_b,
+                                **PARAMETROS) == alinhamento.pontuacao
+    if modo == "global":
+        assert (alinhamento.inicio_a, alinhamento.fim_a) == (0, len(a))
+        assert (alinhamento.inicio_b, alinhamento.fim_b) == (0, len(b))
+
+
+@pytest.mark.parametrize("banda", [0, 2, 5])
+def test_banda_estreita_nunca_supera_a_matriz_inteira(banda):
+    a, b = _par(7, 60, 50)
+    completa = pontuar(a, b)
+    com_banda = alinhar(a, b, banda=banda)
+    assert com_banda.pontuacao <= completa
+    assert com_banda.alinhada_a.replace("-", "") == a
+    assert com_banda.alinhada_b.replace("-", "") == b
+
+
+def test_exemplo_da_documentacao():
+    alinhamento = alinhar("GATTACA", "GCATGCA")
+    assert alinhamento.pontuacao == pontuar("GATTACA", "GCATGCA") == 5.0
+    assert str(alinhamento).splitlines()[0].replace("-", "") == "GATTACA"
+
+
+def test_modo_invalido():
+    with pytest.raises(ValueError):
+        pontuar("A", "A", modo="semiglobal")
+
+
+def test_identidade():
+    assert alinhar("ACGT", "ACGT").identidade() == 1.0
+    assert alinhar("", "").identidade() == 0.0
+
+
+def test_contra_colecao():
+    organismos = [OrganismoFasta(f"r{i}", "", _par(i, 30, 28)[1]) for i in range(4)]
+    consulta = _par(0, 30, 28)[0]
+    resultado = alinhar_contra_colecao(consulta, organismos, trabalhadores=1, banda=10)
+    assert resultado == [(o.id, pontuar(consulta, o.sequencia, banda=10)) for o in organismos]
+    (_, alinhamento), *_ = alinhar_contra_colecao(consulta, organismos[:1], False, trabalhadores=1)
+    assert alinhamento.pontuacao == pontuar(consulta, organismos[0].sequencia)
@@ -0,0 +1,64 @@
+import pytest
+
+from benchmarks import executar
+from benchmarks.gerar_dados import gerar_fasta
+from bio.ler_fasta import ler_fasta
+
+OPERACOES_POR_REGISTRO = ["OrganismoFasta", "complementar", "complementar_reversa",
+                          "transcrever", "traduzir", "calcular_percentual"]
+
+
+@pytest.fixture
+def sintetico(tmp_path):
+    caminho = tmp_path / "sintetico.fasta"
+    gerar_fasta(caminho, 50_000, semente=3)
+    return str(caminho)
+
+
+def test_medir_conjunto_conta_registros_e_bases(sintetico):
+    organismos = ler_fasta(sintetico)
+    resultado = executar.medir_conjunto("s", sintetico, repeticoes=2)
+    assert resultado["registros"] == len(organismos)
+    assert resultado["bases"] == sum(len(o.sequencia) for o in organismos)
+    assert list(resultado["operacoes"]) == ["ler_fasta", "iter_fasta"] + OPERACOES_POR_REGISTRO
+    for medida in resultado["operacoes"].values():
+        assert set(medida) == {"segundos_min", "segundos_mediana", "pico_memoria_bytes",
+                               "bases_por_segundo"}
+        assert 0 <= medida["segundos_min"] <= medida["segundos_mediana"]
+        assert medida["pico_memoria_bytes"] >= 0
+
+
+def test_ler_fasta_fica_de_fora_acima_do_limite(monkeypatch, sintetico):
+    def falhar(*args, **kwargs):
+        raise AssertionError("ler_fasta não deve carregar arquivos acima do limite")
+
+    monkeypatch.setattr(executar, "ler_fasta", falhar)
+    resultado = executar.medir_conjunto("s", sintetico, repeticoes=1, limite_ler_fasta=1000)
+    assert "ler_fasta" not in resultado["operacoes"]
+    assert "iter_fasta" in resultado["operacoes"]
+
+
+def test_pico_de_memoria_e_por_registro(sintetico):
+    _, _, medidas = executar.medir_por_registro(sintetico, repeticoes=1)
+    maior = max(len(o.sequencia) for o in ler_fasta(sintetico))
+    # str() da complementar reversa aloca poucas cópias do maior registro, não o arquivo todo.
+    assert medidas["complementar_reversa"]["pico_memoria_bytes"] < 10 * maior + 10_000
+
+
+def test_arquivo_vazio(tmp_path):
+    caminho = tmp_path / "vazio.fasta"
+    caminho.write_text("")
+    resultado = executar.medir_conjunto("vazio", str(caminho), repeticoes=1)
+    assert (resultado["registros"], resultado["bases"]) == (0, 0)
+    assert resultado["operacoes"]["traduzir"]["segundos_min"] == 0.0
+
+
+def test_comparar_aponta_regressoes():
+    def resultado(segundos):
+        return {"conjuntos": [{"nome": "s", "operacoes": {
+            nome: {"segundos_min": valor} for nome, valor in segundos.items()}}]}
+
+    anterior = resultado({"traduzir": 1.0, "complementar": 1.0})
+    atual = resultado({"traduzir": 1.5, "complementar": 1.05, "ler_fasta": 9.0})
+    assert executar.comparar(atual, anterior) == ["s / traduzir: 1.50x mais lento"]
+    assert executar.comparar(anterior, anterior) == []
@@ -0,0 +1,118 @@
+import gzip
+import io
+import random
+
+import pytest
+
+from bio import bgzf
+from bio.bgzf import (LeitorBGZF, abrir_binario, abrir_sequencial, comprimir_bgzf, construir_gzi,
+                      ler_gzi, tipo_de_compressao)
+from bio.indice_fasta import FastaIndex
+from bio.ler_fasta import iter_fasta, ler_fasta
+from conftest import ARQUIVO_FLAVIVIRIDAE
+
+
+@pytest.fixture
+def dados():
+    gerador = random.Random(11)
+    return "".join(f">r{i} |registro {i}\n" + "".join(gerador.choices("ACGT", k=70)) + "\n"
+                   for i in range(3000)).encode()
+
+
+@pytest.fixture
+def caminhos(tmp_path, dados):
+    texto = tmp_path / "entrada.fasta"
+    texto.write_bytes(dados)
+    comprimido = tmp_path / "entrada.fasta.gz"
+    comprimir_bgzf(texto, comprimido)
+    comum = tmp_path / "comum.fasta.gz"
+    comum.write_bytes(gzip.compress(dados))
+    return str(texto), str(comprimido), str(comum)
+
+
+def test_tipo_de_compressao(caminhos):
+    assert [tipo_de_compressao(c) for c in caminhos] == [None, "bgzf", "gzip"]
+
+
+def test_bgzf_e_lido_pelo_modulo_gzip(caminhos, dados):
+    assert gzip.decompress(open(caminhos[1], "rb").read()) == dados
+
+
+@pytest.mark.parametrize("tamanho_buffer", [1, 1000, 1 << 20])
+def test_abrir_sequencial_nos_tres_formatos(caminhos, dados, tamanho_buffer):
+    for caminho in caminhos:
+        with abrir_sequencial(caminho, tamanho_buffer) as arquivo:
+            assert b"".join(arquivo) == dados
+
+
+def test_gzip_comum_respeita_o_buffer(monkeypatch, caminhos):
+    pedidos = []
+    original = gzip.GzipFile.readinto
+    monkeypatch.setattr(gzip.GzipFile, "readinto",
+                        lambda self, destino: pedidos.append(len(destino)) or original(self, destino))
+    with abrir_sequencial(caminhos[2], 1 << 18) as arquivo:
+        for _ in arquivo:
+            pass
+    assert max(pedidos) == 1 << 18
+
+
+def test_leitura_fasta_comprimida_igual_a_texto(caminhos):
+    esperado = [(o.id, str(o.sequencia)) for o in ler_fasta(caminhos[0])]
+    for caminho in caminhos[1:]:
+        assert [(o.id, str(o.sequencia)) for o in iter_fasta(caminho)] == esperado
+
+
+@pytest.mark.parametrize("trabalhadores", [1, 3])
+def test_seek_por_posicao_e_virtual(caminhos, dados, trabalhadores):
+    with LeitorBGZF(caminhos[1], trabalhadores=trabalhadores) as leitor:
+        for posicao in (0, 70_000, len(dados) - 5, 123_456, 10):
+            leitor.seek(posicao)
+            assert leitor.read(50) == dados[posicao:posicao + 50]
+        leitor.seek(-3, io.SEEK_END)
+        assert leitor.read() == dados[-3:]
+
+        leitor.seek(70_000)
+        virtual = leitor.tell_virtual()
+        leitor.seek(0)
+        leitor.seek_virtual(virtual)
+        assert leitor.tell() == 70_000
+        assert leitor.read(10) == dados[70_000:70_010]
+        with pytest.raises(ValueError):
+            leitor.seek_virtual((virtual >> 16) + 1 << 16)
+
+
+def test_gzi_ida_e_volta(caminhos):
+    offsets, inicios = construir_gzi(caminhos[1])
+    assert len(offsets) > 1
+    assert ler_gzi(caminhos[1] + ".gzi") == (offsets, inicios)
+
+
+def test_fasta_index_em_bgzf(caminhos):
+    with FastaIndex(caminhos[0]) as texto, FastaIndex(caminhos[1]) as comprimido:
+        assert comprimido.comprimido
+        assert list(comprimido) == list(texto)
+        for id in ("r0", "r1500", "r2999"):
+            assert comprimido.buscar(id, 5, 60) == texto.buscar(id, 5, 60)
+            assert comprimido.cabecalho(id) == texto.cabecalho(id)
+        with pytest.raises(ValueError):
+            comprimido.mapear("r0")
+
+
+def test_gzip_comum_nao_permite_acesso_aleatorio(caminhos):
+    with pytest.raises(ValueError):
+        abrir_binario(caminhos[2])
+    with pytest.raises(ValueError):
+        FastaIndex(caminhos[2])
+
+
+def test_arquivo_do_projeto(tmp_path):
+    comprimido = tmp_path / "flaviviridae.fasta.gz"
+    comprimir_bgzf(ARQUIVO_FLAVIVIRIDAE, comprimido)
+    assert sum(1 for _ in iter_fasta(comprimido)) == 159
+
+
+def test_bloco_invalido(tmp_path):
+    caminho = tmp_path / "quebrado.gz"
+    caminho.write_bytes(bgzf.bloco_bgzf(b"ACGT")[:10] + b"\x00" * 20)
+    with pytest.raises(ValueError):
+        bgzf._tabela_de_blocos(caminho)
@@ -0,0 +1,141 @@
+import os
+import tempfile
+
+import pytest
+
+from bio import cache_fasta
+from bio.cache_fasta import caminho_do_cache, carregar_cache, gravar_cache
+from bio.ler_fasta import ler_fasta
+from bio.sequencia_mapeada import SequenciaMapeada
+
+TEXTO = ">NC_1.1 |Vírus um\nACGTAC\nGT\n>NC_2.1 |Vírus dois\n\n>NC_3.1 |Três\nttttgggg\n"
+
+
+def _tuplas(organismos):
+    return [(o.id, o.nome, str(o.sequencia)) for o in organismos]
+
+
+@pytest.fixture
+def caminho(escrever_fasta_texto):
+    return escrever_fasta_texto(TEXTO)
+
+
+def test_ida_e_volta(caminho):
+    esperado = _tuplas(ler_fasta(caminho))
+    assert not os.path.exists(caminho_do_cache(caminho))
+    assert _tuplas(ler_fasta(caminho, cache=True)) == esperado
+    assert os.path.exists(caminho_do_cache(caminho))
+
+    carregados = carregar_cache(caminho)
+    assert _tuplas(carregados) == esperado
+    assert all(isinstance(o.sequencia, SequenciaMapeada) for o in carregados)
+    assert [f for f in os.listdir(os.path.dirname(caminho)) if f.endswith(".tmp")] == []
+
+
+def test_cache_e_opcional(caminho):
+    ler_fasta(caminho)
+    assert not os.path.exists(caminho_do_cache(caminho))
+
+
+def test_caminho_cache_proprio(caminho, tmp_path):
+    destino = tmp_path / "outro" / "colecao.bioc"
+    destino.parent.mkdir()
+    assert _tuplas(ler_fasta(caminho, caminho_cache=str(destino))) == _tuplas(ler_fasta(caminho))
+    assert destino.exists()
+    assert not os.path.exists(caminho_do_cache(caminho))
+    assert _tuplas(carregar_cache(caminho, str(destino))) == _tuplas(ler_fasta(caminho))
+
+
+def test_fasta_alterado_invalida_o_cache(caminho):
+    ler_fasta(caminho, cache=True)
+    with open(caminho, "a") as arquivo:
+        arquivo.write(">NC_4.1 |Quatro\nA\n")
+    assert carregar_cache(caminho) is None
+    assert [o.id for o in ler_fasta(caminho, cache=True)][-1] == "NC_4.1"
+
+
+def test_verificar_conteudo(caminho):
+    gravar_cache(caminho, ler_fasta(caminho))
+    estado = os.stat(caminho)
+    with open(caminho, "r+") as arquivo:
+        arquivo.seek(TEXTO.index("ACGT"))
+        arquivo.write("TTTT")
+    os.utime(caminho, ns=(estado.st_atime_ns, estado.st_mtime_ns))
+    assert carregar_cache(caminho) is not None
+    assert carregar_cache(caminho, verificar_conteudo=True) is None
+
+
+@pytest.mark.parametrize("tamanho", [0, 10, cache_fasta._CABECALHO.size, cache_fasta._CABECALHO.size + 20, -1])
+def test_cache_truncado(caminho, tamanho):
+    gravado = gravar_cache(caminho, ler_fasta(caminho))
+    with open(gravado, "r+b") as arquivo:
+        arquivo.truncate(os.path.getsize(gravado) + tamanho if tamanho < 0 else tamanho)
+    assert carregar_cache(caminho) is None
+    assert _tuplas(ler_fasta(caminho, cache=True)) == _tuplas(ler_fasta(caminho))
+
+
+@pytest.mark.parametrize("posicao", ["assinatura", "metadados", "offsets"])
+def test_cache_corrompido(caminho, posicao):
+    gravado = gravar_cache(caminho, ler_fasta(caminho))
+    inicio_offsets = cache_fasta._CABECALHO.size
+    byte, valor = {
+        "assinatura": (0, b"X"),
+        "metadados": (inicio_offsets + 8 * 4, b"{"),
+        "offsets": (inicio_offsets + 8 * 2 + 7, b"\xff"),
+    }[posicao]
+    with open(gravado, "r+b") as arquivo:
+        arquivo.seek(byte)
+        arquivo.write(valor)
+    assert carregar_cache(caminho) is None
+
+
+def test_mapa_fechado_quando_o_cache_e_rejeitado(monkeypatch, caminho):
+    gravar_cache(caminho, ler_fasta(caminho))
+    os.utime(caminho, ns=(0, 0))
+    mapas = []
+    original = cache_fasta.mmap.mmap
+    monkeypatch.setattr(cache_fasta.mmap, "mmap",
+                        lambda *args, **kwargs: mapas.append(original(*args, **kwargs)) or mapas[-1])
+    assert carregar_cache(caminho) is None
+    assert mapas and all(mapa.closed for mapa in mapas)
+
+
+def test_diretorio_sem_permissao_de_escrita(caminho, tmp_path):
+    somente_leitura = tmp_path / "somente_leitura"
+    somente_leitura.mkdir()
+    os.chmod(somente_leitura, 0o555)
+    try:
+        if os.access(somente_leitura, os.W_OK):
+            pytest.skip("o usuário atual ignora as permissões do diretório")
+        destino = str(somente_leitura / "colecao.bioc")
+        assert _tuplas(ler_fasta(caminho, caminho_cache=destino)) == _tuplas(ler_fasta(caminho))
+        assert os.listdir(somente_leitura) == []
+    finally:
+        os.chmod(somente_leitura, 0o755)
+
+
+def test_falha_na_gravacao_nao_impede_a_leitura(monkeypatch, caminho, tmp_path):
+    def negar(*args, **kwargs):
+        raise PermissionError("somente leitura")
+
+    monkeypatch.setattr(tempfile, "mkstemp", negar)
+    assert _tuplas(ler_fasta(caminho, cache=True)) == _tuplas(ler_fasta(caminho))
+    destino = str(tmp_path / "nao_existe" / "colecao.bioc")
+    monkeypatch.undo()
+    assert _tuplas(ler_fasta(caminho, caminho_cache=destino)) == _tuplas(ler_fasta(caminho))
+
+
+def test_erro_durante_a_gravacao_remove_o_temporario(caminho, tmp_path):
+    class SequenciaQuebrada:
+        def __len__(self):
+            return 4
+
+        def __str__(self):
+            raise OSError("falha de leitura")
+
+    organismo = ler_fasta(caminho)[0]
+    organismo.sequencia = SequenciaQuebrada()
+    with pytest.raises(OSError, match="falha de leitura"):
+        gravar_cache(caminho, [organismo], str(tmp_path / "colecao.bioc"))
+    assert not (tmp_path / "colecao.bioc").exists()
+    assert [f for f in os.listdir(tmp_path) if f.endswith(".tmp")] == []
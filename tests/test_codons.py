@@ -0,0 +1,118 @@
+import math
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from bio import codons as modulo_codons
+from bio import colecao as modulo_colecao
+from bio.codons import ENC_MAXIMO, contar_codons
+from bio.colecao import ColecaoSequencias
+from bio.ler_fasta import ler_fasta
+from bio.organismo_fasta import OrganismoFasta
+from bio.traducao import AMINOACIDO_DO_CODON, CODONS
+from conftest import ARQUIVO_FLAVIVIRIDAE
+
+
+def _contagens(texto, quadro):
+    trincas = (texto[i:i + 3] for i in range(quadro, len(texto) - 2, 3))
+    contagem = Counter(t for t in trincas if set(t) <= set("ACGT"))
+    return [contagem[codon] for codon in CODONS]
+
+
+def _familias():
+    familias = {}
+    for codon, aminoacido in zip(CODONS, AMINOACIDO_DO_CODON):
+        familias.setdefault(aminoacido, []).append(CODONS.index(codon))
+    return familias
+
+
+def _rscu(contagens):
+    rscu = [0.0] * 64
+    for indices in _familias().values():
+        total = sum(contagens[i] for i in indices)
+        for i in indices:
+            rscu[i] = contagens[i] / (total / len(indices)) if total else 0.0
+    return rscu
+
+
+def _enc(contagens):
+    por_grau = {}
+    for aminoacido, indices in _familias().items():
+        if aminoacido == "*" or len(indices) == 1:
+            continue
+        n = sum(contagens[i] for i in indices)
+        if n > 1:
+            soma = sum((contagens[i] / n) ** 2 for i in indices)
+            por_grau.setdefault(len(indices), []).append((n * soma - 1) / (n - 1))
+    medias = {grau: sum(f) / len(f) for grau, f in por_grau.items()}
+    if 3 not in medias and 2 in medias and 4 in medias:
+        medias[3] = (medias[2] + medias[4]) / 2
+    graus = Counter(len(i) for a, i in _familias().items() if a != "*")
+    if any(grau not in medias for grau in graus if grau > 1):
+        return math.nan
+    # F médio nulo (amostras pequenas) leva o ENC ao máximo, como a divisão em NumPy
+    return min(graus[1] + sum(graus[grau] / medias[grau] if medias[grau] else math.inf
+                              for grau in medias), ENC_MAXIMO)
+
+
+@pytest.fixture
+def textos():
+    gerador = random.Random(11)
+    return ["", "A", "ATG", "ATGA", "ATGNAAC", "".join(gerador.choices("ACGT", k=700))] + \
+        ["".join(gerador.choices("ACGTACGTN", k=k)) for k in (5, 31, 120, 333)]
+
+
+@pytest.fixture(params=[1 << 22, 50])
+def uso(request, monkeypatch, textos):
+    # com 50 bases por bloco, há blocos com vários registros e registros longos contados por trechos
+    monkeypatch.setattr(modulo_colecao, "BASES_POR_BLOCO", request.param)
+    monkeypatch.setattr(modulo_codons, "BASES_POR_BLOCO", request.param)
+    return contar_codons(OrganismoFasta(str(i), "", t) for i, t in enumerate(textos))
+
+
+def test_contagens_nas_tres_fases(uso, textos):
+    assert uso.contagens.shape == (len(textos), 3, 64)
+    for quadro in range(3):
+        assert uso.matriz(quadro).tolist() == [_contagens(t, quadro) for t in textos]
+    assert list(uso.ids) == [str(i) for i in range(len(textos))]
+
+
+def test_rscu(uso, textos):
+    esperado = [_rscu(_contagens(t, 0)) for t in textos]
+    np.testing.assert_allclose(uso.rscu(), esperado)
+
+
+def test_enc_igual_a_referencia(uso, textos):
+    esperado = [_enc(_contagens(t, 0)) for t in textos]
+    np.testing.assert_allclose(uso.enc(), esperado, equal_nan=True)
+
+
+def test_enc_nos_extremos():
+    sinonimos = _familias()
+    um_por_aminoacido = "".join(CODONS[indices[0]] * 5 for a, indices in sinonimos.items() if a != "*")
+    uniforme = "".join(codon * 40 for codon, a in zip(CODONS, AMINOACIDO_DO_CODON) if a != "*")
+    uso = contar_codons([OrganismoFasta("a", "", um_por_aminoacido), OrganismoFasta("b", "", uniforme)])
+    np.testing.assert_allclose(uso.enc(), [20, ENC_MAXIMO])
+
+
+def test_exemplo_do_docstring():
+    uso = contar_codons([OrganismoFasta("a", "", "ATGATGAAA")])
+    assert uso.matriz()[0, CODONS.index("ATG")] == 2
+    assert uso.matriz(1)[0, CODONS.index("TGA")] == 2
+    assert repr(uso) == "UsoDeCodons(registros=1, codons=3)"
+
+
+def test_colecao_vazia():
+    uso = contar_codons([])
+    assert len(uso) == 0
+    assert uso.rscu().shape == (0, 64)
+    assert uso.enc().shape == (0,)
+
+
+def test_aceita_colecao_e_arquivo_do_projeto():
+    organismos = ler_fasta(ARQUIVO_FLAVIVIRIDAE)[:8]
+    uso = contar_codons(ColecaoSequencias.de_organismos(organismos))
+    assert uso.matriz(2).tolist() == [_contagens(str(o.sequencia), 2) for o in organismos]
+    assert np.all((uso.enc() >= 20) & (uso.enc() <= ENC_MAXIMO))
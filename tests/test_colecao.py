@@ -0,0 +1,134 @@
+import random
+
+import numpy as np
+import pytest
+
+from bio import colecao as modulo_colecao
+from bio.colecao import ColecaoSequencias, blocos
+from bio.ler_fasta import ler_fasta
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+from conftest import ARQUIVO_FLAVIVIRIDAE
+
+
+@pytest.fixture
+def organismos():
+    gerador = random.Random(8)
+    comprimentos = [0, 1, 2, 3, 5, 30, 31, 100, 0, 257, 64, 12]
+    return [OrganismoFasta(f"id{i}", f"nome {i}", "".join(gerador.choices("ACGTNR", k=k)))
+            for i, k in enumerate(comprimentos)]
+
+
+@pytest.fixture(params=[1 << 22, 40])
+def colecao(request, monkeypatch, organismos):
+    # com 40 bases por bloco, os registros são agrupados em várias faixas e os
+    # maiores ficam sozinhos no seu bloco
+    monkeypatch.setattr(modulo_colecao, "BASES_POR_BLOCO", request.param)
+    return ColecaoSequencias.de_organismos(organismos)
+
+
+def _textos(colecao):
+    return [str(organismo.sequencia) for organismo in colecao]
+
+
+def test_ida_e_volta(colecao, organismos):
+    assert len(colecao) == len(organismos)
+    assert _textos(colecao) == [str(o.sequencia) for o in organismos]
+    assert list(colecao.ids) == [o.id for o in organismos]
+    assert colecao[-1].nome == "nome 11"
+    assert list(colecao.comprimentos()) == [len(o.sequencia) for o in organismos]
+    with pytest.raises(IndexError):
+        colecao[len(organismos)]
+
+
+def test_composicao_e_gc(colecao, organismos):
+    alfabeto = "ACGTNR"
+    esperado = [[str(o.sequencia).count(base) for base in alfabeto] for o in organismos]
+    assert colecao.composicao(alfabeto).tolist() == esperado
+    assert colecao.composicao("acg").tolist() == [linha[:3] for linha in esperado]
+    assert colecao.conteudo_gc().tolist() == [o.sequencia.conteudo_gc() for o in organismos]
+    assert colecao.calcular_percentual(["G", "C"]).tolist() == \
+        [o.sequencia.calcular_percentual(["G", "C"]) for o in organismos]
+
+
+@pytest.mark.parametrize("operacao", ["complementar", "complementar_reversa", "transcrever"])
+def test_operacoes_de_fita(colecao, organismos, operacao):
+    resultado = getattr(colecao, operacao)()
+    assert _textos(resultado) == [str(getattr(o.sequencia, operacao)()) for o in organismos]
+    assert resultado.ids is colecao.ids
+
+
+@pytest.mark.parametrize("parar", [False, True])
+def test_traduzir(colecao, organismos, parar):
+    proteinas = colecao.traduzir(parar)
+    assert _textos(proteinas) == [o.sequencia.traduzir(parar) for o in organismos]
+
+
+def test_traduzir_com_paradas(monkeypatch):
+    monkeypatch.setattr(modulo_colecao, "BASES_POR_BLOCO", 10)
+    textos = ["ATGTAAGGG", "TAA", "", "ATGGGG", "GGGTAGTGA" * 3, "ATG" * 9]
+    colecao = ColecaoSequencias.de_organismos(OrganismoFasta(str(i), "", t) for i, t in enumerate(textos))
+    assert _textos(colecao.traduzir(parar=True)) == [Sequencia(t).traduzir(parar=True) for t in textos]
+
+
+def test_fatias_mascaras_e_indices(colecao, organismos):
+    textos = [str(o.sequencia) for o in organismos]
+    assert _textos(colecao[2:7]) == textos[2:7]
+    assert _textos(colecao[7:2]) == []
+    assert _textos(colecao[::-3]) == textos[::-3]
+    assert _textos(colecao[[3, 0, 3, -1]]) == [textos[i] for i in (3, 0, 3, -1)]
+    mascara = np.array([len(t) > 10 for t in textos])
+    assert _textos(colecao[mascara]) == [t for t in textos if len(t) > 10]
+    assert list(colecao.filtrar(lambda c: c.comprimentos() > 10).ids) == \
+        [o.id for o in organismos if len(o.sequencia) > 10]
+
+
+@pytest.mark.parametrize("selecao", [[12], [-13]])
+def test_indices_fora_da_colecao(colecao, selecao):
+    with pytest.raises(IndexError):
+        colecao.selecionar(selecao)
+
+
+def test_mascara_e_criterio_com_tamanho_errado(colecao):
+    with pytest.raises(ValueError):
+        colecao[np.ones(3, dtype=bool)]
+    with pytest.raises(ValueError):
+        colecao.filtrar([True])
+
+
+def test_colunas_inconsistentes():
+    with pytest.raises(ValueError):
+        ColecaoSequencias(np.zeros(4, np.uint8), [0, 2, 4], ["a"], ["b"])
+
+
+def test_colecao_vazia():
+    vazia = ColecaoSequencias.de_organismos([])
+    assert len(vazia) == 0
+    assert vazia.composicao().shape == (0, 5)
+    assert len(vazia.traduzir(parar=True)) == 0
+    assert len(vazia.complementar_reversa().bases) == 0
+    assert len(vazia.selecionar([])) == 0
+
+
+def test_sequencia_sem_copia(colecao):
+    sequencia = colecao.sequencia(-3)
+    assert str(sequencia) == _textos(colecao)[-3]
+    assert np.shares_memory(np.frombuffer(sequencia.buffer, np.uint8), colecao.bases)
+
+
+@pytest.mark.parametrize("comprimentos, limite, esperado", [
+    ([], 10, []),
+    ([3, 3, 3, 3], 6, [(0, 2), (2, 4)]),
+    ([20, 1, 1], 10, [(0, 1), (1, 3)]),
+    ([0, 0, 5], 5, [(0, 3)]),
+])
+def test_blocos(comprimentos, limite, esperado):
+    assert list(blocos(np.array(comprimentos, dtype=np.int64), limite)) == esperado
+
+
+def test_arquivo_do_projeto():
+    organismos = ler_fasta(ARQUIVO_FLAVIVIRIDAE)
+    colecao = ColecaoSequencias.de_fasta(ARQUIVO_FLAVIVIRIDAE)
+    assert len(colecao) == 159
+    assert colecao.conteudo_gc().tolist() == [o.sequencia.conteudo_gc() for o in organismos]
+    assert _textos(colecao[:5].traduzir()) == [o.sequencia.traduzir() for o in organismos[:5]]
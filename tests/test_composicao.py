@@ -0,0 +1,46 @@
+import pytest
+
+from bio.sequencia import Sequencia
+
+
+def test_exemplos_da_documentacao():
+    assert Sequencia("ATCGNA").composicao() == {"A": 2, "T": 1, "C": 1, "G": 1, "N": 1}
+    assert Sequencia("ATCGAAA").calcular_percentual(["A"]) == 0.57
+    assert Sequencia("ATCGCC").calcular_percentual(["C", "G"]) == 0.67
+    assert Sequencia("ATCGCC").conteudo_gc() == pytest.approx(4 / 6)
+
+
+def test_sequencia_vazia():
+    assert Sequencia("").composicao() == {}
+    assert Sequencia("").calcular_percentual(["A"]) == 0.0
+    assert Sequencia("").conteudo_gc() == 0.0
+
+
+def test_bases_em_minusculas_na_consulta():
+    assert Sequencia("aacc").calcular_percentual(["c"]) == 0.5
+
+
+def test_contagem_feita_uma_vez(monkeypatch):
+    sequencia = Sequencia("ACGTTT")
+    chamadas = []
+    original = Sequencia._contar_bases
+    monkeypatch.setattr(Sequencia, "_contar_bases",
+                        lambda self: chamadas.append(1) or original(self))
+    sequencia.calcular_percentual(["A"])
+    sequencia.conteudo_gc()
+    sequencia.composicao()
+    assert len(chamadas) == 1
+
+
+def test_alterar_a_sequencia_invalida_o_cache():
+    sequencia = Sequencia("AAAA")
+    assert sequencia.conteudo_gc() == 0.0
+    sequencia.sequencia = "GGCC"
+    assert sequencia.conteudo_gc() == 1.0
+
+
+def test_copia_devolvida_nao_altera_o_cache():
+    sequencia = Sequencia("AC")
+    sequencia.composicao()["A"] = 100
+    assert sequencia.composicao() == {"A": 1, "C": 1}
+
@@ -0,0 +1,158 @@
+import gzip
+import io
+import random
+
+import pytest
+
+from bio import bgzf, escrita_fasta
+from bio.bgzf import EscritorBGZF, LeitorBGZF, fim_de_arquivo_bgzf, tipo_de_compressao
+from bio.escrita_fasta import EscritorFasta, escrever_fasta
+from bio.ler_fasta import iter_fasta, ler_fasta
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+from conftest import ARQUIVO_FLAVIVIRIDAE
+
+
+def _tuplas(organismos):
+    return [(o.id, o.nome, str(o.sequencia)) for o in organismos]
+
+
+@pytest.fixture
+def registros():
+    gerador = random.Random(5)
+    return [OrganismoFasta(f"NC_{i}.1", f"Vírus {i}", "".join(gerador.choices("ACGTN", k=k)))
+            for i, k in enumerate([0, 1, 59, 60, 61, 1000])]
+
+
+@pytest.mark.parametrize("compressao", [None, "gzip", "bgzf"])
+@pytest.mark.parametrize("largura", [60, 7, 0, None])
+def test_ida_e_volta(tmp_path, registros, compressao, largura):
+    caminho = tmp_path / "saida.fasta"
+    assert escrever_fasta(caminho, iter(registros), largura, compressao) == len(registros)
+    assert tipo_de_compressao(caminho) == compressao
+    assert _tuplas(ler_fasta(caminho)) == _tuplas(registros)
+
+
+def test_formato_das_linhas(tmp_path):
+    caminho = tmp_path / "saida.fasta"
+    escrever_fasta(caminho, [("A", "um", "ACGTACGTAC"), ("B", "dois", "")], largura=4)
+    assert caminho.read_text() == ">A |um\nACGT\nACGT\nAC\n>B |dois\n"
+
+
+def test_trechos_atravessam_o_limite(monkeypatch, tmp_path):
+    monkeypatch.setattr(escrita_fasta, "BASES_POR_TRECHO", 50)
+    sequencia = "".join(random.Random(1).choices("ACGT", k=517))
+    caminho = tmp_path / "saida.fasta"
+    with EscritorFasta(caminho, largura=12) as escritor:
+        assert escritor._bases_por_trecho == 48
+        escritor.escrever(("A", "a", Sequencia(sequencia)))
+    linhas = caminho.read_text().splitlines()
+    assert "".join(linhas[1:]) == sequencia
+    assert {len(linha) for linha in linhas[1:-1]} == {12}
+
+
+def test_visoes_sao_gravadas_por_trechos(monkeypatch, tmp_path):
+    monkeypatch.setattr(escrita_fasta, "BASES_POR_TRECHO", 64)
+    visao = Sequencia("".join(random.Random(2).choices("ACGT", k=1000))).complementar_reversa()
+    esperado = str(visao)
+    montados = []
+    montar = type(visao).__str__
+
+    def espiar(self):
+        montados.append(len(self))
+        return montar(self)
+
+    monkeypatch.setattr(type(visao), "__str__", espiar)
+    caminho = tmp_path / "saida.fasta"
+    escrever_fasta(caminho, [("A", "a", visao)])
+    assert max(montados) == 60  # 64 arredondado para baixo a um múltiplo da largura
+    assert str(ler_fasta(caminho)[0].sequencia) == esperado
+
+
+def test_proteinas_e_tuplas(tmp_path):
+    caminho = tmp_path / "proteinas.fasta"
+    with EscritorFasta(caminho, largura=70) as escritor:
+        for organismo in iter_fasta(ARQUIVO_FLAVIVIRIDAE):
+            escritor.escrever((organismo.id, organismo.nome, organismo.sequencia.traduzir()))
+        assert escritor.registros == 159
+    primeiro = next(iter_fasta(ARQUIVO_FLAVIVIRIDAE))
+    relido = next(iter_fasta(caminho))
+    assert (relido.id, relido.nome) == (primeiro.id, primeiro.nome)
+    assert str(relido.sequencia) == primeiro.sequencia.traduzir()
+
+
+def test_arquivo_aberto_nao_e_fechado(registros):
+    saida = io.BytesIO()
+    with EscritorFasta(saida) as escritor:
+        assert escritor.escrever_todos(registros) == len(registros)
+        assert escritor.escrever_todos([]) == 0
+    assert not saida.closed
+    assert saida.getvalue().startswith(b">NC_0.1 |V\xc3\xadrus 0\n>NC_1.1")
+
+
+def test_gzip_em_arquivo_aberto(tmp_path, registros):
+    caminho = tmp_path / "saida.fasta.gz"
+    with open(caminho, "wb") as arquivo:
+        escrever_fasta(arquivo, registros, compressao="gzip")
+        assert not arquivo.closed
+    assert _tuplas(ler_fasta(caminho)) == _tuplas(registros)
+
+
+@pytest.mark.parametrize("argumentos", [{"compressao": "zip"}, {"largura": -1}])
+def test_parametros_invalidos(tmp_path, argumentos):
+    with pytest.raises(ValueError):
+        EscritorFasta(tmp_path / "saida.fasta", **argumentos)
+    assert not (tmp_path / "saida.fasta").exists()
+
+
+def test_erro_no_registro_fecha_o_arquivo(tmp_path):
+    caminho = tmp_path / "saida.fasta"
+    with pytest.raises(ValueError):
+        with EscritorFasta(caminho) as escritor:
+            escritor.escrever(("A", "a", "ACGT"))
+            escritor.escrever(("so dois campos", "x"))
+    assert escritor._saida.closed
+    assert caminho.read_text() == ">A |a\nACGT\n"
+
+
+@pytest.mark.parametrize("tamanho", [0, 1, bgzf.TAMANHO_MAXIMO_BLOCO, 3 * bgzf.TAMANHO_MAXIMO_BLOCO + 17])
+@pytest.mark.parametrize("trabalhadores", [1, 3])
+def test_escritor_bgzf_ida_e_volta(tmp_path, tamanho, trabalhadores):
+    dados = random.Random(tamanho).randbytes(tamanho)
+    caminho = tmp_path / "dados.gz"
+    escritor = EscritorBGZF(caminho, trabalhadores=trabalhadores)
+    for inicio in range(0, tamanho, 10_007):
+        escritor.write(dados[inicio:inicio + 10_007])
+    escritor.close()
+    escritor.close()
+
+    conteudo = caminho.read_bytes()
+    assert conteudo.endswith(fim_de_arquivo_bgzf())
+    assert gzip.decompress(conteudo) == dados
+    with LeitorBGZF(caminho) as leitor:
+        assert leitor.read() == dados
+    offsets, _ = bgzf._tabela_de_blocos(caminho)
+    # um bloco por TAMANHO_MAXIMO_BLOCO (mais o de fim de arquivo)
+    assert len(offsets) - 1 >= -(-tamanho // bgzf.TAMANHO_MAXIMO_BLOCO)
+
+
+def test_escritor_bgzf_limita_blocos_pendentes(monkeypatch, tmp_path):
+    maximo = []
+    comprimir = EscritorBGZF._comprimir
+
+    def espiar(self, dados):
+        comprimir(self, dados)
+        maximo.append(len(self._pendentes))
+
+    monkeypatch.setattr(EscritorBGZF, "_comprimir", espiar)
+    with EscritorBGZF(tmp_path / "dados.gz", trabalhadores=2) as escritor:
+        escritor.write(bytes(20 * bgzf.TAMANHO_MAXIMO_BLOCO))
+    assert max(maximo) <= 4
+
+
+def test_escritor_bgzf_em_arquivo_aberto():
+    saida = io.BytesIO()
+    with EscritorBGZF(saida) as escritor:
+        escritor.write(b"ACGT")
+    assert not saida.closed
+    assert gzip.decompress(saida.getvalue()) == b"ACGT"
@@ -0,0 +1,130 @@
+import os
+import random
+
+import pytest
+
+from bio import indice_fasta
+from bio.bgzf import comprimir_bgzf
+from bio.indice_fasta import FastaIndex, construir_indice, ler_indice
+from bio.ler_fasta import ler_fasta
+
+
+def _fasta(registros, largura):
+    linhas = []
+    for cabecalho, sequencia in registros:
+        linhas.append(">" + cabecalho)
+        linhas.extend(sequencia[i:i + largura] for i in range(0, len(sequencia), largura))
+    return "\n".join(linhas) + "\n"
+
+
+@pytest.fixture
+def registros():
+    gerador = random.Random(2)
+    return [(f"NC_{i}.1 |Vírus {i}", "".join(gerador.choices("ACGT", k=tamanho)))
+            for i, tamanho in enumerate([0, 1, 59, 60, 61, 250])]
+
+
+@pytest.fixture
+def caminho(escrever_fasta_texto, registros):
+    return escrever_fasta_texto(_fasta(registros, 60))
+
+
+def test_indice_no_formato_fai(caminho, registros):
+    entradas = construir_indice(caminho)
+    assert os.path.exists(caminho + ".fai")
+    assert [(e.id, e.comprimento) for e in entradas] == [
+        (f"NC_{i}.1", len(s)) for i, (_, s) in enumerate(registros)]
+    relidas = ler_indice(caminho + ".fai")
+    assert [vars(e) for e in relidas] == [vars(e) for e in entradas]
+
+    with open(caminho, "rb") as arquivo:
+        dados = arquivo.read()
+    for entrada, (_, sequencia) in zip(entradas, registros):
+        if sequencia:
+            assert dados[entrada.offset:entrada.offset + 1].decode() == sequencia[0]
+            assert entrada.bases_por_linha == min(60, len(sequencia))
+
+
+def test_buscar_regioes_coincide_com_fatias(caminho, registros):
+    with FastaIndex(caminho) as indice:
+        assert len(indice) == len(registros)
+        for i, (_, sequencia) in enumerate(registros):
+            id = f"NC_{i}.1"
+            assert indice.buscar(id) == sequencia
+            for inicio, fim in [(0, 1), (59, 61), (60, 120), (-5, None), (10, 5), (0, 10_000)]:
+                assert indice.buscar(id, inicio, fim) == sequencia[inicio:fim]
+
+
+def test_sequencia_indexada_e_organismo(caminho, registros):
+    with FastaIndex(caminho) as indice:
+        sequencia = registros[-1][1]
+        indexada = indice["NC_5.1"]
+        assert len(indexada) == len(sequencia)
+        assert indexada[-1] == sequencia[-1]
+        assert indexada[10:130] == sequencia[10:130]
+        assert indexada[::7] == sequencia[::7]
+        assert "".join(indexada) == sequencia
+        with pytest.raises(IndexError):
+            indexada[len(sequencia)]
+
+        organismo = indice.organismo("NC_5.1")
+        assert (organismo.id, organismo.nome) == ("NC_5.1", "Vírus 5")
+        assert indice.cabecalho("NC_0.1") == "NC_0.1 |Vírus 0"
+        assert str(indice.organismo("NC_4.1", mapeado=True).sequencia) == registros[4][1]
+        assert "NC_9.1" not in indice
+
+
+def test_indice_desatualizado_e_reconstruido(caminho, escrever_fasta_texto):
+    FastaIndex(caminho).fechar()
+    os.utime(caminho + ".fai", (0, 0))
+    escrever_fasta_texto(">novo |Novo\nACGT\n")
+    with FastaIndex(caminho) as indice:
+        assert list(indice) == ["novo"]
+        assert indice.buscar("novo") == "ACGT"
+
+
+def test_minusculas_e_quebras_windows(escrever_fasta_texto):
+    caminho = escrever_fasta_texto("")
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(b">A |um\r\nacg\r\ntac\r\ngt\r\n")
+    with FastaIndex(caminho) as indice:
+        assert indice.buscar("A") == "ACGTACGT"
+        assert indice.buscar("A", 2, 5) == "GTA"
+        assert indice.cabecalho("A") == "A |um"
+
+
+@pytest.mark.parametrize("texto", [
+    ">A\nACG\nACGT\n",
+    ">A\nACGT\nAC\nAC\n",
+    ">A\nACGT\n\nACGT\n",
+])
+def test_linhas_irregulares(escrever_fasta_texto, texto):
+    with pytest.raises(ValueError):
+        construir_indice(escrever_fasta_texto(texto))
+
+
+def test_igual_a_leitura_completa(caminho):
+    with FastaIndex(caminho) as indice:
+        assert [(o.id, o.nome, str(o.sequencia)) for o in map(indice.organismo, indice)] == \
+            [(o.id, o.nome, str(o.sequencia)) for o in ler_fasta(caminho)]
+
+
+def test_indice_que_nao_pode_ser_gravado_fica_em_memoria(caminho, registros, tmp_path):
+    inacessivel = tmp_path / "nao_existe" / "entrada.fasta.fai"
+    with pytest.raises(OSError):
+        construir_indice(caminho, inacessivel)
+    with FastaIndex(caminho, inacessivel) as indice:
+        assert indice.buscar("NC_5.1", 10, 20) == registros[-1][1][10:20]
+    assert not os.path.exists(caminho + ".fai")
+
+
+def test_gzi_que_nao_pode_ser_gravado(monkeypatch, caminho, registros, tmp_path):
+    comprimido = str(tmp_path / "entrada.fasta.gz")
+    comprimir_bgzf(caminho, comprimido)
+
+    def falhar(*args, **kwargs):
+        raise PermissionError("somente leitura")
+
+    monkeypatch.setattr(indice_fasta, "construir_gzi", falhar)
+    with FastaIndex(comprimido) as indice:
+        assert indice.buscar("NC_4.1") == registros[4][1]
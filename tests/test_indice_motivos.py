@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from bio import indice_motivos
+from bio.indice_motivos import IndiceMotivos, _ordenar_sufixos
+from bio.organismo_fasta import OrganismoFasta
+
+
+def _buscar_forca_bruta(organismos, motivo):
+    ocorrencias = []
+    for organismo in organismos:
+        texto = str(organismo.sequencia)
+        posicao = texto.find(motivo)
+        while posicao != -1:
+            ocorrencias.append((organismo.id, posicao))
+            posicao = texto.find(motivo, posicao + 1)
+    return ocorrencias
+
+
+@pytest.fixture(scope="module")
+def organismos():
+    gerador = random.Random(14)
+    return [OrganismoFasta(f"r{i}", "", "".join(gerador.choices("ACGTN" if i % 3 else "ACGT", k=tamanho)))
+            for i, tamanho in enumerate([0, 1, 50, 400, 1000, 7, 300])]
+
+
+@pytest.fixture(scope="module")
+def indice(organismos):
+    return IndiceMotivos.construir(organismos)
+
+
+@pytest.mark.parametrize("chave_unica", [True, False])
+@pytest.mark.parametrize("texto", [b"", b"A", b"AAAAAAA", b"ACGTACGTAC", b"BANANA\0ANANAB\0",
+                                   bytes(random.Random(1).choices(b"ACGT", k=500))])
+def test_suffix_array_igual_ao_ordenado(monkeypatch, texto, chave_unica):
+    if not chave_unica:
+        monkeypatch.setattr(indice_motivos, "_MAXIMO_CHAVE_UNICA", 0)
+    codigos = indice_motivos._CODIGO[list(texto)] if texto else indice_motivos._CODIGO[:0]
+    simbolos = codigos.tolist()
+    esperado = sorted(range(len(simbolos)), key=lambda i: simbolos[i:])
+    assert _ordenar_sufixos(codigos).tolist() == esperado
+
+
+def test_buscar_igual_a_forca_bruta(organismos, indice):
+    textos = [str(o.sequencia) for o in organismos]
+    gerador = random.Random(3)
+    motivos = ["A", "ACG", "TTTT"] + [textos[4][i:i + k] for i, k in
+                                      ((gerador.randrange(990), gerador.choice([2, 5, 9])) for _ in range(20))]
+    for motivo in motivos:
+        if "N" in motivo:
+            continue
+        esperado = _buscar_forca_bruta(organismos, motivo)
+        assert indice.buscar(motivo) == esperado
+        assert indice.contar(motivo) == len(esperado)
+
+
+def test_motivos_sem_ocorrencias(indice):
+    assert indice.buscar("") == []
+    assert indice.contar("ACGN") == 0
+    assert indice.buscar("A" * 2000) == []
+
+
+def test_minusculas(indice, organismos):
+    assert indice.buscar("acg") == indice.buscar("ACG")
+
+
+def test_nao_atravessa_registros():
+    indice = IndiceMotivos.construir([OrganismoFasta("a", "", "AAAC"), OrganismoFasta("b", "", "GTTT")])
+    assert indice.buscar("CG") == []
+    assert indice.buscar("AC") == [("a", 2)]
+
+
+def test_colecao_vazia():
+    assert IndiceMotivos.construir([]).buscar("A") == []
+
+
+def test_salvar_e_carregar(tmp_path, indice):
+    caminho = tmp_path / "motivos.npz"
+    indice.salvar(caminho)
+    carregado = IndiceMotivos.carregar(caminho)
+    assert carregado.ids == indice.ids
+    assert carregado.buscar("ACGT") == indice.buscar("ACGT")
@@ -0,0 +1,103 @@
+import io
+
+from bio import instrumentacao, paralelo
+from bio.instrumentacao import instrumentar, relatorio_se_pedido
+from bio.ler_fasta import iter_fasta, ler_fasta
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+
+TEXTO = ">A |um\nACGTACGTAC\n>B |dois\nGGCC\n"
+
+
+def _linha(relatorio, operacao):
+    return next(linha for linha in relatorio.splitlines() if linha.split()[0] == operacao)
+
+
+def test_leitura_conta_registros_e_bases(escrever_fasta_texto):
+    caminho = escrever_fasta_texto(TEXTO)
+    with instrumentar() as medicao:
+        list(iter_fasta(caminho))
+        ler_fasta(caminho)
+    totais = medicao.instantaneo()
+    assert (totais["ler_fasta"]["chamadas"], totais["ler_fasta"]["bases"]) == (4, 28)
+    assert totais["OrganismoFasta"]["chamadas"] == 4
+    assert totais["OrganismoFasta"]["bases"] is None
+
+
+def test_visoes_nao_contam_bases():
+    sequencia = Sequencia("ACGT" * 10)
+    with instrumentar() as medicao:
+        str(sequencia.complementar_reversa().transcrever())
+        sequencia.reverter()
+    totais = medicao.instantaneo()
+    for operacao in ("complementar_reversa", "transcrever", "reverter"):
+        assert totais[operacao]["chamadas"] >= 1
+        assert totais[operacao]["bases"] is None
+        # coluna bases/s em branco: só operação, chamadas, segundos e memória
+        assert len(_linha(medicao.relatorio(), operacao).split()) == 4
+
+
+def test_composicao_conta_bases_so_quando_calcula():
+    sequencia = Sequencia("ACGTN" * 20)
+    with instrumentar() as medicao:
+        sequencia.calcular_percentual(["G", "C"])
+        sequencia.conteudo_gc()
+        sequencia.composicao()
+    totais = medicao.instantaneo()
+    assert totais["calcular_percentual"]["bases"] == 100
+    assert totais["conteudo_gc"] == {**totais["conteudo_gc"], "chamadas": 1, "bases": 0}
+    # a composição calculada dentro de calcular_percentual conta uma vez; a chamada direta, não
+    assert (totais["composicao"]["chamadas"], totais["composicao"]["bases"]) == (3, 100)
+
+
+def test_operacoes_que_percorrem_contam_o_comprimento():
+    sequencia = Sequencia("ATGAAATAG" * 5)
+    with instrumentar() as medicao:
+        sequencia.traduzir()
+        sequencia.traduzir()
+        sequencia.encontrar_orfs()
+    totais = medicao.instantaneo()
+    assert totais["traduzir"]["bases"] == 90
+    assert totais["encontrar_orfs"]["bases"] == 45
+
+
+def test_fragmentos_de_paralelo_sao_medidos(escrever_fasta_texto):
+    caminho = escrever_fasta_texto(TEXTO)
+    with instrumentar() as medicao:
+        ids = paralelo._aplicar_fragmento(_id, caminho, 0, len(TEXTO))
+    assert ids == ["A", "B"]
+    assert medicao.instantaneo()["ler_fasta"]["chamadas"] == 2
+
+
+def _id(organismo):
+    return organismo.id
+
+
+def test_desativar_restaura_originais():
+    originais = (OrganismoFasta.__init__, Sequencia.traduzir, paralelo.bio.ler_fasta.ler_registros)
+    medicao = instrumentar()
+    medicao.ativar()
+    assert Sequencia.traduzir is not originais[1]
+    medicao.desativar()
+    assert (OrganismoFasta.__init__, Sequencia.traduzir,
+            paralelo.bio.ler_fasta.ler_registros) == originais
+    assert not medicao.ativa
+
+
+def test_memoria():
+    with instrumentar(memoria=True) as medicao:
+        Sequencia("ACGT" * 1000).traduzir()
+    assert medicao.instantaneo()["traduzir"]["memoria"] >= 0
+
+
+def test_relatorio_so_com_a_variavel(monkeypatch):
+    saida = io.StringIO()
+    monkeypatch.delenv(instrumentacao.VARIAVEL_AMBIENTE, raising=False)
+    with relatorio_se_pedido(saida) as medicao:
+        Sequencia("ACGT").traduzir()
+    assert medicao is None and saida.getvalue() == ""
+
+    monkeypatch.setenv(instrumentacao.VARIAVEL_AMBIENTE, "1")
+    with relatorio_se_pedido(saida):
+        Sequencia("ACGT").traduzir()
+    assert _linha(saida.getvalue(), "traduzir").split()[1] == "1"
@@ -0,0 +1,63 @@
+import random
+
+import numpy as np
+import pytest
+
+from bio.janelas import perfil_janelas, perfis_colecao
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+
+
+def _perfil_forca_bruta(texto, janela, passo):
+    linhas = []
+    for inicio in range(0, len(texto) - janela + 1, passo):
+        trecho = texto[inicio:inicio + janela]
+        a, c, g, t = (trecho.count(base) for base in "ACGT")
+        linhas.append((inicio, (g + c) / janela,
+                       (g - c) / (g + c) if g + c else 0.0,
+                       (a - t) / (a + t) if a + t else 0.0))
+    return linhas
+
+
+def test_exemplo_da_documentacao():
+    perfil = Sequencia("GGGGCCAT").perfil_janelas(4, passo=2)
+    assert perfil.inicios.tolist() == [0, 2, 4]
+    assert perfil.gc.tolist() == [1.0, 1.0, 0.5]
+    assert perfil.skew_gc.tolist() == [1.0, 0.0, -1.0]
+    assert perfil.skew_acumulado.tolist() == [1.0, 1.0, 0.0]
+
+
+@pytest.mark.parametrize("janela,passo", [(1, None), (10, None), (10, 3), (7, 20), (500, 1)])
+def test_igual_a_forca_bruta(janela, passo):
+    texto = "".join(random.Random(janela).choices("ACGTACGTN", k=1003))
+    perfil = perfil_janelas(texto, janela, passo)
+    esperado = _perfil_forca_bruta(texto, janela, passo or janela)
+    assert perfil.inicios.tolist() == [linha[0] for linha in esperado]
+    np.testing.assert_allclose(perfil.gc, [linha[1] for linha in esperado])
+    np.testing.assert_allclose(perfil.skew_gc, [linha[2] for linha in esperado])
+    np.testing.assert_allclose(perfil.skew_at, [linha[3] for linha in esperado])
+    np.testing.assert_allclose(perfil.skew_acumulado, np.cumsum([linha[2] for linha in esperado]))
+
+
+def test_sequencia_menor_que_a_janela():
+    perfil = perfil_janelas("ACGT", 10)
+    assert len(perfil) == 0
+    assert perfil.skew_acumulado.tolist() == []
+
+
+def test_minusculas():
+    np.testing.assert_allclose(perfil_janelas("ggccat", 3).gc, perfil_janelas("GGCCAT", 3).gc)
+
+
+@pytest.mark.parametrize("janela,passo", [(0, None), (-1, None), (5, -2)])
+def test_parametros_invalidos(janela, passo):
+    with pytest.raises(ValueError):
+        perfil_janelas("ACGT", janela, passo)
+
+
+def test_colecao():
+    organismos = [OrganismoFasta("a", "", "GGGGCCAT"), OrganismoFasta("b", "", "AT")]
+    perfis = perfis_colecao(organismos, 4, 2)
+    assert list(perfis) == ["a", "b"]
+    assert perfis["a"].gc.tolist() == [1.0, 1.0, 0.5]
+    assert len(perfis["b"]) == 0
@@ -0,0 +1,111 @@
+import random
+from collections import Counter
+
+import pytest
+
+from bio import kmers
+from bio.kmers import codificar_kmer, codigos_de_kmers, contar_kmers, contar_kmers_colecao, decodificar_kmer
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+
+_COMPLEMENTO = str.maketrans("ACGT", "TGCA")
+
+
+def _contagem_forca_bruta(texto, k, canonico=False):
+    contagem = Counter()
+    for i in range(len(texto) - k + 1):
+        kmer = texto[i:i + k]
+        if set(kmer) <= set("ACGT"):
+            if canonico:
+                kmer = min(kmer, kmer.translate(_COMPLEMENTO)[::-1])
+            contagem[kmer] += 1
+    return dict(contagem)
+
+
+def _aleatoria(tamanho, semente):
+    return "".join(random.Random(semente).choices("ACGTACGTACGTN", k=tamanho))
+
+
+def test_exemplos_da_documentacao():
+    assert contar_kmers("AAGCTT", 2).como_dict() == {"AA": 1, "AG": 1, "CT": 1, "GC": 1, "TT": 1}
+    assert contar_kmers("AAGCTT", 2, canonico=True).como_dict() == {"AA": 2, "AG": 2, "GC": 1}
+    contagem = Sequencia("ATGATGA").contar_kmers(3)
+    assert contagem["ATG"] == 2
+    assert contagem.mais_frequentes(1) == [("ATG", 2)]
+    assert codigos_de_kmers("ACGNAC", 2).tolist() == [1, 6, 1]
+
+
+@pytest.mark.parametrize("canonico", [False, True])
+@pytest.mark.parametrize("k", [1, 3, 10, 11, 21, 32])
+def test_igual_a_forca_bruta(k, canonico):
+    texto = _aleatoria(2000, k)
+    contagem = contar_kmers(texto, k, canonico)
+    esperado = _contagem_forca_bruta(texto, k, canonico)
+    assert contagem.como_dict() == esperado
+    assert contagem.total == sum(esperado.values())
+    kmer = next(iter(esperado))
+    assert contagem[kmer] == esperado[kmer]
+    if canonico:
+        assert contagem[kmer.translate(_COMPLEMENTO)[::-1]] == esperado[kmer]
+
+
+def test_kmer_ausente_e_minusculas():
+    contagem = contar_kmers("acgtacgt", 4)
+    assert contagem["ACGT"] == 2
+    assert contagem["acgt"] == 2
+    assert contagem["TTTT"] == 0
+
+
+@pytest.mark.parametrize("texto", ["", "AC", "NNNNNN"])
+def test_sem_janelas(texto):
+    contagem = contar_kmers(texto, 3)
+    assert len(contagem) == 0
+    assert contagem.total == 0
+    assert contagem.mais_frequentes() == []
+
+
+def test_mais_frequentes_desempata_em_ordem_alfabetica():
+    assert contar_kmers("TTAACC", 1).mais_frequentes(3) == [("A", 2), ("C", 2), ("T", 2)]
+
+
+@pytest.mark.parametrize("k", [0, 33])
+def test_k_invalido(k):
+    with pytest.raises(ValueError):
+        contar_kmers("ACGT", k)
+
+
+@pytest.mark.parametrize("k", [4, 16])
+def test_colecao_igual_a_soma(monkeypatch, k):
+    monkeypatch.setattr(kmers, "_REGISTROS_POR_JUNCAO", 3)
+    textos = [_aleatoria(300, semente) for semente in range(10)]
+    organismos = [OrganismoFasta(str(i), "", texto) for i, texto in enumerate(textos)]
+    esperado = Counter()
+    for texto in textos:
+        esperado.update(_contagem_forca_bruta(texto, k, True))
+    assert contar_kmers_colecao(iter(organismos), k, canonico=True).como_dict() == dict(esperado)
+    assert contar_kmers_colecao([], k).total == 0
+
+
+def test_codificacao_ida_e_volta():
+    for kmer in ["A", "ACGT", "T" * 32, "GATTACA"]:
+        assert decodificar_kmer(codificar_kmer(kmer), len(kmer)) == kmer
+
+
+@pytest.mark.parametrize("canonico", [False, True])
+def test_chave_de_tamanho_errado(canonico):
+    contagem = contar_kmers("AATAAT", 3, canonico=canonico)
+    for chave in ("AT", "AATA", ""):
+        with pytest.raises(ValueError, match="k=3"):
+            contagem[chave]
+
+
+@pytest.mark.parametrize("canonico", [False, True])
+def test_chave_com_base_ambigua_vale_zero(canonico):
+    contagem = contar_kmers("AANAAT", 3, canonico=canonico)
+    assert contagem["ANA"] == 0
+    assert contagem["aat"] == 1
+
+
+def test_codificar_base_invalida():
+    with pytest.raises(ValueError, match="'N'"):
+        codificar_kmer("ANT")
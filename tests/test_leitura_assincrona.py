@@ -0,0 +1,130 @@
+import asyncio
+import gzip
+
+import pytest
+
+from bio import leitura_assincrona
+from bio.leitura_assincrona import FIM, ingerir, iter_fastas, processar
+
+
+def _texto(prefixo, quantidade):
+    return "".join(f">{prefixo}{i} |x\n{'ACGT' * (i + 1)}\n" for i in range(quantidade))
+
+
+@pytest.fixture
+def caminhos(escrever_fasta_texto, tmp_path):
+    simples = escrever_fasta_texto(_texto("a", 30), "a.fasta")
+    comprimido = tmp_path / "b.fasta.gz"
+    with gzip.open(comprimido, "wt") as arquivo:
+        arquivo.write(_texto("b", 20))
+    vazio = escrever_fasta_texto("", "vazio.fasta")
+    return [simples, str(comprimido), vazio]
+
+
+def _esperado():
+    return {f"a{i}" for i in range(30)} | {f"b{i}" for i in range(20)}
+
+
+async def _id_e_tamanho(organismo):
+    await asyncio.sleep(0)
+    return organismo.id, len(organismo.sequencia)
+
+
+@pytest.mark.parametrize("consumidores", [1, 4])
+def test_processar_le_todos_os_arquivos(caminhos, consumidores):
+    resultados = asyncio.run(processar(caminhos, _id_e_tamanho, consumidores=consumidores,
+                                       tamanho_fila=3, tamanho_lote=4))
+    assert len(resultados) == 50
+    assert {id for id, _ in resultados} == _esperado()
+    assert dict(resultados)["a4"] == 20
+
+
+def test_iter_fastas(caminhos):
+    async def coletar():
+        return [organismo.id async for organismo in iter_fastas(caminhos, tamanho_fila=2,
+                                                                tamanho_lote=5)]
+
+    ids = asyncio.run(coletar())
+    assert len(ids) == 50 and set(ids) == _esperado()
+    # cada arquivo mantém a sua ordem
+    assert [id for id in ids if id.startswith("a")] == [f"a{i}" for i in range(30)]
+
+
+def test_sem_arquivos():
+    assert asyncio.run(processar([], _id_e_tamanho)) == []
+
+
+def test_fila_limitada_segura_os_leitores(caminhos):
+    async def principal():
+        fila = asyncio.Queue(maxsize=5)
+        leitura = asyncio.create_task(ingerir(caminhos, fila, tamanho_lote=2))
+        for _ in range(20):
+            await asyncio.sleep(0.001)
+        cheia = fila.qsize()
+        assert not leitura.done()
+
+        recebidos = []
+        while (organismo := await fila.get()) is not FIM:
+            recebidos.append(organismo.id)
+        return cheia, recebidos, await leitura
+
+    cheia, recebidos, total = asyncio.run(principal())
+    assert cheia == 5
+    assert total == len(recebidos) == 50
+
+
+def test_ingerir_coloca_um_fim_por_consumidor(caminhos):
+    async def principal():
+        fila = asyncio.Queue()
+        total = await ingerir(caminhos[:1], fila, consumidores=3)
+        itens = [fila.get_nowait() for _ in range(fila.qsize())]
+        return total, itens
+
+    total, itens = asyncio.run(principal())
+    assert total == 30
+    assert itens[-3:] == [FIM] * 3 and FIM not in itens[:-3]
+
+
+def test_arquivo_inexistente_propaga_o_erro(caminhos, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(processar(caminhos + [str(tmp_path / "nao_existe.fasta")], _id_e_tamanho))
+
+    async def coletar():
+        return [o async for o in iter_fastas([str(tmp_path / "nao_existe.fasta")])]
+
+    with pytest.raises(FileNotFoundError):
+        asyncio.run(coletar())
+
+
+def test_erro_na_analise_propaga_e_cancela_a_leitura(caminhos):
+    async def falhar(organismo):
+        raise ValueError(organismo.id)
+
+    with pytest.raises(ValueError):
+        asyncio.run(processar(caminhos, falhar, consumidores=2, tamanho_fila=2))
+
+
+def test_leitura_em_lotes(monkeypatch, caminhos):
+    lotes = []
+    para_thread = asyncio.to_thread
+
+    async def espiar(funcao):
+        lote = await para_thread(funcao)
+        lotes.append(len(lote))
+        return lote
+
+    monkeypatch.setattr(leitura_assincrona.asyncio, "to_thread", espiar)
+    asyncio.run(processar(caminhos[:1], _id_e_tamanho, tamanho_lote=7))
+    assert lotes == [7, 7, 7, 7, 2, 0]
+
+
+def test_cancelar_com_fila_cheia_nao_trava(caminhos):
+    async def principal():
+        fila = asyncio.Queue(maxsize=1)
+        leitura = asyncio.create_task(ingerir(caminhos, fila, consumidores=2))
+        await asyncio.sleep(0.01)
+        leitura.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(leitura, 1)
+
+    asyncio.run(principal())
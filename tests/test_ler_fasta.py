@@ -0,0 +1,88 @@
+import types
+
+import pytest
+
+from bio.ler_fasta import iter_fasta, ler_fasta, ler_registros
+from conftest import ARQUIVO_FLAVIVIRIDAE
+
+TEXTO = (
+    "comentário antes do primeiro cabeçalho\n"
+    ">NC_1.1 |Vírus um\n"
+    "ACGTAC\n"
+    "gtn\n"
+    "\n"
+    ">NC_2.1 |Vírus dois\n"
+    "TTTT\n"
+    ">NC_3.1 |Sem sequência\n"
+)
+
+
+def test_iter_fasta_e_um_gerador(escrever_fasta_texto):
+    registros = iter_fasta(escrever_fasta_texto(TEXTO))
+    assert isinstance(registros, types.GeneratorType)
+    primeiro = next(registros)
+    assert (primeiro.id, primeiro.nome) == ("NC_1.1", "Vírus um")
+
+
+def test_registros_juntam_linhas_e_ignoram_texto_antes_do_cabecalho(escrever_fasta_texto):
+    organismos = ler_fasta(escrever_fasta_texto(TEXTO))
+    assert [(o.id, o.nome, str(o.sequencia)) for o in organismos] == [
+        ("NC_1.1", "Vírus um", "ACGTACGTN"),
+        ("NC_2.1", "Vírus dois", "TTTT"),
+        ("NC_3.1", "Sem sequência", ""),
+    ]
+
+
+@pytest.mark.parametrize("tamanho_buffer", [1, 7, 1 << 20])
+def test_resultado_nao_depende_do_buffer(escrever_fasta_texto, tamanho_buffer):
+    caminho = escrever_fasta_texto(TEXTO)
+    esperado = [(o.id, str(o.sequencia)) for o in ler_fasta(caminho)]
+    lidos = [(o.id, str(o.sequencia)) for o in iter_fasta(caminho, tamanho_buffer=tamanho_buffer)]
+    assert lidos == esperado
+
+
+def test_quebras_de_linha_windows(escrever_fasta_texto):
+    caminho = escrever_fasta_texto("")
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(b">A |um\r\nAC\r\nGT\r\n")
+    (organismo,) = ler_fasta(caminho)
+    assert (organismo.id, organismo.nome, str(organismo.sequencia)) == ("A", "um", "ACGT")
+
+
+def test_arquivo_vazio(escrever_fasta_texto):
+    assert ler_fasta(escrever_fasta_texto("")) == []
+
+
+def test_arquivo_inexistente(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ler_fasta(tmp_path / "nao_existe.fasta")
+
+
+def test_arquivo_do_projeto():
+    organismos = ler_fasta(ARQUIVO_FLAVIVIRIDAE)
+    assert len(organismos) == 159
+    assert organismos[0].id == "NC_074786.1"
+    assert sum(1 for _ in iter_fasta(ARQUIVO_FLAVIVIRIDAE)) == 159
+
+
+def test_cabecalho_fica_em_bytes_ate_o_acesso(escrever_fasta_texto):
+    organismo = next(iter_fasta(escrever_fasta_texto(TEXTO)))
+    assert organismo._cabecalho == ">NC_1.1 |Vírus um\n".encode()
+    assert organismo._id is None and organismo._nome is None
+    assert (organismo.id, organismo.nome) == ("NC_1.1", "Vírus um")
+    assert organismo.cabecalho == "NC_1.1 |Vírus um"
+
+
+def test_cabecalho_invalido_em_utf8_nao_impede_a_leitura(escrever_fasta_texto):
+    caminho = escrever_fasta_texto("")
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(b">A |v\xedrus\nACGT\n")
+    (organismo,) = ler_fasta(caminho)
+    assert str(organismo.sequencia) == "ACGT"
+    assert organismo.nome == "v�rus"
+
+
+def test_ler_registros_recebe_linhas_em_bytes():
+    linhas = [b"lixo\n", b">A |um\r\n", b"ac\r\n", b"gt\n", b">B\n"]
+    organismos = list(ler_registros(linhas))
+    assert [(o.id, o.nome, str(o.sequencia)) for o in organismos] == [("A", "um", "ACGT"), ("B", "", "")]
@@ -0,0 +1,73 @@
+import pytest
+
+from bio.ler_fasta import ler_fasta
+from bio.memoria_compartilhada import ColecaoCompartilhada, executar_compartilhado
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia_mapeada import SequenciaMapeada
+from conftest import ARQUIVO_FLAVIVIRIDAE
+
+
+def resumir(organismo):
+    return organismo.id, organismo.nome, len(organismo.sequencia), organismo.sequencia[10:20]
+
+
+ORGANISMOS = [
+    OrganismoFasta("a", "Vírus á", "ACGTACGTACGTACGTACGTAC"),
+    OrganismoFasta("b", "", ""),
+    OrganismoFasta("c", "outro", "ttttggggccccaaaattttgggg"),
+]
+
+
+def test_ida_e_volta():
+    with ColecaoCompartilhada.criar(ORGANISMOS) as colecao:
+        assert len(colecao) == 3
+        lidos = [(o.id, o.nome, str(o.sequencia)) for o in colecao]
+        assert lidos == [(o.id, o.nome, str(o.sequencia)) for o in ORGANISMOS]
+        sequencia = colecao.sequencia(-1)
+        assert isinstance(sequencia, SequenciaMapeada)
+        assert sequencia[0] == "T"
+        del sequencia, lidos
+
+
+def test_anexar_pelo_nome():
+    with ColecaoCompartilhada.criar(ORGANISMOS) as colecao:
+        anexada = ColecaoCompartilhada.anexar(colecao.nome)
+        assert anexada.ids == ["a", "b", "c"]
+        assert str(anexada.sequencia(0)[2:6]) == "GTAC"
+        anexada.fechar()
+
+
+def test_colecao_vazia():
+    with ColecaoCompartilhada.criar([]) as colecao:
+        assert len(colecao) == 0
+        assert list(colecao) == []
+
+
+def test_bloco_sem_assinatura():
+    from multiprocessing.shared_memory import SharedMemory
+
+    memoria = SharedMemory(create=True, size=64)
+    try:
+        with pytest.raises(ValueError):
+            ColecaoCompartilhada(memoria)
+    finally:
+        memoria.close()
+        memoria.unlink()
+
+
+def test_executar_nos_processos():
+    organismos = ler_fasta(ARQUIVO_FLAVIVIRIDAE)
+    esperado = [resumir(o) for o in organismos]
+    with ColecaoCompartilhada.criar(organismos) as colecao:
+        assert executar_compartilhado(resumir, colecao, trabalhadores=2, tamanho_lote=16) == esperado
+
+
+def test_visao_aberta_na_saida_nao_vaza_o_bloco():
+    with pytest.raises(BufferError):
+        with ColecaoCompartilhada.criar([OrganismoFasta("a", "um", "ACGTACGT")]) as colecao:
+            nome = colecao.nome
+            visao = colecao.sequencia(0).visao_de_memoria()
+    assert bytes(visao) == b"ACGTACGT"
+    with pytest.raises(FileNotFoundError):
+        ColecaoCompartilhada.anexar(nome)
+    visao.release()
@@ -0,0 +1,110 @@
+import random
+
+import numpy as np
+import pytest
+
+from bio.minhash import (Esboco, agrupar, carregar_esbocos, distancia_de_mash, esbocar,
+                         esbocar_colecao, matriz_de_distancias, salvar_esbocos)
+from bio.organismo_fasta import OrganismoFasta
+
+
+def _jaccard_forca_bruta(a, b):
+    """Fração dos `tamanho` menores hashes da união que estão nos dois esboços."""
+    conjunto_a, conjunto_b = set(a.hashes.tolist()), set(b.hashes.tolist())
+    menores = sorted(conjunto_a | conjunto_b)[:a.tamanho]
+    if not menores:
+        return 0.0
+    return sum(h in conjunto_a and h in conjunto_b for h in menores) / len(menores)
+
+
+def _mutar(texto, taxa, semente):
+    gerador = random.Random(semente)
+    return "".join(gerador.choice("ACGT") if gerador.random() < taxa else base for base in texto)
+
+
+@pytest.fixture(scope="module")
+def organismos():
+    gerador = random.Random(17)
+    base = "".join(gerador.choices("ACGT", k=3000))
+    textos = [base, _mutar(base, 0.01, 1), _mutar(base, 0.05, 2), _mutar(base, 0.3, 3),
+              "".join(gerador.choices("ACGT", k=2000)), "", "ACGTN" * 3]
+    return [OrganismoFasta(f"r{i}", "", texto) for i, texto in enumerate(textos)]
+
+
+@pytest.fixture(scope="module")
+def esbocos(organismos):
+    return esbocar_colecao(organismos, k=15, tamanho=200)
+
+
+def test_esboco_guarda_os_menores_hashes(organismos):
+    completo = esbocar(organismos[0].sequencia, k=15, tamanho=10 ** 6)
+    esboco = esbocar(organismos[0].sequencia, k=15, tamanho=200)
+    assert len(esboco) == 200
+    assert np.array_equal(esboco.hashes, completo.hashes[:200])
+    assert np.all(np.diff(esboco.hashes.astype(object)) > 0)
+
+
+def test_esboco_independe_da_fita(organismos):
+    from bio.sequencia import Sequencia
+
+    direta = esbocar(organismos[0].sequencia, k=15, tamanho=200)
+    reversa = esbocar(Sequencia(str(organismos[0].sequencia)).complementar_reversa(), k=15, tamanho=200)
+    assert np.array_equal(direta.hashes, reversa.hashes)
+
+
+def test_jaccard_igual_a_forca_bruta(esbocos):
+    for a in esbocos:
+        for b in esbocos:
+            assert a.jaccard(b) == pytest.approx(_jaccard_forca_bruta(a, b))
+
+
+def test_matriz_igual_aos_pares(esbocos):
+    matriz = matriz_de_distancias(esbocos)
+    pares = np.array([[a.distancia(b) for b in esbocos] for a in esbocos])
+    np.testing.assert_allclose(matriz, pares)
+    np.testing.assert_allclose(matriz, matriz.T)
+
+    retangular = matriz_de_distancias(esbocos[:2], esbocos[2:])
+    np.testing.assert_allclose(retangular, pares[:2, 2:])
+
+
+def test_distancias_seguem_a_divergencia(esbocos):
+    distancias = [esbocos[0].distancia(outro) for outro in esbocos[:5]]
+    assert distancias[0] == 0.0
+    assert distancias[0] < distancias[1] < distancias[2] < distancias[3] <= distancias[4]
+    assert esbocos[0].distancia(esbocos[5]) == 1.0
+
+
+def test_distancia_de_mash():
+    assert distancia_de_mash(1.0, 21) == 0.0
+    assert distancia_de_mash(0.0, 21) == 1.0
+    assert distancia_de_mash(0.5, 10) == pytest.approx(-np.log(2 / 3) / 10)
+
+
+def test_esbocos_incompativeis(esbocos):
+    outro = esbocar("ACGT" * 50, k=11, tamanho=200)
+    with pytest.raises(ValueError):
+        esbocos[0].jaccard(outro)
+    with pytest.raises(ValueError):
+        matriz_de_distancias([esbocos[0], outro])
+
+
+def test_agrupar(esbocos):
+    grupos = agrupar(esbocos[:5], distancia_maxima=0.06)
+    assert grupos[0] == ["r0", "r1", "r2"]
+    assert ["r3"] in grupos and ["r4"] in grupos
+    assert agrupar([]) == []
+
+
+def test_salvar_e_carregar(tmp_path, esbocos):
+    caminho = tmp_path / "esbocos.npz"
+    salvar_esbocos(esbocos, caminho)
+    carregados = carregar_esbocos(caminho)
+    assert [e.id for e in carregados] == [e.id for e in esbocos]
+    assert all(np.array_equal(a.hashes, b.hashes) for a, b in zip(carregados, esbocos))
+    np.testing.assert_allclose(matriz_de_distancias(carregados), matriz_de_distancias(esbocos))
+
+
+def test_matriz_vazia():
+    assert matriz_de_distancias([]).shape == (0, 0)
+    assert isinstance(esbocar("", k=5), Esboco)
@@ -0,0 +1,114 @@
+import random
+
+import numpy as np
+import pytest
+
+from bio import mutacoes
+from bio.indice_fasta import FastaIndex
+from bio.ler_fasta import ler_fasta
+from bio.mutacoes import (ALTERNATIVA, AMBIGUA, CURTA, OUTRA, REFERENCIA, Sitio, varrer_mutacoes)
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+from conftest import ARQUIVO_FLAVIVIRIDAE
+
+
+def _estado_forca_bruta(texto, sitio):
+    if not 1 <= sitio.posicao <= len(texto):
+        return CURTA
+    base = texto[sitio.posicao - 1].upper()
+    if base == sitio.ref:
+        return REFERENCIA
+    if base == sitio.alt:
+        return ALTERNATIVA
+    return OUTRA if base in "ACGT" else AMBIGUA
+
+
+@pytest.fixture
+def colecao():
+    gerador = random.Random(15)
+    return [OrganismoFasta(f"r{i}", "", "".join(gerador.choices("ACGTacgtNR", k=tamanho)))
+            for i, tamanho in enumerate([0, 5, 999, 1000, 20_000, 9_000])]
+
+
+@pytest.fixture
+def sitios():
+    gerador = random.Random(16)
+    return ([Sitio(gerador.randrange(1, 21_000), "A", "G") for _ in range(200)]
+            + [Sitio(1, "c", "t"), Sitio(1000, "A", "G"), Sitio(20_000, "T", "C")])
+
+
+def test_igual_a_forca_bruta(colecao, sitios):
+    genotipos = varrer_mutacoes(colecao, sitios)
+    assert genotipos.ids == [o.id for o in colecao]
+    assert genotipos.estados.shape == (len(colecao), len(sitios))
+    for i, organismo in enumerate(colecao):
+        texto = str(organismo.sequencia)
+        for j, sitio in enumerate(sitios):
+            assert genotipos.estados[i, j] == _estado_forca_bruta(texto, sitio)
+            dentro = 1 <= sitio.posicao <= len(texto)
+            assert genotipos.base(i, j) == (texto[sitio.posicao - 1].upper() if dentro else "")
+
+
+@pytest.mark.parametrize("lacuna", [0, 1, 100, 1 << 20])
+def test_resultado_nao_depende_do_agrupamento(monkeypatch, colecao, sitios, lacuna):
+    esperado = varrer_mutacoes(colecao, sitios).estados
+    monkeypatch.setattr(mutacoes, "LACUNA_MAXIMA", lacuna)
+    assert np.array_equal(varrer_mutacoes(colecao, sitios).estados, esperado)
+
+
+def test_le_apenas_os_trechos_dos_sitios(colecao):
+    lidos = []
+
+    class SequenciaVigiada(Sequencia):
+        def __getitem__(self, index):
+            lidos.append(index)
+            return super().__getitem__(index)
+
+    organismo = OrganismoFasta("x", "", SequenciaVigiada(str(colecao[4].sequencia)))
+    varrer_mutacoes([organismo], [(10, "A", "G"), (12, "A", "G"), (15_000, "A", "G")])
+    assert lidos == [slice(9, 12), slice(14_999, 15_000)]
+
+
+def test_aceita_fasta_index(escrever_fasta_texto, colecao, sitios):
+    texto = "".join(f">{o.id} |nome\n" + "\n".join(str(o.sequencia)[i:i + 60]
+                                                   for i in range(0, len(o.sequencia), 60)) + "\n"
+                    for o in colecao)
+    caminho = escrever_fasta_texto(texto)
+    esperado = varrer_mutacoes(ler_fasta(caminho), sitios)
+    with FastaIndex(caminho) as indice:
+        genotipos = varrer_mutacoes(indice, sitios)
+    assert genotipos.ids == esperado.ids
+    assert np.array_equal(genotipos.estados, esperado.estados)
+    assert np.array_equal(genotipos.bases, esperado.bases)
+
+
+def test_colecao_ou_painel_vazios(colecao):
+    assert varrer_mutacoes([], [(1, "A", "G")]).estados.shape == (0, 1)
+    assert varrer_mutacoes(colecao, []).estados.shape == (len(colecao), 0)
+
+
+def test_contagens_e_frequencia():
+    organismos = [OrganismoFasta(str(i), "", base) for i, base in enumerate("AGGTN")]
+    genotipos = varrer_mutacoes(organismos + [OrganismoFasta("vazio", "", "")], [(1, "A", "G")])
+    assert genotipos.contagens().tolist() == [[1, 2, 1, 1, 1]]
+    assert genotipos.frequencia_da_mutacao().tolist() == [0.5]
+
+
+def test_arquivo_do_projeto(tmp_path):
+    with FastaIndex(ARQUIVO_FLAVIVIRIDAE, caminho_indice=str(tmp_path / "genomas.fai")) as indice:
+        genotipos = varrer_mutacoes(indice, [(1000, "A", "G")])
+    organismos = ler_fasta(ARQUIVO_FLAVIVIRIDAE)
+    assert len(genotipos.ids) == 159
+    for i, organismo in enumerate(organismos):
+        assert genotipos.estados[i, 0] == _estado_forca_bruta(str(organismo.sequencia), Sitio(1000, "A", "G"))
+
+
+@pytest.mark.parametrize("sitio", [(0, "A", "G"), (-5, "A", "G"), (1.5, "A", "G"), (True, "A", "G"),
+                                   (10, "AC", "G"), (10, "A", ""), (10, "N", "G"), (10, "A", None)])
+def test_sitios_invalidos(colecao, sitio):
+    with pytest.raises(ValueError):
+        varrer_mutacoes(colecao, [sitio])
+
+
+def test_posicao_numpy():
+    assert Sitio(np.int64(3), "a", "g").posicao == 3
@@ -0,0 +1,65 @@
+import random
+
+import pytest
+
+from bio.orfs import encontrar_orfs, encontrar_orfs_colecao
+from bio.organismo_fasta import OrganismoFasta
+from bio.sequencia import Sequencia
+
+
+def _orfs_forca_bruta(texto, tamanho_minimo):
+    """Percorre cada fase códon a códon, como descrito em encontrar_orfs."""
+    n = len(texto)
+    fitas = ((1, texto), (-1, str(Sequencia(texto).complementar_reversa())))
+    orfs = []
+    for fita, seq in fitas:
+        for quadro in range(3):
+            proteina = Sequencia(seq[quadro:]).traduzir()
+            comeco = None
+            for i, aminoacido in enumerate(proteina):
+                if aminoacido == "M" and comeco is None:
+                    comeco = i
+                elif aminoacido == "*":
+                    if comeco is not None and i - comeco >= tamanho_minimo:
+                        inicio, fim = quadro + 3 * comeco, quadro + 3 * i + 3
+                        if fita == -1:
+                            inicio, fim = n - fim, n - inicio
+                        orfs.append((inicio, fim, fita, quadro, proteina[comeco:i]))
+                    comeco = None
+    return sorted(orfs, key=lambda orf: (orf[0], orf[2]))
+
+
+def _tuplas(orfs):
+    return [(o.inicio, o.fim, o.fita, o.quadro, o.proteina) for o in orfs]
+
+
+def test_exemplo_da_documentacao():
+    (orf,) = Sequencia("CCATGAAATTTTAGCC").encontrar_orfs(tamanho_minimo=2)
+    assert (orf.inicio, orf.fim, orf.fita, orf.quadro, orf.proteina) == (2, 14, 1, 2, "MKF")
+    assert len(orf) == 12
+
+
+@pytest.mark.parametrize("tamanho_minimo", [0, 1, 5, 30])
+@pytest.mark.parametrize("semente", range(5))
+def test_igual_a_forca_bruta(semente, tamanho_minimo):
+    texto = "".join(random.Random(semente).choices("ACGTACGTN", k=1500))
+    esperado = _orfs_forca_bruta(texto, tamanho_minimo)
+    assert sorted(_tuplas(encontrar_orfs(texto, tamanho_minimo))) == sorted(esperado)
+
+
+def test_fita_reversa():
+    direta = "ATG" + "GCT" * 5 + "TAA"
+    (orf,) = encontrar_orfs(str(Sequencia("CC" + direta).complementar_reversa()), 5)
+    assert (orf.inicio, orf.fim, orf.fita, orf.proteina) == (0, len(direta), -1, "MAAAAA")
+
+
+@pytest.mark.parametrize("texto", ["", "AT", "ATGAAAAAA", "TAATAGTGA"])
+def test_sem_orfs(texto):
+    assert encontrar_orfs(texto, 0) == []
+
+
+def test_colecao():
+    organismos = [OrganismoFasta("a", "", "ATGTAA"), OrganismoFasta("b", "", "CCC")]
+    resultado = encontrar_orfs_colecao(organismos, tamanho_minimo=1)
+    assert _tuplas(resultado["a"]) == [(0, 6, 1, 0, "M")]
+    assert resultado["b"] == []
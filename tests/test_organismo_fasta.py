@@ -0,0 +1,49 @@
+import pickle
+
+import pytest
+
+from bio.organismo_fasta import OrganismoFasta, separar_cabecalho
+from bio.sequencia import Sequencia
+
+
+@pytest.mark.parametrize("cabecalho, esperado", [
+    (">NC_001477.1 |Dengue virus 1", ("NC_001477.1", "Dengue virus 1")),
+    (">NC_1 |nome | com barras\n", ("NC_1", "nome | com barras")),
+    (">NC_1|nome", ("NC_1", "nome")),
+    (">sp|P0DTC2|SPIKE_SARS2 Spike glycoprotein", ("sp|P0DTC2|SPIKE_SARS2", "Spike glycoprotein")),
+    (">read_42", ("read_42", "")),
+    (">", ("", "")),
+    (b">NC_1 |V\xc3\xadrus\r\n", ("NC_1", "Vírus")),
+    (b">NC_1 |V\xedrus", ("NC_1", "V�rus")),
+])
+def test_separar_cabecalho(cabecalho, esperado):
+    assert separar_cabecalho(cabecalho) == esperado
+
+
+def test_de_cabecalho_separa_so_no_acesso():
+    organismo = OrganismoFasta.de_cabecalho(">NC_1 |Vírus\n".encode(), "acgt")
+    assert isinstance(organismo._cabecalho, bytes)
+    assert organismo._id is None and organismo._nome is None
+    assert (organismo.id, organismo.nome) == ("NC_1", "Vírus")
+    assert str(organismo.sequencia) == "ACGT"
+
+
+def test_atribuir_id_mantem_o_nome_do_cabecalho():
+    organismo = OrganismoFasta.de_cabecalho(">NC_1 |um", "ACGT")
+    organismo.id = "outro"
+    assert (organismo.id, organismo.nome) == ("outro", "um")
+    assert organismo.cabecalho == "NC_1 |um"
+
+
+def test_construtor_e_sem_dict():
+    organismo = OrganismoFasta("NC_1", "um", Sequencia("ACGT"))
+    assert organismo.cabecalho == "NC_1 |um"
+    assert not hasattr(organismo, "__dict__")
+    with pytest.raises(AttributeError):
+        organismo.outro = 1
+    assert "OrganismoFasta(id='NC_1', nome='um'" in repr(organismo)
+
+
+def test_pickle_com_cabecalho_em_bytes():
+    copia = pickle.loads(pickle.dumps(OrganismoFasta.de_cabecalho(b">A |a\n", "ACGT")))
+    assert (copia.id, copia.nome, str(copia.sequencia)) == ("A", "a", "ACGT")
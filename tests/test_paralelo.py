@@ -0,0 +1,67 @@
+import gzip
+
+import pytest
+
+from bio.ler_fasta import iter_fasta, ler_fasta
+from bio.paralelo import executar_em_fragmentos, executar_em_lote, fragmentar_fasta, iterar_em_lote
+from conftest import ARQUIVO_FLAVIVIRIDAE
+
+
+def resumir(organismo):
+    return organismo.id, len(organismo.sequencia), organismo.sequencia.conteudo_gc()
+
+
+def test_lote_mantem_a_ordem():
+    esperado = [resumir(o) for o in ler_fasta(ARQUIVO_FLAVIVIRIDAE)]
+    assert executar_em_lote(resumir, iter_fasta(ARQUIVO_FLAVIVIRIDAE),
+                            trabalhadores=2, tamanho_lote=5) == esperado
+
+
+def test_lote_vazio():
+    assert list(iterar_em_lote(resumir, [], trabalhadores=1)) == []
+
+
+def test_lote_consome_o_gerador_aos_poucos():
+    consumidos = []
+
+    def organismos():
+        for organismo in iter_fasta(ARQUIVO_FLAVIVIRIDAE):
+            consumidos.append(organismo.id)
+            yield organismo
+
+    resultados = iterar_em_lote(resumir, organismos(), trabalhadores=1, tamanho_lote=2)
+    next(resultados)
+    assert len(consumidos) <= 2 * 2 + 2
+    resultados.close()
+
+
+@pytest.mark.parametrize("partes", [1, 2, 7, 1000])
+def test_faixas_comecam_em_cabecalhos(partes):
+    faixas = fragmentar_fasta(ARQUIVO_FLAVIVIRIDAE, partes)
+    assert 1 <= len(faixas) <= partes
+    assert faixas[0][0] == 0
+    assert all(fim == proximo for (_, fim), (proximo, _) in zip(faixas, faixas[1:]))
+    with open(ARQUIVO_FLAVIVIRIDAE, "rb") as arquivo:
+        dados = arquivo.read()
+    assert faixas[-1][1] == len(dados)
+    assert all(dados[inicio:inicio + 1] == b">" for inicio, _ in faixas)
+
+
+def test_fragmentos_iguais_a_leitura_sequencial():
+    esperado = [resumir(o) for o in ler_fasta(ARQUIVO_FLAVIVIRIDAE)]
+    assert executar_em_fragmentos(resumir, ARQUIVO_FLAVIVIRIDAE,
+                                  trabalhadores=2, fragmentos=9) == esperado
+
+
+def test_fragmentos_com_registros_pequenos(escrever_fasta_texto):
+    caminho = escrever_fasta_texto("".join(f">r{i} |n\n{'ACGT' * i}\n" for i in range(50)))
+    esperado = [resumir(o) for o in ler_fasta(caminho)]
+    assert executar_em_fragmentos(resumir, caminho, trabalhadores=1, fragmentos=13) == esperado
+
+
+def test_arquivo_comprimido_nao_e_fragmentado(tmp_path):
+    caminho = tmp_path / "entrada.fasta.gz"
+    with gzip.open(caminho, "wt") as arquivo:
+        arquivo.write(">a |n\nACGT\n")
+    with pytest.raises(ValueError):
+        fragmentar_fasta(caminho, 2)
@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from bio import sequencia_compactada, traducao
+from bio.sequencia import Sequencia
+from bio.sequencia_compactada import SequenciaCompactada
+
+
+def _aleatoria(tamanho, semente, alfabeto="ACGTACGTACGTN"):
+    return "".join(random.Random(semente).choices(alfabeto, k=tamanho))
+
+
+@pytest.mark.parametrize("texto", ["", "A", "ACGT", "ATGNNC", "nnnn", "RYACGTK", _aleatoria(1001, 1)])
+def test_ida_e_volta(texto):
+    compactada = SequenciaCompactada(texto)
+    assert len(compactada) == len(texto)
+    assert compactada.sequencia == texto.upper()
+    assert compactada.descompactar() == Sequencia(texto.upper())
+    assert len(compactada.dados) == (len(texto) + 3) // 4
+
+
+def test_excecoes_em_trechos():
+    assert SequenciaCompactada("ATGNNCRA").excecoes == [(3, 5, "N"), (6, 7, "R")]
+
+
+def test_indexacao_e_fatias():
+    texto = _aleatoria(203, 2)
+    compactada = SequenciaCompactada(texto)
+    assert [compactada[i] for i in (0, 3, 4, 101, -1)] == [texto[i] for i in (0, 3, 4, 101, -1)]
+    assert compactada[5:150] == texto[5:150]
+    assert compactada[::5] == texto[::5]
+    assert "".join(compactada) == texto
+    with pytest.raises(IndexError):
+        compactada[203]
+
+
+@pytest.mark.parametrize("tamanho", [0, 1, 5, 8, 97])
+def test_complementos_nos_bytes(tamanho):
+    texto = _aleatoria(tamanho, tamanho)
+    compactada = SequenciaCompactada(texto)
+    assert compactada.complementar() == Sequencia(texto).complementar()
+    assert compactada.complementar_reversa() == Sequencia(texto).complementar_reversa()
+
+
+def test_composicao_nos_bytes():
+    texto = _aleatoria(1003, 3, "ACGTNNR")
+    compactada = SequenciaCompactada(texto)
+    assert compactada.calcular_percentual("GC") == Sequencia(texto).calcular_percentual("GC")
+    assert compactada.conteudo_gc() == Sequencia(texto).conteudo_gc()
+
+
+@pytest.mark.parametrize("parar", [False, True])
+@pytest.mark.parametrize("tamanho", [0, 2, 3, 7, 300, 1001])
+def test_traduzir_igual_a_sequencia(tamanho, parar):
+    texto = _aleatoria(tamanho, tamanho + 7, "ACGTACGTNNR")
+    assert SequenciaCompactada(texto).traduzir(parar) == Sequencia(texto).traduzir(parar)
+
+
+@pytest.mark.parametrize("parar", [False, True])
+def test_traduzir_atravessa_blocos(monkeypatch, parar):
+    monkeypatch.setattr(sequencia_compactada, "_BASES_POR_BLOCO", 24)
+    texto = "ATG" + _aleatoria(400, 4, "ACGTN") + "NNNNNNNNNN" + _aleatoria(50, 5)
+    assert SequenciaCompactada(texto).traduzir(parar) == Sequencia(texto).traduzir(parar)
+
+
+def test_traduzir_sem_numpy(monkeypatch):
+    texto = _aleatoria(500, 6)
+    esperado = Sequencia(texto).traduzir()
+    monkeypatch.setattr(traducao, "np", None)
+    assert SequenciaCompactada(texto).traduzir() == esperado
+
+
+def test_traduzir_nao_decodifica_texto(monkeypatch):
+    def falhar(*args):
+        raise AssertionError("traduzir() não deve descompactar para texto")
+
+    compactada = SequenciaCompactada(_aleatoria(300, 7))
+    esperado = Sequencia(compactada.sequencia).traduzir()
+    monkeypatch.setattr(SequenciaCompactada, "_decodificar", falhar)
+    assert compactada.traduzir() == esperado
@@ -0,0 +1,68 @@
+import pickle
+
+import pytest
+
+from bio.indice_fasta import FastaIndex
+from bio.sequencia import Sequencia
+from bio.sequencia_mapeada import SequenciaMapeada
+
+BASES = "ACGTTGCAAC" * 13 + "GAT"
+
+
+@pytest.fixture
+def mapeada(escrever_fasta_texto):
+    linhas = [BASES[i:i + 20].lower() if i == 40 else BASES[i:i + 20]
+              for i in range(0, len(BASES), 20)]
+    caminho = escrever_fasta_texto(">A |a\n" + "\n".join(linhas) + "\n")
+    indice = FastaIndex(caminho)
+    yield indice.mapear("A")
+    indice.fechar()
+
+
+def test_leitura_atravessa_quebras_de_linha(mapeada):
+    assert len(mapeada) == len(BASES)
+    assert mapeada.sequencia == BASES
+    assert "".join(mapeada) == BASES
+    assert [mapeada[i] for i in (0, 19, 20, 45, -1)] == [BASES[i] for i in (0, 19, 20, 45, -1)]
+    with pytest.raises(IndexError):
+        mapeada[len(BASES)]
+
+
+@pytest.mark.parametrize("fatia", [slice(0, 0), slice(5, 45), slice(19, 21), slice(-7, None),
+                                   slice(30, 10), slice(None, None, 3)])
+def test_fatias(mapeada, fatia):
+    resultado = mapeada[fatia]
+    assert str(resultado) == BASES[fatia]
+    if fatia.step is None:
+        assert isinstance(resultado, SequenciaMapeada)
+        assert resultado.buffer is mapeada.buffer
+
+
+def test_fatia_de_fatia(mapeada):
+    assert str(mapeada[10:100][5:50][3:8]) == BASES[10:100][5:50][3:8]
+
+
+def test_metodos_de_sequencia(mapeada):
+    assert mapeada.complementar_reversa() == Sequencia(BASES).complementar_reversa()
+    assert mapeada.calcular_percentual("GC") == Sequencia(BASES).calcular_percentual("GC")
+
+
+def test_de_bytes_e_visao_de_memoria():
+    dados = bytearray(b"ATGCGT")
+    sequencia = SequenciaMapeada.de_bytes(dados)
+    assert str(sequencia[1:4]) == "TGC"
+    visao = sequencia[2:5].visao_de_memoria()
+    dados[2] = ord("A")
+    assert bytes(visao) == b"ACG"
+
+
+def test_visao_de_memoria_com_quebras(mapeada):
+    assert bytes(mapeada[0:20].visao_de_memoria()) == BASES[:20].encode()
+    with pytest.raises(ValueError):
+        mapeada[15:25].visao_de_memoria()
+
+
+def test_pickle_leva_a_sequencia_materializada(mapeada):
+    copia = pickle.loads(pickle.dumps(mapeada[3:33]))
+    assert type(copia) is Sequencia
+    assert str(copia) == BASES[3:33]
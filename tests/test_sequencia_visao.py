@@ -0,0 +1,77 @@
+import random
+from collections import Counter
+
+import pytest
+
+from bio.sequencia import Sequencia, SequenciaVisao
+
+TEXTO = "".join(random.Random(8).choices("ACGTN", k=257))
+_COMPLEMENTO = str.maketrans("ACGT", "TGCA")
+
+
+def _referencia(operacao, texto):
+    return {
+        "complementar": texto.translate(_COMPLEMENTO),
+        "complementar_reversa": texto.translate(_COMPLEMENTO)[::-1],
+        "transcrever": texto.replace("T", "U"),
+        "reverter": texto[::-1],
+    }[operacao]
+
+
+OPERACOES = ["complementar", "complementar_reversa", "transcrever", "reverter"]
+
+
+def test_exemplos_da_documentacao():
+    assert Sequencia("ATCG").complementar() == "TAGC"
+    assert Sequencia("ATCG").complementar_reversa() == "CGAT"
+    assert Sequencia("ATGCTT").transcrever() == "AUGCUU"
+    visao = Sequencia("AATTGGCC").complementar_reversa()[:4]
+    assert repr(visao) == 'SequenciaVisao("GGCC")'
+    assert visao[0] == "G"
+    assert type(visao.materializar()) is Sequencia
+
+
+@pytest.mark.parametrize("operacao", OPERACOES)
+def test_visao_e_preguicosa(operacao):
+    origem = Sequencia(TEXTO)
+    visao = getattr(origem, operacao)()
+    assert isinstance(visao, SequenciaVisao)
+    assert visao.origem is origem
+    assert "_sequencia" not in vars(visao)
+
+
+@pytest.mark.parametrize("operacao", OPERACOES)
+def test_igual_a_conversao_completa(operacao):
+    esperado = _referencia(operacao, TEXTO)
+    visao = getattr(Sequencia(TEXTO), operacao)()
+    assert str(visao) == esperado
+    assert len(visao) == len(esperado)
+    assert "".join(visao) == esperado
+    assert [visao[i] for i in (0, 100, -1)] == [esperado[i] for i in (0, 100, -1)]
+    for fatia in (slice(3, 40), slice(-20, None), slice(50, 10), slice(None, None, 4)):
+        assert str(visao[fatia]) == esperado[fatia]
+    with pytest.raises(IndexError):
+        visao[len(esperado)]
+
+
+def test_composicao_de_operacoes():
+    origem = Sequencia(TEXTO)
+    visao = origem.transcrever().complementar_reversa()[10:200].reverter()[5:50]
+    passo_a_passo = Sequencia(str(Sequencia(TEXTO).transcrever())).complementar_reversa()
+    esperado = str(passo_a_passo)[10:200][::-1][5:50]
+    assert str(visao) == esperado
+    assert visao.origem is origem
+    assert origem.complementar_reversa().complementar_reversa() == TEXTO
+
+
+@pytest.mark.parametrize("operacao", OPERACOES)
+def test_composicao_de_bases_reaproveita_a_origem(operacao):
+    origem = Sequencia(TEXTO)
+    visao = getattr(origem, operacao)()
+    assert visao.composicao() == dict(Counter(str(visao)))
+    assert visao[1:5].composicao() == dict(Counter(str(visao)[1:5]))
+
+
+def test_traduzir_da_visao():
+    visao = Sequencia(TEXTO).complementar_reversa()
+    assert visao.traduzir() == Sequencia(_referencia("complementar_reversa", TEXTO)).traduzir()
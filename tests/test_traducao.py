@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from bio import traducao
+from bio.constantes import DNA_PARA_AMINOACIDO, DNA_STOP_CODONS
+from bio.sequencia import Sequencia
+from bio.traducao import CODIGO_INDEFINIDO, CODONS, codificar, indices_em_todas_as_posicoes
+
+
+def _aleatoria(tamanho, semente):
+    return "".join(random.Random(semente).choices("ACGTACGTACGTNR", k=tamanho))
+
+
+def test_exemplos_da_documentacao():
+    assert Sequencia("ATGGCTTGA").traduzir() == "MA*"
+    assert Sequencia("ATGGCTTGA").traduzir(parar=True) == "MA"
+
+
+def test_tabela_de_codons():
+    assert len(traducao.CODONS) == 64
+    for codon, aminoacido in zip(traducao.CODONS, traducao.AMINOACIDO_DO_CODON):
+        esperado = "*" if codon in DNA_STOP_CODONS else DNA_PARA_AMINOACIDO[codon]
+        assert aminoacido == esperado
+    assert traducao.AMINOACIDO_DO_CODON[traducao.CODIGO_INDEFINIDO] == "X"
+
+
+def test_codificar():
+    assert traducao.codificar("ACGTNa").tolist() == [0, 1, 2, 3, 64, 0]
+    assert traducao.codificar(b"GT").tolist() == [2, 3]
+    assert traducao.codificar("é").tolist() == [64]
+
+
+def test_indices_de_codons_por_quadro():
+    codigos = traducao.codificar("AAACCCTN")
+    assert traducao.indices_de_codons(codigos).tolist() == [0, 21]
+    assert traducao.indices_de_codons(codigos, 1).tolist() == [1, 23]
+    assert traducao.indices_de_codons(codigos, 2).tolist() == [5, 64]
+
+
+@pytest.mark.parametrize("parar", [False, True])
+@pytest.mark.parametrize("tamanho", [0, 1, 2, 3, 4, 100, 1000])
+def test_vetorizada_igual_ao_laco_em_python(tamanho, parar):
+    texto = _aleatoria(tamanho, tamanho)
+    assert traducao.traduzir(texto, parar) == traducao._traduzir_python(texto, parar)
+
+
+def test_sem_numpy_usa_o_laco(monkeypatch):
+    texto = _aleatoria(300, 1)
+    esperado = Sequencia(texto).traduzir()
+    monkeypatch.setattr(traducao, "np", None)
+    assert Sequencia(texto).traduzir() == esperado
+
+
+@pytest.mark.parametrize("texto", ["", "AT", "ATGA", "ATGNNCGTAAC"])
+def test_indices_em_todas_as_posicoes(texto):
+    esperado = [CODONS.index(texto[i:i + 3]) if set(texto[i:i + 3]) <= set("ACGT") else CODIGO_INDEFINIDO
+                for i in range(len(texto) - 2)]
+    assert indices_em_todas_as_posicoes(codificar(texto)).tolist() == esperado